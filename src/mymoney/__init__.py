@@ -1,9 +1,20 @@
+import logging
+
 from mymoney.core import (
     DataReader,
     MyData,
 )
 
 
+# The logging is configured once for the whole package
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
+    datefmt="%b/%d/%y %I:%M:%S %p",
+    # filename="logs.log",
+)
+
+
 __all__ = [
     "DataReader",
     "MyData",
@@ -1,4 +1,3 @@
-import logging
 import copy
 from typing import List
 
@@ -8,13 +7,6 @@ import pandas as pd
 from mymoney.utils.common import column_name_checker
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
-
-
 class ExpenseAnalysis:
     """Main class for Expense analysis."""
 
@@ -30,6 +22,8 @@ class ExpenseAnalysis:
         "W": "W", "w": "W", "weekly": "W",
         "Q": "Q", "q": "Q", "quarterly": "Q",
     }
+    # The columns that identify an account
+    _account_columns = ["Institution", "AccountName", "Service"]
 
     def __init__(self, df: pd.DataFrame) -> None:
         if df.empty:
@@ -88,20 +82,14 @@ class ExpenseAnalysis:
             "account": "AccountName",
             "acc": "AccountName",
         }
-        last_date_cols = ["Institution", "AccountName", "Service", "LastDate"]
-        last_date_df = pd.DataFrame(columns=last_date_cols)
-
-        grouped_by_list = ["Institution", "AccountName", "Service"]
-        grouped = self._whole_df.groupby(by=grouped_by_list)
-        for name, grp in grouped:
-            last_date = grp["Date"].max().date()
-            tmp_df = pd.DataFrame({
-                "Institution": [name[0]],
-                "AccountName": [name[1]],
-                "Service": [name[2]],
-                "LastDate": [last_date],
-            })
-            last_date_df = pd.concat([last_date_df, tmp_df], ignore_index=True)
+        last_date = self._whole_df.groupby(
+            by=self._account_columns, observed=True)["Date"].max()
+
+        # The accounts are plain values and the dates are
+        # datetime.date objects, same as the values of the groups
+        last_date_df = last_date.dt.date.rename("LastDate").reset_index()
+        last_date_df = last_date_df.astype(
+            {col: object for col in self._account_columns})
 
         return last_date_df.sort_values(
             by=sort_options_map[sort_by], ignore_index=True)
@@ -119,7 +107,8 @@ class ExpenseAnalysis:
         """
         if multi_index:
             grouped_by = ["Institution", "AccountName", "Service"]
-            return self._expense_df[grouped_by].groupby(grouped_by).count()
+            return self._expense_df[grouped_by].groupby(
+                grouped_by, observed=True).count()
         else:
             return self.get_last_date_df().drop(columns=["LastDate"])
 
@@ -135,16 +124,17 @@ class ExpenseAnalysis:
         """
         last_n_cols = [
             "Institution", "AccountName", "Date", "Amount", "Description"]
-        last_n_df = pd.DataFrame(columns=last_n_cols)
 
-        grouped_by_list = ["Institution", "AccountName", "Service"]
-        grouped = self._whole_df.groupby(by=grouped_by_list)
-        for _, grp in grouped:
-            tmp_df = grp.sort_values(by="Date", ignore_index=True)
-            tmp_df = tmp_df[last_n_cols].tail(n)
-            last_n_df = pd.concat([last_n_df, tmp_df], ignore_index=True)
+        # The accounts are in the order of the groups, and the transactions
+        # of each account are sorted by date
+        group_ids = self._whole_df.groupby(
+            by=self._account_columns, observed=True).ngroup()
+        last_n_df = self._whole_df[last_n_cols].assign(_group=group_ids)
+        last_n_df = last_n_df[group_ids >= 0].sort_values(
+            by=["_group", "Date"], kind="stable")
 
-        return last_n_df
+        last_n_df = last_n_df.groupby("_group", sort=False).tail(n)
+        return last_n_df.drop(columns="_group").reset_index(drop=True)
 
     # Spend related methods
     # In General returns a sum over the Amount for specific `freq`
@@ -171,18 +161,24 @@ class ExpenseAnalysis:
         """
         self._timeline_error_check(freq)
 
-        out_dict = {}
-        for col_value in self._expense_df[column].unique():
-            tmp_df = self._expense_df[self._expense_df[column] == col_value]
-            tmp_df = tmp_df[["Amount", "Date"]]
-            grouper = pd.Grouper(freq=self._timeline_map[freq], key="Date")
-            out_dict[col_value] = tmp_df.groupby(grouper).sum()
-
-        df = pd.DataFrame({
-            cat: ser["Amount"]
-            for cat, ser in out_dict.items()
-        })
-        return df.fillna(.0)
+        grouper = pd.Grouper(freq=self._timeline_map[freq], key="Date")
+        df = self._expense_df.groupby(
+            [grouper, column], observed=True)["Amount"].sum().unstack(column)
+        df = df.asfreq(self._timeline_map[freq])
+
+        # Each value covers the periods from its first to its last
+        # transaction, and only the periods covered by a value are kept
+        is_observed = df.notna()
+        in_range = is_observed.cummax() & is_observed[::-1].cummax()[::-1]
+        is_covered = in_range.any(axis=1)
+        if not is_covered.all():
+            df = df[is_covered]
+            df.index = pd.DatetimeIndex(df.index, freq=None)
+
+        # The columns are in the order of appearance of the values
+        df.columns = df.columns.astype(object)
+        df = df.reindex(columns=list(self._expense_df[column].unique()))
+        return df.rename_axis(columns=None).fillna(.0)
 
     def category_spend(self, freq: str = "M") -> pd.DataFrame:
         """Create an aggregated data for expense categories.
@@ -258,7 +254,8 @@ class ExpenseAnalysis:
         group_by_cols = copy.deepcopy(columns)
         group_by_cols.remove("Amount")
 
-        df = self._expense_df[columns].groupby(by=group_by_cols).sum()
+        df = self._expense_df[columns].groupby(
+            by=group_by_cols, observed=True).sum()
         return df.sort_values(sort_by, ascending=False)
 
     def category_overall_spend(self) -> pd.DataFrame:
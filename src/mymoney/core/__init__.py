@@ -1,9 +1,13 @@
 from mymoney.core.data_reader import DataReader
 from mymoney.core.data_classes import InstData
+from mymoney.core.manifest import IngestManifest
 from mymoney.core.my_data import MyData
+from mymoney.core.parse_cache import ParseCache
 
 __all__ = [
     "DataReader",
+    "IngestManifest",
     "InstData",
     "MyData",
+    "ParseCache",
 ]
@@ -1,34 +1,13 @@
-import logging
 import dataclasses
 from typing import Any
 
 import pandas as pd
 
-from mymoney.institutions import amex
-from mymoney.institutions import capitalone
-from mymoney.institutions import cashapp
-from mymoney.institutions import chase
-from mymoney.institutions import citi
-from mymoney.institutions import coinbase
-from mymoney.institutions import cryptodotcom
-from mymoney.institutions import discover
-from mymoney.institutions import paypal
-from mymoney.institutions import samsclub
-from mymoney.institutions import sofi
-from mymoney.institutions import uphold
-from mymoney.institutions import venmo
-from mymoney.institutions import wellsfargo
-
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-    # filename="logs.log",
-)
-
-
-@dataclasses.dataclass
+from mymoney.institutions import institution_base
+from mymoney.institutions.registry import get_institution_registry
+
+
+@dataclasses.dataclass(repr=False)
 class InstData:
     """Main class for storing and transforming Institution data."""
     # input data
@@ -39,11 +18,18 @@ class InstData:
     account_name: str
     table: pd.DataFrame | Any
 
-    # output data
-    sanity_df: pd.DataFrame = None
-    output_df: pd.DataFrame = None
+    # output data, created on first access if the object is lazy
+    sanity_df: pd.DataFrame
+    output_df: pd.DataFrame
     out_type: str = None
 
+    # Low-cardinality columns of `output_df` stored as categoricals
+    _categorical_columns = (
+        "Institution", "AccountName", "Service", "IsTransfer",
+        "MyCategory", "InstitutionCategory",
+        "FromAsset", "ToAsset", "TrxType", "TrxSubType", "AssetType",
+    )
+
     def __init__(
         self,
         source: str | Any,
@@ -52,15 +38,113 @@ class InstData:
         service_name: str,
         account_name: str,
         table: pd.DataFrame | Any,
+        lazy: bool = False,
+        release: bool = False,
     ) -> None:
+        """Constructor of InstData class.
+
+        Args:
+            source (str | Any):
+                The source of the data.
+            data_type (Any):
+                The type of the source data.
+            institution_name (str):
+                The name of the institution.
+            service_name (str):
+                The name of the service.
+            account_name (str):
+                The name of the account.
+            table (pd.DataFrame | Any):
+                The input table.
+            lazy (bool):
+                Whether to create `sanity_df` and `output_df` on their first
+                access instead of right away. Default is False.
+            release (bool):
+                Whether to drop `table` and `sanity_df` once `output_df` is
+                created, to free their memory. Default is False.
+        """
         self.source = source
         self.data_type = data_type
         self.institution_name = institution_name
         self.service_name = service_name
         self.account_name = account_name
         self.table = table
+        self._release = release
 
-        self.create_output_data()
+        if lazy:
+            self._set_out_type()
+        else:
+            self.create_output_data()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for the attributes that are not set yet, i.e. the
+        # outputs of a lazy InstData before their first access
+        if name in ("sanity_df", "output_df") and "table" in self.__dict__:
+            self.create_output_data()
+            return self.__dict__[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def release_inputs(self):
+        """Drop `table` and `sanity_df` to free their memory. The `output_df`
+        is created first if it's not created yet."""
+        if not self.is_output_created:
+            self.create_output_data()
+        self.table = None
+        self.sanity_df = None
+
+    @property
+    def is_output_created(self) -> bool:
+        """Whether `output_df` is created. It's False for a lazy InstData
+        until `sanity_df` or `output_df` is accessed."""
+        return "output_df" in self.__dict__
+
+    @classmethod
+    def from_output_df(
+        cls,
+        source: str | Any,
+        data_type: Any,
+        institution_name: str,
+        service_name: str,
+        account_name: str,
+        output_df: pd.DataFrame,
+        out_type: str,
+    ) -> "InstData":
+        """Create an InstData from an already created `output_df` without
+        running the cleaning process again. The `table` and `sanity_df`
+        of this object are None.
+
+        Args:
+            source (str | Any):
+                The source of the data.
+            data_type (Any):
+                The type of the source data.
+            institution_name (str):
+                The name of the institution.
+            service_name (str):
+                The name of the service.
+            account_name (str):
+                The name of the account.
+            output_df (pd.DataFrame):
+                The output DataFrame.
+            out_type (str):
+                The type of the output DataFrame.
+
+        Returns:
+            An InstData object.
+        """
+        inst_data = cls.__new__(cls)
+        inst_data.source = source
+        inst_data.data_type = data_type
+        inst_data.institution_name = institution_name
+        inst_data.service_name = service_name
+        inst_data.account_name = account_name
+        inst_data.table = None
+        inst_data._release = False
+        inst_data.sanity_df = None
+        inst_data.output_df = cls._to_categorical(output_df)
+        inst_data.out_type = out_type
+        return inst_data
 
     def __str__(self):
         """String representation of the InstData object."""
@@ -72,12 +156,29 @@ class InstData:
             f"\nservice_name: {self.service_name}"
             f"\naccount_name: {self.account_name}"
             f"\nout_type: {self.out_type}"
+        )
+        # Don't create the outputs of a lazy InstData just to show them
+        if not self.is_output_created:
+            return out_str + "\nis_output_created: False"
+
+        out_str += (
             f"\nhas_sanity_df: {has_df(self.sanity_df)}"
             f"\nhas_output_df: {has_df(self.output_df)}"
             f"\noutput_filename: {self._generate_file_name()}"
         )
         return out_str
 
+    def __repr__(self):
+        # Same as the repr of the dataclass, without creating the outputs
+        # of a lazy InstData
+        fields = ", ".join(
+            f"{field.name}={getattr(self, field.name)!r}"
+            for field in dataclasses.fields(self)
+            if self.is_output_created
+            or field.name not in ("sanity_df", "output_df")
+        )
+        return f"{type(self).__name__}({fields})"
+
     def show_info(self):
         """Show the information of the InstData object."""
         print(self)
@@ -92,30 +193,28 @@ class InstData:
             f" {self.account_name} ({last_date})"
         )
 
+    @staticmethod
+    def _get_institution_class(
+        institution_name: str
+    ) -> institution_base.Institution:
+        """Returns the Institution class corresponding to `institution_name`
+        from the institution registry. The module of the institution is
+        imported on its first use.
+
+        Args:
+            institution_name (str):
+                The name of the institution.
+
+        Raises:
+            ValueError: If the institution is not supported.
+        """
+        return get_institution_registry().get(institution_name)
+
     def _institution_executer(self) -> pd.DataFrame:
         """Returns the `sanity_df` DataFrame. Basically this method creates
         an object corresponding to the `institution_name` and
         call `service_executer` method to do the operations."""
-        match self.institution_name:
-            case "amex": inst_obj = amex.AmEx()
-            case "capitalone": inst_obj = capitalone.CapitalOne()
-            case "cashapp": inst_obj = cashapp.CashApp()
-            case "chase": inst_obj = chase.Chase()
-            case "citi": inst_obj = citi.Citi()
-            case "coinbase": inst_obj = coinbase.Coinbase()
-            case "cryptodotcom": inst_obj = cryptodotcom.CryptoDotCom()
-            case "discover": inst_obj = discover.Discover()
-            case "paypal": inst_obj = paypal.PayPal()
-            case "samsclub": inst_obj = samsclub.SamsClub()
-            case "sofi": inst_obj = sofi.SoFi()
-            case "uphold": inst_obj = uphold.Uphold()
-            case "venmo": inst_obj = venmo.Venmo()
-            case "wellsfargo": inst_obj = wellsfargo.WellsFargo()
-            case _:
-                raise ValueError(
-                    f"Institution `{self.institution_name}` is not supported."
-                    "\nYou can file an issue and provide more information"
-                    " to add the institution.")
+        inst_obj = self._get_institution_class(self.institution_name)()
 
         return inst_obj.service_executer(
             service_name=self.service_name, data_type=self.data_type,
@@ -131,26 +230,49 @@ class InstData:
         Returns:
             A DataFrame with the `output_df` schema.
         """
-        if "_new_Date" in sanity_df.columns:
-            sanity_df["_new_Date"] = pd.to_datetime(
-                sanity_df["_new_Date"], format="%Y-%m-%d", utc=True)
-
-        new_columns_name_map = {
-            col: col[5:]
+        # The output columns are the same arrays as the `_new_` columns,
+        # so they're not copied and not consolidated into new blocks.
+        output = {
+            col[5:]: sanity_df[col]
             for col in sanity_df.columns
             if col.startswith("_new_")
         }
-        old_columns = [
-            col
-            for col in sanity_df.columns
-            if not col.startswith("_new_")
-        ]
+        if "Date" in output:
+            dates = output["Date"]
+            if isinstance(dates.dtype, pd.DatetimeTZDtype):
+                # Already parsed with the `timezone` of meta_data
+                output["Date"] = dates.dt.tz_convert("UTC")
+            else:
+                output["Date"] = pd.to_datetime(
+                    dates, format="%Y-%m-%d", utc=True)
+
+        return self._to_categorical(pd.DataFrame(output, copy=False))
 
-        return sanity_df.drop(columns=old_columns).rename(
-            columns=new_columns_name_map)
+    @classmethod
+    def _to_categorical(cls, output_df: pd.DataFrame) -> pd.DataFrame:
+        """Convert the `_categorical_columns` of `output_df` to categoricals.
+
+        Args:
+            output_df (pd.DataFrame):
+                The output DataFrame.
+
+        Returns:
+            The same DataFrame with the categorical columns.
+        """
+        for col in cls._categorical_columns:
+            if col in output_df.columns and not isinstance(
+                output_df[col].dtype, pd.CategoricalDtype
+            ):
+                output_df[col] = output_df[col].astype("category")
+        return output_df
 
     def _set_out_type(self):
         """Set the `out_type` based on `service_name`."""
+        # The service of `base` is the type of its table
+        if self.institution_name == "base":
+            self.out_type = self.service_name
+            return
+
         match self.service_name:
             case "debit": out_type = "expense"
             case "credit": out_type = "expense"
@@ -167,10 +289,14 @@ class InstData:
         """Create the output data."""
         # Skip generating output data for `base`
         if self.institution_name == "base":
+            self.sanity_df = None
             self.output_df = self.table
-            self.out_type = self.service_name
+            self._set_out_type()
             return
 
         self.sanity_df = self._institution_executer()
         self.output_df = self._output_df_creator(self.sanity_df)
         self._set_out_type()
+
+        if self._release:
+            self.release_inputs()
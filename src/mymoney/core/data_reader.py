@@ -1,40 +1,119 @@
+import io
 import os
-import json
 import logging
 import warnings
-from typing import List, Dict, Any
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import List, Any, Tuple, Iterator, Iterable
 
 import pandas as pd
-from importlib_resources import files
 
 from mymoney.core.data_classes import InstData
+from mymoney.core.manifest import IngestManifest
+from mymoney.core.parse_cache import ParseCache
 from mymoney.institutions.institution_base import DataType
-from mymoney.utils.common import column_name_checker
-
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-    # filename="logs.log",
+from mymoney.institutions.registry import (
+    get_institution_registry,
+    registered_institutions,
+    restore_institutions,
 )
+from mymoney.utils.common import column_name_checker
+from mymoney.utils.meta_data import ServiceMetaData, get_meta_data_registry
 
 
 class DataReader:
     """Main class for reading data."""
 
-    def __init__(self, warn: bool = False) -> None:
+    # WellsFargo CSV files with a payment are from the credit service
+    _wellsfargo_credit_pattern = r"PAYMENT\s?-? THANK"
+    # WellsFargo CSV files don't have a header, so they are detected
+    # from the values of their first lines
+    _wellsfargo_sample_lines = 20
+
+    def __init__(
+        self,
+        warn: bool = False,
+        cache: ParseCache | str = None,
+        lazy: bool = False,
+        release: bool = False,
+    ) -> None:
         """Constructor of DataReader class.
         Args:
             warn (bool):
                 To show the warnings or not. Default is False.
+            cache (ParseCache | str):
+                A ParseCache or a directory to create one in, to reuse
+                the outputs of the files that are already read.
+                Default is None which means no caching.
+            lazy (bool):
+                Whether to create lazy InstData objects, whose outputs are
+                only cleaned and validated on their first access. The lazy
+                outputs are not stored in the cache. Default is False.
+            release (bool):
+                Whether the InstData objects drop their `table` and
+                `sanity_df` once their `output_df` is created.
+                Default is False.
         """
-        self._meta_data = json.loads(
-            files("mymoney").joinpath("meta_data.json").read_text()
-        )
+        if isinstance(cache, str):
+            cache = ParseCache(cache)
+        self._cache = cache
+        self._lazy = lazy
+        self._release = release
+        self._meta_data = get_meta_data_registry()
+        self._institutions = get_institution_registry()
+        self._wellsfargo_names = list(self._meta_data.service(
+            "wellsfargo", "credit").read_args["names"])
+        self.failed_files = {}
         if warn is False:
             warnings.filterwarnings("ignore")
 
+    def _sniff_candidates(self, path: str) -> List[Tuple[str, str]]:
+        """Find the registered institutions and services whose columns match
+        the header of the CSV file in `path`. Only the first few lines of the
+        file are read, and each header signature in the column index of
+        `meta_data` is parsed once.
+
+        Args:
+            path (str):
+                The path to the csv file.
+
+        Returns:
+            A list of (institution, service) tuples in the same order
+            they appear in `meta_data`.
+        """
+        column_index = self._meta_data.column_index
+        n_lines = 1 + max(
+            dict(signature).get("header", 0) or 0
+            for signature in column_index
+        )
+        with open(path, "rb") as f:
+            sample = b"".join(itertools.islice(f, n_lines))
+
+        candidates = []
+        for signature, services in column_index.items():
+            header_args = {
+                arg: list(val) if isinstance(val, tuple) else val
+                for arg, val in signature
+            }
+            try:
+                header_cols = set(pd.read_csv(
+                    io.BytesIO(sample), nrows=0, **header_args).columns)
+            except Exception:
+                continue
+
+            candidates.extend(
+                (priority, service_md.institution, service_md.service)
+                for priority, service_md in services
+                if header_cols.issubset(service_md.column_set)
+                and service_md.institution in self._institutions
+            )
+
+        return [
+            (institution, service)
+            for _, institution, service in sorted(candidates)
+        ]
+
     def _path_is_csv_like(self, path: str) -> bool:
         """Check whether the `path` is a path to csv file.
 
@@ -50,11 +129,135 @@ class DataReader:
             return True
         return False
 
+    def _read_service_csv(
+        self, path: str, service_md: ServiceMetaData, **kwargs
+    ) -> pd.DataFrame:
+        """Read the CSV file in `path` with the read arguments of
+        `service_md` and parse its date columns. If the values of the file
+        don't match the `dtype` of the read arguments, the dtypes are
+        inferred by pandas instead.
+
+        Args:
+            path (str):
+                The path to the csv file.
+            service_md (ServiceMetaData):
+                The meta data of the service to read the file for.
+            **kwargs:
+                Extra arguments for pd.read_csv.
+
+        Returns:
+            The DataFrame of the file.
+        """
+        try:
+            input_df = pd.read_csv(
+                filepath_or_buffer=path, **service_md.read_kwargs(), **kwargs)
+        except (ValueError, TypeError):
+            if "dtype" not in service_md.read_args:
+                raise
+            input_df = pd.read_csv(
+                filepath_or_buffer=path,
+                **service_md.read_kwargs(dtype=False), **kwargs)
+
+        return service_md.parse_dates(input_df)
+
+    def _open_service_csv_chunks(
+        self, path: str, service_md: ServiceMetaData, chunksize: int
+    ) -> Tuple[pd.DataFrame, Any]:
+        """Same as `_read_service_csv` but opens the file to be read in
+        chunks of `chunksize` rows. The first chunk is read right away, so a
+        file that can't be read with `service_md` fails here. The date
+        columns of the other chunks should be parsed with
+        `service_md.parse_dates`.
+
+        Args:
+            path (str):
+                The path to the csv file.
+            service_md (ServiceMetaData):
+                The meta data of the service to read the file for.
+            chunksize (int):
+                The number of rows in each chunk.
+
+        Returns:
+            A tuple of (the first chunk, the reader of the other chunks).
+        """
+        attempts = [service_md.read_kwargs()]
+        if "dtype" in service_md.read_args:
+            attempts.append(service_md.read_kwargs(dtype=False))
+
+        for i, read_args in enumerate(attempts, start=1):
+            chunks = None
+            try:
+                chunks = pd.read_csv(
+                    filepath_or_buffer=path, chunksize=chunksize, **read_args)
+                first_chunk = next(chunks)
+            except Exception as err:
+                if chunks is not None:
+                    chunks.close()
+                if i == len(attempts) or not isinstance(
+                    err, (ValueError, TypeError)
+                ):
+                    raise
+                continue
+
+            return service_md.parse_dates(first_chunk), chunks
+
+    def _is_wellsfargo_frame(self, input_df: pd.DataFrame) -> bool:
+        """Check whether the `input_df` read with the WellsFargo `names` is
+        a WellsFargo DataFrame.
+
+        Args:
+            input_df (pd.DataFrame):
+                The input DataFrame.
+
+        Returns:
+            True if `input_df` is from WellsFargo institution.
+        """
+        try:
+            check_wellsfargo = (
+                len(input_df.columns) == len(self._wellsfargo_names),
+                (input_df["x"] == "*").all(),
+                (input_df["y"].isna()).all(),
+            )
+        except KeyError:
+            return False
+
+        return all(check_wellsfargo)
+
+    def _sniff_wellsfargo(self, path: str) -> bool:
+        """Check whether the CSV file in `path` looks like a WellsFargo file
+        from its first `_wellsfargo_sample_lines` lines.
+
+        Args:
+            path (str):
+                The path to the csv file.
+
+        Returns:
+            True if the sample of the file is from WellsFargo institution.
+        """
+        if "wellsfargo" not in self._institutions:
+            return False
+
+        with open(path, "rb") as f:
+            sample = b"".join(
+                itertools.islice(f, self._wellsfargo_sample_lines))
+
+        try:
+            sample_df = pd.read_csv(io.BytesIO(sample), header=None)
+        except Exception:
+            return False
+        if len(sample_df.columns) != len(self._wellsfargo_names):
+            return False
+
+        sample_df.columns = self._wellsfargo_names
+        return self._is_wellsfargo_frame(sample_df)
+
     def _read_wellsfargo_csv(
-        self, path: str, account_name: str, read_args: Dict[str, Any]
+        self, path: str, account_name: str, service_md: ServiceMetaData
     ) -> InstData:
         """Read the CSV data from `path` and returns a InstData. This method
         is specialized for WellsFargo CSV files since they need special care.
+        The file is only parsed once, after a sample of it is checked, and
+        the service is found from the same DataFrame.
 
         Args:
             path (str):
@@ -62,47 +265,26 @@ class DataReader:
             account_name (str):
                 The name of the account to be used.
                 If it's None the name of the file will be used.
-            read_args (Dict[str, Any]):
-                Read arguments for pd.read_csv.
+            service_md (ServiceMetaData):
+                The meta data to read the file with.
 
         Returns:
             An InstData object.
         """
-        def is_wellsfargo(input_df: pd.DataFrame) -> bool:
-            """Check whether the `input_df` is a WellsFargo DataFrame.
-
-            Args:
-                input_df (pd.DataFrame):
-                    The input DataFrame.
-
-            Returns:
-                True if `input_df` is from WellsFargo institution.
-            """
-
-            try:
-                check_wellsfargo = (
-                    "Unnamed: 3" in input_df.columns,
-                    "*" in input_df.columns,
-                    (input_df["Unnamed: 3"].isna()).all(),
-                    (input_df["*"] == "*").all(),
-                )
-            except KeyError:
-                return False
-
-            if not all(check_wellsfargo):
-                return False
-
-            return True
-
-        if not is_wellsfargo(pd.read_csv(path)):
+        if not self._sniff_wellsfargo(path):
             return None
 
-        input_df = pd.read_csv(filepath_or_buffer=path, **read_args)
+        try:
+            input_df = self._read_service_csv(path, service_md)
+        except Exception:
+            return None
+        if not self._is_wellsfargo_frame(input_df):
+            return None
 
         # TODO: Bug prone - If regex pattern `r"PAYMENT\s?-? THANK"`
         # not present in the "Credit" CSV, this condition will fail
-        wf_service_cond = any(
-            input_df["Description"].str.contains(r"PAYMENT\s?-? THANK"))
+        wf_service_cond = input_df["Description"].str.contains(
+            self._wellsfargo_credit_pattern).any()
         wf_service = "credit" if wf_service_cond else "debit"
 
         inst = "wellsfargo"
@@ -115,12 +297,16 @@ class DataReader:
             service_name=wf_service,
             account_name=account_name,
             table=input_df,
+            lazy=self._lazy,
+            release=self._release,
         )
 
     def read_csv_file(
         self, path: str, account_name: str = None, logs: bool = False
     ) -> InstData:
-        """Read the data from `path` and returns a InstData.
+        """Read the data from `path` and returns a InstData. The institution
+        is detected from the header of the file, so the file is parsed
+        only once.
 
         Args:
             path (str):
@@ -137,82 +323,378 @@ class DataReader:
         if not self._path_is_csv_like(path):
             raise ValueError("`path` should point to a CSV file.")
 
-        for institution in self._meta_data:
-            for service in self._meta_data[institution]:
-                name = f"{institution}/{service}"
-                cols = self._meta_data[institution][service]["columns"]
-                read_args = self._meta_data[institution][service]["read_args"]
-                if account_name is None:
-                    account_name = os.path.basename(path).split(".")[0]
-
-                # Read the data
-                read_flag = False
-                error_msg = ""
-                try:
-                    input_df = pd.read_csv(
-                        filepath_or_buffer=path, **read_args)
-                    column_name_checker(input_df, cols, "subset")
-                    read_flag = True
-                except Exception as err:
-                    error_msg = err
-                    if institution == "wellsfargo":
-                        wf_inst = self._read_wellsfargo_csv(
-                            path=path, account_name=account_name,
-                            read_args=read_args
-                        )
-                        if wf_inst is not None:
-                            return wf_inst
-
-                if not read_flag:
-                    if logs:
-                        msg = f"An error occurred for {name}: {error_msg}"
-                        logging.warning(msg)
-                    continue
+        if account_name is None:
+            account_name = os.path.basename(path).split(".")[0]
+
+        if self._cache is None:
+            return self._detect_and_read_csv(path, account_name, logs)
+
+        with open(path, "rb") as f:
+            cache_key = self._cache.key(f.read(), account_name)
+        if (inst_data := self._cache.get(cache_key, path)) is not None:
+            logging.info(
+                f"Cached:    {inst_data.institution_name:<12}"
+                f" - {inst_data.service_name:<10} - {account_name:<20}")
+            return inst_data
+
+        inst_data = self._detect_and_read_csv(path, account_name, logs)
+        if inst_data is not None and inst_data.is_output_created:
+            self._cache.put(cache_key, inst_data)
+        return inst_data
+
+    def _detect_and_read_csv(
+        self, path: str, account_name: str, logs: bool = False
+    ) -> InstData:
+        """Detect the institution of the CSV file in `path`, read it and
+        returns a InstData.
+
+        Args:
+            path (str):
+                The path to read the csv file from.
+            account_name (str):
+                The name of the account to be used.
+            logs (bool):
+                Show the logs for failed attempt of reading.
+
+        Returns:
+            An InstData object, or None if the file can not be read.
+        """
+        for institution, service in self._sniff_candidates(path):
+            name = f"{institution}/{service}"
+            service_md = self._meta_data.service(institution, service)
+            cols = service_md.columns
+
+            # Read the data
+            try:
+                input_df = self._read_service_csv(path, service_md)
+                column_name_checker(input_df, cols, "subset")
+            except Exception as err:
+                if logs:
+                    logging.warning(f"An error occurred for {name}: {err}")
+                continue
+
+            logging.info(
+                f"Completed: {institution:<12} - {service:<10}"
+                f" - {account_name:<20}")
+            return InstData(
+                source=path,
+                data_type=DataType.CSV,
+                institution_name=institution,
+                service_name=service,
+                account_name=account_name,
+                table=input_df,
+                lazy=self._lazy,
+                release=self._release,
+            )
+
+        # WellsFargo CSV files don't have a header
+        wf_inst = self._read_wellsfargo_csv(
+            path=path, account_name=account_name,
+            service_md=self._meta_data.service("wellsfargo", "credit"),
+        )
+        if wf_inst is not None:
+            return wf_inst
+
+        # Log a warning if data can not be read
+        logging.warning(f"Couldn't read the data for {path}")
+
+    def _chunks_to_inst_data(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        path: str,
+        institution: str,
+        service: str,
+        account_name: str,
+    ) -> Iterator[InstData]:
+        """Create an InstData for each chunk in `chunks`.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]):
+                The chunks of the file.
+            path (str):
+                The path of the csv file.
+            institution (str):
+                The name of the institution.
+            service (str):
+                The name of the service.
+            account_name (str):
+                The name of the account.
+
+        Yields:
+            An InstData object for each chunk.
+        """
+        for chunk in chunks:
+            yield InstData(
+                source=path,
+                data_type=DataType.CSV,
+                institution_name=institution,
+                service_name=service,
+                account_name=account_name,
+                table=chunk,
+                lazy=self._lazy,
+                release=self._release,
+            )
+
+    def _read_wellsfargo_csv_chunks(
+        self,
+        path: str,
+        account_name: str,
+        service_md: ServiceMetaData,
+        chunksize: int,
+    ) -> Iterator[InstData]:
+        """Same as `_read_wellsfargo_csv` but yields an InstData for each
+        chunk of `chunksize` rows. The service is found with a first pass
+        over the chunks of the file before creating the InstData objects.
+
+        Args:
+            path (str):
+                The path to read the csv file from.
+            account_name (str):
+                The name of the account to be used.
+            service_md (ServiceMetaData):
+                The meta data to read the file with.
+            chunksize (int):
+                The number of rows in each chunk.
+
+        Yields:
+            An InstData object for each chunk.
+        """
+        if not self._sniff_wellsfargo(path):
+            return
+
+        wf_service = "debit"
+        try:
+            with pd.read_csv(
+                path, header=None, names=self._wellsfargo_names,
+                chunksize=chunksize,
+            ) as chunks:
+                for chunk in chunks:
+                    if not self._is_wellsfargo_frame(chunk):
+                        return
+                    if chunk["Description"].str.contains(
+                        self._wellsfargo_credit_pattern
+                    ).any():
+                        wf_service = "credit"
+        except Exception:
+            return
+
+        inst = "wellsfargo"
+        logging.info(
+            f"Completed: {inst:<12} - {wf_service:<10} - {account_name:<20}")
+        first_chunk, chunks = self._open_service_csv_chunks(
+            path, service_md, chunksize)
+        with chunks:
+            yield from self._chunks_to_inst_data(
+                itertools.chain(
+                    [first_chunk], map(service_md.parse_dates, chunks)),
+                path, inst, wf_service, account_name,
+            )
+
+    def read_csv_file_chunks(
+        self,
+        path: str,
+        account_name: str = None,
+        chunksize: int = 100_000,
+        logs: bool = False,
+    ) -> Iterator[InstData]:
+        """Read the data from `path` in chunks of `chunksize` rows and yield
+        an InstData for each chunk. Each chunk is cleaned and validated on
+        its own, so the memory used is bounded by `chunksize` instead of the
+        size of the file. Note that the validations that depend on the whole
+        column (like `n_std` mode) are done per chunk, use
+        `StreamingNStdValidator` to check the outliers across the chunks.
+
+        Args:
+            path (str):
+                The path to read the csv file from.
+            account_name (str):
+                The name of the account to be used.
+                If it's None the name of the file will be used.
+            chunksize (int):
+                The number of rows in each chunk. Default is 100,000.
+            logs (bool):
+                Show the logs for failed attempt of reading.
+
+        Yields:
+            An InstData object for each chunk.
+        """
+        if not self._path_is_csv_like(path):
+            raise ValueError("`path` should point to a CSV file.")
 
-                # logging.info(f"Completed: {name} - {account_name}")
+        if account_name is None:
+            account_name = os.path.basename(path).split(".")[0]
+
+        for institution, service in self._sniff_candidates(path):
+            name = f"{institution}/{service}"
+            service_md = self._meta_data.service(institution, service)
+            cols = service_md.columns
+
+            chunks = None
+            try:
+                first_chunk, chunks = self._open_service_csv_chunks(
+                    path, service_md, chunksize)
+                column_name_checker(first_chunk, cols, "subset")
+            except Exception as err:
+                if chunks is not None:
+                    chunks.close()
+                if logs:
+                    logging.warning(f"An error occurred for {name}: {err}")
+                continue
+
+            with chunks:
                 logging.info(
                     f"Completed: {institution:<12} - {service:<10}"
                     f" - {account_name:<20}")
-                return InstData(
-                    source=path,
-                    data_type=DataType.CSV,
-                    institution_name=institution,
-                    service_name=service,
-                    account_name=account_name,
-                    table=input_df,
+                yield from self._chunks_to_inst_data(
+                    itertools.chain(
+                        [first_chunk], map(service_md.parse_dates, chunks)),
+                    path, institution, service, account_name,
                 )
+                return
+
+        # WellsFargo CSV files don't have a header
+        wf_service_md = self._meta_data.service("wellsfargo", "credit")
+        wf_found = False
+        for wf_inst in self._read_wellsfargo_csv_chunks(
+            path, account_name, wf_service_md, chunksize
+        ):
+            wf_found = True
+            yield wf_inst
+        if wf_found:
+            return
 
         # Log a warning if data can not be read
         logging.warning(f"Couldn't read the data for {path}")
 
-    def read_csv_folder(self, folder_path: str) -> List[InstData]:
-        """Traverse `folder_path` and returns a list that contains
-        InstData for each csv file in the `folder_path`. This method should be
-        used to traverse at most one level deep. If there is a folder
-        inside `folder_path`, the name of the that folder will be considered
-        as the account_name for the csv files in that folder.
+    def _read_csv_task(
+        self, path: str, account_name: str
+    ) -> Tuple[InstData, str]:
+        """Read a single csv file for `read_csv_folder`. The errors are
+        returned instead of raised, so one bad file doesn't stop the others.
+
+        Args:
+            path (str):
+                The path to read the csv file from.
+            account_name (str):
+                The name of the account to be used.
+
+        Returns:
+            A tuple of (InstData or None, error message or None).
+        """
+        try:
+            return self.read_csv_file(path, account_name), None
+        except Exception as err:
+            return None, f"{type(err).__name__}: {err}"
+
+    def _csv_folder_tasks(self, folder_path: str) -> List[Tuple[str, str]]:
+        """Find the csv files in `folder_path` along with their account name.
 
         Args:
             folder_path (str):
                 The folder's path to read the csv files from.
 
         Returns:
-            A list of InstData objects.
+            A list of (path, account_name) tuples sorted by path.
         """
-        out_list = []
+        tasks = []
+        for dirpath, dirnames, filenames in os.walk(folder_path):
+            dirnames.sort()
 
-        for dirpath, _, filenames in os.walk(folder_path):
             # Find the account_name if needed
             account_name = None
             if dirpath != folder_path:
                 account_name = os.path.basename(dirpath)
 
-            for filename in filenames:
+            for filename in sorted(filenames):
                 if not self._path_is_csv_like(filename):
                     continue
 
-                tmp_path = os.path.join(dirpath, filename)
-                if read_data := self.read_csv_file(tmp_path, account_name):
-                    out_list.append(read_data)
+                tasks.append((os.path.join(dirpath, filename), account_name))
+
+        return tasks
+
+    def read_csv_folder(
+        self,
+        folder_path: str,
+        workers: int = 1,
+        manifest_path: str = None,
+        mp_context: BaseContext = None,
+    ) -> List[InstData]:
+        """Traverse `folder_path` and returns a list that contains
+        InstData for each csv file in the `folder_path`. This method should be
+        used to traverse at most one level deep. If there is a folder
+        inside `folder_path`, the name of the that folder will be considered
+        as the account_name for the csv files in that folder.
+
+        The files that raise an error are logged and stored in
+        `failed_files` (path -> error message) without stopping the others.
+
+        If `manifest_path` is passed, an IngestManifest is kept there and
+        only the files that are new or modified since the last call are read.
+
+        Args:
+            folder_path (str):
+                The folder's path to read the csv files from.
+            workers (int):
+                The number of processes to read the files with. If it's 1 the
+                files are read in this process, and if it's None the number
+                of CPUs is used. Default is 1.
+            manifest_path (str):
+                The path of the manifest JSON file to read and update.
+                Default is None which means all the files are read.
+            mp_context (BaseContext):
+                The multiprocessing context of the worker processes, e.g.
+                ``multiprocessing.get_context("spawn")``. Default is None
+                which means the default start method is used.
+
+        Returns:
+            A list of InstData objects, in the same order as the files paths.
+            When `manifest_path` is passed, only the new or modified files.
+        """
+        tasks = self._csv_folder_tasks(folder_path)
+
+        manifest = None
+        if manifest_path is not None:
+            manifest = IngestManifest(manifest_path)
+            manifest.prune(
+                os.path.relpath(path, folder_path) for path, _ in tasks)
+            tasks = [
+                (path, account_name)
+                for path, account_name in tasks
+                if manifest.has_changed(
+                    os.path.relpath(path, folder_path), path)
+            ]
+
+        paths = [path for path, _ in tasks]
+        account_names = [account_name for _, account_name in tasks]
+
+        if workers == 1 or len(tasks) <= 1:
+            results = list(map(self._read_csv_task, paths, account_names))
+        else:
+            # The workers may not be forked from this process, so the
+            # in-house institutions are registered in them again
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=mp_context,
+                initializer=restore_institutions,
+                initargs=(registered_institutions(),),
+            ) as executor:
+                results = list(executor.map(
+                    self._read_csv_task, paths, account_names))
+
+        out_list = []
+        self.failed_files = {}
+        for path, (read_data, error_msg) in zip(paths, results):
+            if error_msg is not None:
+                logging.warning(f"Failed to read {path}: {error_msg}")
+                self.failed_files[path] = error_msg
+            elif read_data:
+                out_list.append(read_data)
+                if manifest is not None:
+                    manifest.update(
+                        os.path.relpath(path, folder_path), path, read_data)
+
+        if manifest is not None:
+            manifest.save()
 
         return out_list
@@ -0,0 +1,127 @@
+import os
+import json
+import hashlib
+import tempfile
+from typing import Dict, Any, Iterable
+
+from mymoney.core.data_classes import InstData
+
+
+class IngestManifest:
+    """A JSON manifest of the files ingested from a folder.
+
+    For each file (keyed by its path relative to the ingested folder) it
+    keeps the size, modification time, content hash, detected
+    institution/service/account and the number of rows of the output, so
+    the next ingestion of the folder can skip the files that haven't
+    changed.
+    """
+
+    _version = 1
+
+    def __init__(self, path: str) -> None:
+        """Constructor of IngestManifest class. Loads the manifest from
+        `path` if it exists.
+
+        Args:
+            path (str):
+                The path of the manifest JSON file.
+        """
+        self.path = path
+        self._files = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                manifest = json.load(f)
+            if manifest.get("version") == self._version:
+                self._files = manifest["files"]
+
+    @staticmethod
+    def _file_hash(path: str) -> str:
+        """Returns the sha256 hash of the content of the file in `path`."""
+        hasher = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(block)
+        return hasher.hexdigest()
+
+    @property
+    def files(self) -> Dict[str, Dict[str, Any]]:
+        """The entries of the manifest, keyed by the relative path."""
+        return self._files
+
+    def has_changed(self, key: str, path: str) -> bool:
+        """Check whether the file in `path` is new or modified since it was
+        recorded under `key`. The content hash is only computed when the size
+        is the same but the modification time is not.
+
+        Args:
+            key (str):
+                The key of the file in the manifest.
+            path (str):
+                The path of the file.
+
+        Returns:
+            True if the file should be processed again, False otherwise.
+        """
+        entry = self._files.get(key)
+        if entry is None:
+            return True
+
+        stat = os.stat(path)
+        if stat.st_size != entry["size"]:
+            return True
+        if stat.st_mtime_ns == entry["mtime_ns"]:
+            return False
+        if self._file_hash(path) == entry["hash"]:
+            # Only touched, the content is the same
+            entry["mtime_ns"] = stat.st_mtime_ns
+            return False
+
+        return True
+
+    def update(self, key: str, path: str, inst_data: InstData):
+        """Record the file in `path` and the InstData read from it.
+
+        Args:
+            key (str):
+                The key of the file in the manifest.
+            path (str):
+                The path of the file.
+            inst_data (InstData):
+                The InstData read from the file.
+        """
+        stat = os.stat(path)
+        self._files[key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "hash": self._file_hash(path),
+            "institution_name": inst_data.institution_name,
+            "service_name": inst_data.service_name,
+            "account_name": inst_data.account_name,
+            "n_rows": len(inst_data.output_df),
+        }
+
+    def prune(self, keys: Iterable[str]):
+        """Remove the entries that are not in `keys`.
+
+        Args:
+            keys (Iterable[str]):
+                The keys to keep.
+        """
+        keys = set(keys)
+        self._files = {
+            key: entry
+            for key, entry in self._files.items()
+            if key in keys
+        }
+
+    def save(self):
+        """Write the manifest to `path`."""
+        manifest_dir = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=manifest_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {"version": self._version, "files": self._files},
+                f, indent=4, sort_keys=True,
+            )
+        os.replace(tmp_path, self.path)
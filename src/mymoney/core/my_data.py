@@ -1,19 +1,11 @@
-import logging
-from typing import Dict
+from typing import Dict, Iterable
 
 import numpy as np  # noqa: F401
 import pandas as pd
 
 from mymoney.analysis.expense import ExpenseAnalysis
-from mymoney.storage_integrations import SheetsOperations
-
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-    # filename="logs.log",
-)
+from mymoney.core.data_classes import InstData
+from mymoney.utils.common import concat_dataframes
 
 
 class MyData:
@@ -33,6 +25,9 @@ class MyData:
         sheet_name: str = "MyMoney",
     ):
         if sheets_creds:
+            # Imported here so the offline usage doesn't import gspread
+            from mymoney.storage_integrations import SheetsOperations
+
             self.sheets_op = SheetsOperations(sheets_creds, sheet_name)
 
     def read_sheets(self):
@@ -41,5 +36,27 @@ class MyData:
 
         self._load_analysis_instances()
 
+    def load_inst_data(self, inst_data_list: Iterable[InstData]):
+        """Combine the `output_df` of the InstData objects into `expense_df`
+        and `trade_df` based on their `out_type`. The categorical columns
+        of the outputs stay categorical with the union of their categories.
+
+        Args:
+            inst_data_list (Iterable[InstData]):
+                The InstData objects, e.g. the outputs of DataReader.
+        """
+        outputs = {"expense": [], "trade": []}
+        for inst_data in inst_data_list:
+            if inst_data.out_type in outputs:
+                outputs[inst_data.out_type].append(inst_data.output_df)
+
+        self.expense_df = concat_dataframes(outputs["expense"])
+        self.trade_df = concat_dataframes(outputs["trade"])
+
+        if not self.expense_df.empty:
+            self.expense_df = self.expense_df.reindex(
+                columns=ExpenseAnalysis._expense_columns)
+            self._load_analysis_instances()
+
     def _load_analysis_instances(self):
         self.expense_analysis = ExpenseAnalysis(self.expense_df)
@@ -0,0 +1,194 @@
+import os
+import pickle
+import hashlib
+import logging
+import tempfile
+from typing import Dict, Any
+
+from mymoney.core.data_classes import InstData
+from mymoney.utils.meta_data import get_meta_data_registry
+
+
+class ParseCache:
+    """An on-disk cache for the outputs of the files read by DataReader.
+
+    Each entry is keyed by the hash of the file content, the account name
+    and the hash of `meta_data.json`, and stores the detected institution,
+    service and account along with the `output_df`. An entry is ignored if
+    the cleaner version of its institution has changed since it was stored.
+    The least recently used entries are evicted when the cache grows
+    beyond `max_size` bytes or `max_entries` entries.
+    """
+
+    _extension = ".pkl"
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_size: int = None,
+        max_entries: int = None,
+    ) -> None:
+        """Constructor of ParseCache class.
+
+        Args:
+            cache_dir (str):
+                The directory to store the cache entries in.
+            max_size (int):
+                The maximum size of the cache in bytes.
+                If it's None the size is not limited.
+            max_entries (int):
+                The maximum number of entries in the cache.
+                If it's None the number of entries is not limited.
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.max_entries = max_entries
+        self._meta_data_hash = get_meta_data_registry().hash
+
+    def _entry_path(self, key: str) -> str:
+        """Returns the path of the entry file for `key`."""
+        return os.path.join(self.cache_dir, key + self._extension)
+
+    def key(self, content: bytes, account_name: str) -> str:
+        """Create the cache key of a file.
+
+        Args:
+            content (bytes):
+                The content of the file.
+            account_name (str):
+                The name of the account the file is read for.
+
+        Returns:
+            The cache key as a hex string.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(self._meta_data_hash.encode())
+        hasher.update(str(account_name).encode() + b"\0")
+        hasher.update(content)
+        return hasher.hexdigest()
+
+    def get(self, key: str, source: str) -> InstData:
+        """Load the entry for `key` from the cache.
+
+        Args:
+            key (str):
+                The cache key created by `key` method.
+            source (str):
+                The source to set for the returned InstData.
+
+        Returns:
+            An InstData object if there is a valid entry for `key`,
+            None otherwise.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "rb") as f:
+                entry = pickle.load(f)
+            inst_class = InstData._get_institution_class(
+                entry["institution_name"])
+        except FileNotFoundError:
+            return None
+        except Exception as err:
+            logging.warning(f"Removing the broken cache entry {key}: {err}")
+            self._remove(entry_path)
+            return None
+
+        if entry["cleaner_version"] != inst_class._cleaner_version:
+            self._remove(entry_path)
+            return None
+
+        # Mark the entry as recently used
+        os.utime(entry_path)
+
+        return InstData.from_output_df(
+            source=source,
+            data_type=entry["data_type"],
+            institution_name=entry["institution_name"],
+            service_name=entry["service_name"],
+            account_name=entry["account_name"],
+            output_df=entry["output_df"],
+            out_type=entry["out_type"],
+        )
+
+    def put(self, key: str, inst_data: InstData):
+        """Store the output of `inst_data` in the cache.
+
+        Args:
+            key (str):
+                The cache key created by `key` method.
+            inst_data (InstData):
+                The InstData to store.
+        """
+        inst_class = InstData._get_institution_class(
+            inst_data.institution_name)
+        entry = {
+            "data_type": inst_data.data_type,
+            "institution_name": inst_data.institution_name,
+            "service_name": inst_data.service_name,
+            "account_name": inst_data.account_name,
+            "out_type": inst_data.out_type,
+            "cleaner_version": inst_class._cleaner_version,
+            "output_df": inst_data.output_df,
+        }
+
+        # Write to a temporary file first, so other processes never
+        # see a partially written entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._entry_path(key))
+        except Exception:
+            self._remove(tmp_path)
+            raise
+
+        self._evict()
+
+    def _entries_info(self) -> Dict[str, Any]:
+        """Returns a mapping of entry paths to their `os.stat_result`."""
+        entries = {}
+        with os.scandir(self.cache_dir) as it:
+            for dir_entry in it:
+                if dir_entry.name.endswith(self._extension):
+                    try:
+                        entries[dir_entry.path] = dir_entry.stat()
+                    except FileNotFoundError:
+                        continue
+        return entries
+
+    def _evict(self):
+        """Remove the least recently used entries until the cache is within
+        `max_size` and `max_entries`."""
+        if self.max_size is None and self.max_entries is None:
+            return
+
+        entries = sorted(
+            self._entries_info().items(),
+            key=lambda item: item[1].st_mtime,
+        )
+        total_size = sum(stat.st_size for _, stat in entries)
+        while entries and (
+            (self.max_size is not None and total_size > self.max_size)
+            or (self.max_entries is not None
+                and len(entries) > self.max_entries)
+        ):
+            entry_path, stat = entries.pop(0)
+            self._remove(entry_path)
+            total_size -= stat.st_size
+
+    def _remove(self, path: str):
+        """Remove `path` if it exists."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        """Remove all the entries of the cache."""
+        for entry_path in self._entries_info():
+            self._remove(entry_path)
+
+    def __len__(self) -> int:
+        """Returns the number of entries in the cache."""
+        return len(self._entries_info())
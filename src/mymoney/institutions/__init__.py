@@ -1,23 +1,40 @@
+import importlib
+
 from mymoney.institutions.institution_base import (
     DataType,
     ServiceType,
     Service,
     Institution,
 )
+from mymoney.institutions.registry import (
+    InstitutionRegistry,
+    get_institution_registry,
+    register_institution,
+)
+
+# The institution classes are imported on first access
+_lazy_classes = {
+    "AmEx": "mymoney.institutions.amex",
+    "CapitalOne": "mymoney.institutions.capitalone",
+    "CashApp": "mymoney.institutions.cashapp",
+    "Chase": "mymoney.institutions.chase",
+    "Citi": "mymoney.institutions.citi",
+    "Coinbase": "mymoney.institutions.coinbase",
+    "CryptoDotCom": "mymoney.institutions.cryptodotcom",
+    "Discover": "mymoney.institutions.discover",
+    "PayPal": "mymoney.institutions.paypal",
+    "SamsClub": "mymoney.institutions.samsclub",
+    "SoFi": "mymoney.institutions.sofi",
+    "Uphold": "mymoney.institutions.uphold",
+    "Venmo": "mymoney.institutions.venmo",
+    "WellsFargo": "mymoney.institutions.wellsfargo",
+}
+
 
-from mymoney.institutions.amex import AmEx
-from mymoney.institutions.capitalone import CapitalOne
-from mymoney.institutions.cashapp import CashApp
-from mymoney.institutions.chase import Chase
-from mymoney.institutions.citi import Citi
-from mymoney.institutions.coinbase import Coinbase
-from mymoney.institutions.cryptodotcom import CryptoDotCom
-from mymoney.institutions.discover import Discover
-from mymoney.institutions.paypal import PayPal
-from mymoney.institutions.samsclub import SamsClub
-from mymoney.institutions.uphold import Uphold
-from mymoney.institutions.venmo import Venmo
-from mymoney.institutions.wellsfargo import WellsFargo
+def __getattr__(name: str):
+    if name in _lazy_classes:
+        return getattr(importlib.import_module(_lazy_classes[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -25,6 +42,9 @@ __all__ = [
     "ServiceType",
     "Service",
     "Institution",
+    "InstitutionRegistry",
+    "get_institution_registry",
+    "register_institution",
 
     "AmEx",
     "CapitalOne",
@@ -36,6 +56,7 @@ __all__ = [
     "Discover",
     "PayPal",
     "SamsClub",
+    "SoFi",
     "Uphold",
     "Venmo",
     "WellsFargo",
@@ -1,23 +1,14 @@
-import re
-import logging
-
 import numpy as np  # noqa: F401
 import pandas as pd
 
 from mymoney.institutions import institution_base
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
-
-
 class AmEx(institution_base.Institution):
     """A class for AmEx institution's data cleaning functions."""
 
     _this_institution_name = "amex"
+    _cleaner_version = 2
 
     def __init__(self) -> None:
         super().__init__()
@@ -44,34 +35,12 @@ class AmEx(institution_base.Institution):
             # row["Extended Details"].startswith("Amex Offer Credit"):
             #     for offer redeems
 
-            def is_transfer_finder(row):
-                try:
-                    regex_flag_paypal = re.search(
-                        r"PAYPAL",
-                        str(row["_new_Description"])
-                    )
-                    regex_flag_payment = re.search(
-                        r"\w* PAYMENT - THANK YOU",
-                        str(row["_new_Description"])
-                    )
-                except Exception:
-                    return "consider"
-
-                if (regex_flag_payment or regex_flag_paypal):
-                    return "transfer"
-                elif (not regex_flag_payment and not regex_flag_paypal):
-                    return "expense"
-                else:
-                    return "consider"
-
-            input_df["_new_Description"] = input_df["Description"].map(lambda val: str(val).strip())  # noqa: E501
-            input_df["_new_Amount"] = -input_df["Amount"]
-            input_df["_new_Date"] = input_df["Date"].copy(deep=True)
-            input_df["_new_InstitutionCategory"] = input_df["Category"].copy(deep=True)  # noqa: E501
-            input_df["_new_MyCategory"] = input_df["Category"].copy(deep=True)
-            input_df["_new_Institution"] = "AmEx"
-            input_df["_new_AccountName"] = account_name
-            input_df["_new_Service"] = self._service_type.value
-            input_df["_new_IsTransfer"] = input_df.apply(is_transfer_finder, axis=1)  # noqa: E501
-
-            return input_df
+            return self._expense_columns(
+                input_df,
+                institution="AmEx",
+                account_name=account_name,
+                description=input_df["Description"],
+                amount=-input_df["Amount"],
+                date=input_df["Date"],
+                category=input_df["Category"],
+            )
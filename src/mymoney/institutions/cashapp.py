@@ -1,22 +1,14 @@
-import logging
-
-import numpy as np
 import pandas as pd
 
 from mymoney.institutions import institution_base
-
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
+from mymoney.utils.common import money_to_float
 
 
 class CashApp(institution_base.Institution):
     """A class for CashApp institution's data cleaning functions."""
 
     _this_institution_name = "cashapp"
+    _cleaner_version = 2
 
     def __init__(self) -> None:
         super().__init__()
@@ -38,47 +30,26 @@ class CashApp(institution_base.Institution):
             Returns:
                 The same DataFrame with new columns for cleaned data.
             """
-            def is_transfer_finder(row):
-                row_status = row["Status"]
-                if row_status == "PAYMENT REVERSED":
-                    return "redundant"
-                elif row_status == "TRANSFER SENT":
-                    return "transfer"
-                elif row_status in ["PAYMENT SENT", "PAYMENT DEPOSITED"]:
-                    return "expense"
-                else:
-                    return "consider"
-
-            def amount_finder(val):
-                return float(
-                    str(val).replace(",", "").replace("$", "")
-                )
-
-            def description_finder(row):
-                row_type = row["Transaction Type"]
-                row_sender_receiver = row["Name of sender/receiver"]
-                row_notes = row["Notes"]
-                notes = "" if pd.isna(row_notes) else f" ({row_notes})"
-
-                if row_type == "Sent P2P":
-                    out = f"Me -> {row_sender_receiver}{notes}"
-                elif row_type == "Received P2P":
-                    out = f"From {row_sender_receiver} -> Me{notes}"
-                elif row_type == "Cash out":
-                    out = "Cash out"
-                else:
-                    out = "Consider"
-
-                return out.strip()
-
-            input_df["_new_Description"] = input_df.apply(description_finder, axis=1)  # noqa: E501
-            input_df["_new_Amount"] = input_df["Amount"].map(amount_finder)
-            input_df["_new_Date"] = input_df["Date"].copy(deep=True)
-            input_df["_new_InstitutionCategory"] = np.nan
-            input_df["_new_MyCategory"] = np.nan
-            input_df["_new_Institution"] = "CashApp"
-            input_df["_new_AccountName"] = account_name
-            input_df["_new_Service"] = self._service_type.value
-            input_df["_new_IsTransfer"] = input_df.apply(is_transfer_finder, axis=1)  # noqa: E501
-
-            return input_df
+            row_type = input_df["Transaction Type"]
+            sender_receiver = input_df["Name of sender/receiver"].astype(str)
+            notes = input_df["Notes"]
+            notes = (" (" + notes.astype(str) + ")").mask(notes.isna(), "")
+            description = self._select(
+                input_df.index,
+                [row_type == "Sent P2P",
+                 row_type == "Received P2P",
+                 row_type == "Cash out"],
+                ["Me -> " + sender_receiver + notes,
+                 "From " + sender_receiver + " -> Me" + notes,
+                 "Cash out"],
+                default="Consider",
+            )
+
+            return self._expense_columns(
+                input_df,
+                institution="CashApp",
+                account_name=account_name,
+                description=description,
+                amount=money_to_float(input_df["Amount"]),
+                date=input_df["Date"],
+            )
@@ -1,22 +1,14 @@
-import logging
-
 import numpy as np  # noqa: F401
 import pandas as pd
 
 from mymoney.institutions import institution_base
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
-
-
 class Chase(institution_base.Institution):
     """A class for Chasae institution's data cleaning functions."""
 
     _this_institution_name = "chase"
+    _cleaner_version = 2
 
     def __init__(self) -> None:
         super().__init__()
@@ -39,25 +31,15 @@ class Chase(institution_base.Institution):
                 The same DataFrame with new columns for cleaned data.
             """
 
-            def is_transfer_finder(val):
-                if val in ["Sale", "Adjustment", "Return"]:
-                    return "expense"
-                elif val == "Payment":
-                    return "transfer"
-                else:
-                    return "consider"
-
-            input_df["_new_Description"] = input_df["Description"].map(lambda val: str(val).strip())  # noqa: E501
-            input_df["_new_Amount"] = input_df["Amount"].copy(deep=True)
-            input_df["_new_Date"] = input_df["Transaction Date"].copy(deep=True)  # noqa: E501
-            input_df["_new_InstitutionCategory"] = input_df["Category"].copy(deep=True)  # noqa: E501
-            input_df["_new_MyCategory"] = input_df["Category"].copy(deep=True)
-            input_df["_new_Institution"] = "Chase"
-            input_df["_new_AccountName"] = account_name
-            input_df["_new_Service"] = self._service_type.value
-            input_df["_new_IsTransfer"] = input_df["Type"].map(is_transfer_finder)  # noqa: E501
-
-            return input_df
+            return self._expense_columns(
+                input_df,
+                institution="Chase",
+                account_name=account_name,
+                description=input_df["Description"],
+                amount=input_df["Amount"],
+                date=input_df["Transaction Date"],
+                category=input_df["Category"],
+            )
 
     class DebitService(institution_base.Institution.DebitService):
         """A class for Debit Service."""
@@ -77,20 +59,11 @@ class Chase(institution_base.Institution):
                 The same DataFrame with new columns for cleaned data.
             """
 
-            def is_transfer_finder(val):
-                if val == "ACCT_XFER":
-                    return "transfer"
-                else:
-                    return "expense"
-
-            input_df["_new_Description"] = input_df["Description"].map(lambda val: str(val).strip())  # noqa: E501
-            input_df["_new_Amount"] = input_df["Amount"].copy(deep=True)
-            input_df["_new_Date"] = input_df["Posting Date"].copy(deep=True)
-            input_df["_new_InstitutionCategory"] = np.nan
-            input_df["_new_MyCategory"] = np.nan
-            input_df["_new_Institution"] = "Chase"
-            input_df["_new_AccountName"] = account_name
-            input_df["_new_Service"] = self._service_type.value
-            input_df["_new_IsTransfer"] = input_df["Type"].map(is_transfer_finder)  # noqa: E501
-
-            return input_df
+            return self._expense_columns(
+                input_df,
+                institution="Chase",
+                account_name=account_name,
+                description=input_df["Description"],
+                amount=input_df["Amount"],
+                date=input_df["Posting Date"],
+            )
@@ -1,23 +1,13 @@
-import logging
-import re
-
-import numpy as np
 import pandas as pd
 
 from mymoney.institutions import institution_base
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
-
-
 class Citi(institution_base.Institution):
     """A class for Citi institution's data cleaning functions."""
 
     _this_institution_name = "citi"
+    _cleaner_version = 2
 
     def __init__(self) -> None:
         super().__init__()
@@ -41,45 +31,17 @@ class Citi(institution_base.Institution):
             """
             # # row["_new_Description"].startswith("Thankyou Points Redeemed"): for point redeem # noqa: E501
 
-            def amount_finder(row):
-                try:
-                    regex_flag = re.search(
-                        r"AUTOPAY|ONLINE PAYMENT, THANK YOU|"
-                        r"Thankyou Points Redeemed",
-                        str(row["_new_Description"])
-                    )
-                except Exception:
-                    return "consider"
-
-                if regex_flag or np.isnan(row["Debit"]):
-                    return -row["Credit"]
-                else:
-                    return -row["Debit"]
-
-            def is_transfer_finder(row):
-                try:
-                    regex_flag = re.search(
-                        r"AUTOPAY|ONLINE PAYMENT, THANK YOU",
-                        str(row["_new_Description"])
-                    )
-                except Exception:
-                    return "consider"
-
-                if regex_flag:
-                    return (
-                        "consider" if np.isnan(row["Credit"]) else "transfer"
-                    )
-                else:
-                    return "expense"
-
-            input_df["_new_Description"] = input_df["Description"].map(lambda val: str(val).strip())  # noqa: E501
-            input_df["_new_Amount"] = input_df.apply(amount_finder, axis=1)
-            input_df["_new_Date"] = input_df["Date"].copy(deep=True)
-            input_df["_new_InstitutionCategory"] = np.nan
-            input_df["_new_MyCategory"] = np.nan
-            input_df["_new_Institution"] = "Citi"
-            input_df["_new_AccountName"] = account_name
-            input_df["_new_Service"] = self._service_type.value
-            input_df["_new_IsTransfer"] = input_df.apply(is_transfer_finder, axis=1)  # noqa: E501
-
-            return input_df
+            # Payments and points redeems only have `Credit`
+            is_credit = input_df["Description"].astype(str).str.contains(
+                r"AUTOPAY|ONLINE PAYMENT, THANK YOU|Thankyou Points Redeemed",
+                regex=True,
+            ) | input_df["Debit"].isna()
+
+            return self._expense_columns(
+                input_df,
+                institution="Citi",
+                account_name=account_name,
+                description=input_df["Description"],
+                amount=-input_df["Credit"].where(is_credit, input_df["Debit"]),
+                date=input_df["Date"],
+            )
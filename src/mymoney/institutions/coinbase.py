@@ -1,19 +1,8 @@
-import logging
-import re
-
-import numpy as np
 import pandas as pd
 
 from mymoney.institutions import institution_base
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
-
-
 class Coinbase(institution_base.Institution):
     """A class for Coinbase institution's data cleaning functions."""
 
@@ -39,177 +28,118 @@ class Coinbase(institution_base.Institution):
             Returns:
                 The same DataFrame with new columns for cleaned data.
             """
-            def from_account_finder(row):
-                trx_type = row["Transaction Type"]
-                if trx_type in [
-                    "Inflation Reward", "Staking Income",
-                    "Convert", "Send", "Sell", "Withdrawal",
-                ]:
-                    return "coinbase"
-                elif trx_type == "Buy":
-                    # Can be coinbase itself
-                    # TODO: Need revision and compare to `expense` df
-                    return "Bank"
-                elif trx_type == "Learning Reward":
-                    return "Coinbase Reward"
-                elif trx_type == "Receive":
-                    if (
-                        row["NotesHelper"][-2] == "Coinbase"
-                        and row["NotesHelper"][-1] in ["Earn", "Rewards"]
-                    ):
-                        return "Coinbase Reward"
-                    elif row["NotesHelper"][-1] == "from":
-                        return "coinbase"
-
-                    # Alternative: f'{row["ToAsset"]} Network'
-                    return "Wallet"
-                else:
-                    return np.nan
-
-            def to_account_finder(row):
-                trx_type = row["Transaction Type"]
-                if trx_type == "Send":
-                    try:
-                        re_pattern = r"to\s(.*)$"
-                        groups = re.search(re_pattern, row["Notes"]).groups()
-                        if not groups[0]:
-                            return f"{row['Asset']} Network"
-                        return groups[0]
-                    except Exception:
-                        return np.nan
-                elif trx_type == "Withdrawal":
-                    return "Bank"
-
-                return "coinbase"
-
-            def from_asset_finder(row):
-                trx_type = row["Transaction Type"]
-                if trx_type == "Learning Reward":
-                    return "R3W"
-                elif trx_type == "Buy":
-                    return "USD"
-                elif trx_type in [
-                    "Inflation Reward", "Staking Income",
-                    "Convert", "Send", "Sell", "Withdrawal",
-                ]:
-                    return row["Asset"]
-                elif trx_type == "Receive":
-                    if (
-                        row["NotesHelper"][-2] == "Coinbase"
-                        and row["NotesHelper"][-1] in ["Earn", "Rewards"]
-                    ):
-                        return "R3W"
-                    elif row["NotesHelper"][-1] == "from":
-                        return row["Asset"]
-                else:
-                    return np.nan
-
-            def to_asset_finder(row):
-                trx_type = row["Transaction Type"]
-                if trx_type in [
-                    "Learning Reward", "Buy", "Send", "Withdrawal",
-                    "Inflation Reward", "Staking Income", "Receive",
-                ]:
-                    return row["Asset"]
-                elif trx_type in ["Convert", "Sell"]:
-                    return row["NotesHelper"][-1]
-                else:
-                    return np.nan
-
-            def in_amount_finder(row):
-                trx_type = row["Transaction Type"]
-                if trx_type in [
-                    "Learning Reward", "Inflation Reward",
-                    "Staking Income", "Receive",
-                ]:
-                    return .0
-                elif trx_type == "Buy":
-                    return float(row["Subtotal"])
-                elif trx_type in [
-                    "Convert", "Send", "Sell", "Withdrawal",
-                ]:
-                    return row["Quantity Transacted"]
-                else:
-                    return np.nan
-
-            def out_amount_finder(row):
-                trx_type = row["Transaction Type"]
-                if trx_type in [
-                    "Learning Reward", "Buy", "Send", "Withdrawal",
-                    "Inflation Reward", "Staking Income", "Receive"
-                ]:
-                    return float(row["Quantity Transacted"])
-                elif trx_type in ["Convert", "Sell"]:
-                    price = str(row["NotesHelper"][-2]).replace("$", "")
-                    return float(price)
-                else:
-                    return np.nan
-
-            def trx_type_finder(row):
-                trx_type = row["Transaction Type"]
-                if trx_type == "Learning Reward":
-                    return "Reward"
-                elif trx_type in ["Buy", "Send", "Withdrawal"]:
-                    # TODO: `Buy` could be `Trade` depend on
-                    # where the source is
-                    return "Transfer"
-                elif trx_type in ["Convert", "Sell"]:
-                    return "Trade"
-                elif trx_type in ["Inflation Reward", "Staking Income"]:
-                    return "HODL"
-                elif trx_type == "Receive":
-                    if (
-                        row["NotesHelper"][-2] == "Coinbase"
-                        and row["NotesHelper"][-1] in ["Earn", "Rewards"]
-                    ):
-                        return "Reward"
-                    elif row["NotesHelper"][-1] == "from":
-                        return "HODL"
-                else:
-                    return np.nan
-
-            def trx_sub_type_finder(row):
-                trx_type = row["Transaction Type"]
-                if trx_type == "Learning Reward":
-                    return "Coinbase Reward"
-                elif trx_type in ["Inflation Reward", "Staking Income"]:
-                    return "Stake"
-                elif trx_type == "Receive":
-                    if (
-                        row["NotesHelper"][-2] == "Coinbase"
-                        and row["NotesHelper"][-1] in ["Earn", "Rewards"]
-                    ):
-                        return "Coinbase Reward"
-                    elif row["NotesHelper"][-1] == "from":
-                        return "Stake"
-                elif trx_type in ["Send", "Withdrawal"]:
-                    return "Withdraw"
-                elif trx_type == "Buy":
-                    return "Buy"
-                elif trx_type in ["Sell", "Convert"]:
-                    if row["_new_FromAsset"] in self._USDs:
-                        return "Buy"
-                    elif row["_new_ToAsset"] in self._USDs:
-                        return "Sell"
-                    else:
-                        return "Pairwise"
-                else:
-                    return np.nan
-
-            input_df["NotesHelper"] = input_df["Notes"].str.split()
-
-            input_df["_new_Datetime"] = pd.to_datetime(input_df["Timestamp"], utc=True)  # noqa: E501
-            input_df["_new_FromAccount"] = input_df.apply(from_account_finder, axis=1)  # noqa: E501
-            input_df["_new_ToAccount"] = input_df.apply(to_account_finder, axis=1)  # noqa: E501
-            input_df["_new_FromAsset"] = input_df.apply(from_asset_finder, axis=1)  # noqa: E501
-            input_df["_new_ToAsset"] = input_df.apply(to_asset_finder, axis=1)  # noqa: E501
-            input_df["_new_InAmount"] = input_df.apply(in_amount_finder, axis=1)  # noqa: E501
-            input_df["_new_OutAmount"] = input_df.apply(out_amount_finder, axis=1)  # noqa: E501
+            trx_type = input_df["Transaction Type"]
+            asset = input_df["Asset"]
+            index = input_df.index
+
+            is_receive = trx_type == "Receive"
+            is_trade = trx_type.isin(["Convert", "Sell"])
+
+            # `Receive`, `Convert` and `Sell` transactions are cleaned based
+            # on the last two words of `Notes`, e.g. `Converted 0.5 ETH to
+            # $200.00 USDC` -> ($200.00, USDC)
+            notes_tail = input_df["Notes"].where(is_receive | is_trade).str.extract(  # noqa: E501
+                r"(?s)^(?:.*\s)?(\S+)\s+(\S+)\s*$")
+            second_last_word, last_word = notes_tail[0], notes_tail[1]
+            short_notes = (is_receive | is_trade) & second_last_word.isna()
+            if short_notes.any():
+                raise ValueError(
+                    "`Notes` should have at least two words for `Receive`,"
+                    " `Convert` and `Sell` transactions."
+                    f"\nThe indexes: {list(index[short_notes])}")
+
+            is_reward_receive = (
+                is_receive
+                & (second_last_word == "Coinbase")
+                & last_word.isin(["Earn", "Rewards"])
+            )
+            is_stake_receive = (
+                is_receive & ~is_reward_receive & (last_word == "from"))
+            is_hodl = trx_type.isin(["Inflation Reward", "Staking Income"])
+            is_learning_reward = trx_type == "Learning Reward"
+            is_buy = trx_type == "Buy"
+            is_withdraw = trx_type.isin(["Send", "Withdrawal"])
+            from_coinbase = trx_type.isin([
+                "Inflation Reward", "Staking Income",
+                "Convert", "Send", "Sell", "Withdrawal",
+            ])
+
+            # `Send` transactions are sent to the account in `Notes`
+            # e.g. `Sent 0.1 BTC to 0x123`
+            send_to = input_df["Notes"].str.extract(r"to\s(.*)$")[0]
+            send_to = send_to.mask(send_to == "", asset.astype(str) + " Network")  # noqa: E501
+
+            # `Sell` and `Convert` transactions have the price before the
+            # asset they're converted to, e.g. `... for $200.00 USD`
+            trade_price = (
+                second_last_word.where(is_trade)
+                .str.replace("$", "", regex=False).astype(float)
+            )
+
+            input_df["_new_Datetime"] = self._utc_datetime(input_df["Timestamp"])  # noqa: E501
+            input_df["_new_FromAccount"] = self._select(
+                index,
+                [from_coinbase, is_buy, is_learning_reward, is_reward_receive,
+                 is_stake_receive, is_receive],
+                # TODO: `Buy` need revision and compare to `expense` df
+                # Alternative for `Receive`: f'{row["ToAsset"]} Network'
+                ["coinbase", "Bank", "Coinbase Reward", "Coinbase Reward",
+                 "coinbase", "Wallet"],
+            )
+            input_df["_new_ToAccount"] = self._select(
+                index,
+                [trx_type == "Send", trx_type == "Withdrawal"],
+                [send_to, "Bank"],
+                default="coinbase",
+            )
+            input_df["_new_FromAsset"] = self._select(
+                index,
+                [is_learning_reward, is_buy, from_coinbase, is_reward_receive,
+                 is_stake_receive, is_receive],
+                ["R3W", "USD", asset, "R3W", asset, None],
+            )
+            input_df["_new_ToAsset"] = self._select(
+                index,
+                [is_learning_reward | is_buy | is_withdraw | is_hodl
+                 | is_receive, is_trade],
+                [asset, last_word],
+            )
+            input_df["_new_InAmount"] = self._select(
+                index,
+                [is_learning_reward | is_hodl | is_receive, is_buy,
+                 is_trade | is_withdraw],
+                [.0,
+                 input_df["Subtotal"].where(is_buy).astype(float),
+                 input_df["Quantity Transacted"]],
+            )
+            input_df["_new_OutAmount"] = self._select(
+                index,
+                [is_learning_reward | is_buy | is_withdraw | is_hodl
+                 | is_receive, is_trade],
+                [input_df["Quantity Transacted"].astype(float), trade_price],
+            )
             input_df["_new_FeeAsset"] = "USD"
             input_df["_new_FeeAmount"] = input_df["Fees and/or Spread"].copy(deep=True)  # noqa: E501
             input_df["_new_FeeValue"] = input_df["Fees and/or Spread"].copy(deep=True)  # noqa: E501
-            input_df["_new_TrxType"] = input_df.apply(trx_type_finder, axis=1)
-            input_df["_new_TrxSubType"] = input_df.apply(trx_sub_type_finder, axis=1)  # noqa: E501
+            # TODO: `Buy` could be `Trade` depend on where the source is
+            input_df["_new_TrxType"] = self._select(
+                index,
+                [is_learning_reward, is_buy | is_withdraw, is_trade, is_hodl,
+                 is_reward_receive, is_stake_receive, is_receive],
+                ["Reward", "Transfer", "Trade", "HODL",
+                 "Reward", "HODL", None],
+            )
+            input_df["_new_TrxSubType"] = self._select(
+                index,
+                [is_learning_reward, is_hodl, is_reward_receive,
+                 is_stake_receive, is_receive, is_withdraw, is_buy,
+                 is_trade & input_df["_new_FromAsset"].isin(self._USDs),
+                 is_trade & input_df["_new_ToAsset"].isin(self._USDs),
+                 is_trade],
+                ["Coinbase Reward", "Stake", "Coinbase Reward",
+                 "Stake", None, "Withdraw", "Buy",
+                 "Buy", "Sell", "Pairwise"],
+            )
             input_df["_new_AssetType"] = "Crypto"
             # input_df["_new_USDAmount"] = input_df["Subtotal"]
 
@@ -1,18 +1,8 @@
-import logging
-
-import numpy as np
 import pandas as pd
 
 from mymoney.institutions import institution_base
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
-
-
 class CryptoDotCom(institution_base.Institution):
     """A class for Crypto.Com institution's data cleaning functions."""
 
@@ -38,115 +28,18 @@ class CryptoDotCom(institution_base.Institution):
             Returns:
                 The same DataFrame with new columns for cleaned data.
             """
-            def from_account_finder(val):
-                if val in [
-                    "crypto_exchange",
-                    "crypto_withdrawal",
-                    "crypto_earn_interest_paid",
-                    "crypto_earn_program_withdrawn",
-                    "crypto_earn_program_created",
-                    "rewards_platform_deposit_credited",
-                ]:
-                    return "cryptodotcom"
-                elif val == "crypto_purchase":
-                    return "Bank"
-                elif val == "crypto_deposit":
-                    # Alternative: f'{row["ToAsset"]} Network'
-                    return "Wallet"
-                else:
-                    return np.nan
-
-            def to_account_finder(val):
-                if val in [
-                    "crypto_earn_interest_paid",
-                    "crypto_purchase",
-                    "crypto_deposit",
-                    "crypto_exchange",
-                    "rewards_platform_deposit_credited",
-                    "crypto_earn_program_withdrawn",
-                    "crypto_earn_program_created",
-                ]:
-                    return "cryptodotcom"
-                elif val == "crypto_withdrawal":
-                    # Alternative: f'{row["ToAsset"]} Network'
-                    return "Wallet"
-                else:
-                    return np.nan
-
-            def from_asset_finder(row):
-                trx_kind = row["Transaction Kind"]
-                if trx_kind == "crypto_purchase":
-                    return "USD"
-                elif trx_kind == "rewards_platform_deposit_credited":
-                    return "R3W"
-                elif trx_kind in [
-                    "crypto_exchange",
-                    "crypto_withdrawal",
-                    "crypto_earn_interest_paid",
-                    "crypto_earn_program_withdrawn",
-                    "crypto_earn_program_created",
-                    "crypto_deposit",
-                ]:
-                    return row["Currency"]
-                else:
-                    return np.nan
-
-            def to_asset_finder(row):
-                if pd.isna(row["To Currency"]):
-                    return row["Currency"]
-                else:
-                    return row["To Currency"]
-
-            def in_amount_finder(row):
-                trx_kind = row["Transaction Kind"]
-                if trx_kind == "crypto_purchase":
-                    return abs(row["Native Amount"])
-                elif trx_kind in [
-                    "rewards_platform_deposit_credited",
-                    "crypto_earn_interest_paid",
-                ]:
-                    return .0
-                elif trx_kind in [
-                    "crypto_exchange",
-                    "crypto_withdrawal",
-                    "crypto_deposit",
-                    "crypto_earn_program_withdrawn",
-                    "crypto_earn_program_created",
-                ]:
-                    return row["Amount"]
-                else:
-                    return np.nan
-
-            def out_amount_finder(row):
-                if pd.isna(row["To Currency"]):
-                    return row["Amount"]
-                else:
-                    return row["To Amount"]
-
-            def trx_sub_type_finder(row):
-                trx_kind = row["Transaction Kind"]
-                if trx_kind == "crypto_earn_interest_paid":
-                    return "Stake"
-                elif trx_kind in [
-                    "crypto_earn_program_withdrawn",
-                    "crypto_earn_program_created",
-                ]:
-                    return "Redundant"
-                elif trx_kind in ["crypto_withdrawal", "crypto_deposit"]:
-                    return "Crypto"
-                elif trx_kind == "crypto_purchase":
-                    return "Buy"
-                elif trx_kind == "rewards_platform_deposit_credited":
-                    return "CryptoDotComRewards"
-                elif trx_kind == "crypto_exchange":
-                    if row["Currency"] in self._USDs:
-                        return "Buy"
-                    elif row["To Currency"] in self._USDs:
-                        return "Sell"
-                    else:
-                        return "Pairwise"
-                else:
-                    return np.nan
+            index = input_df.index
+            trx_kind = input_df["Transaction Kind"]
+            currency, to_currency = input_df["Currency"], input_df["To Currency"]  # noqa: E501
+            no_to_currency = to_currency.isna()
+
+            is_purchase = trx_kind == "crypto_purchase"
+            is_reward = trx_kind == "rewards_platform_deposit_credited"
+            is_exchange = trx_kind == "crypto_exchange"
+            is_earn_program = trx_kind.isin([
+                "crypto_earn_program_withdrawn",
+                "crypto_earn_program_created",
+            ])
 
             trx_type_mapping = {
                 "crypto_earn_interest_paid": "HODL",
@@ -161,18 +54,60 @@ class CryptoDotCom(institution_base.Institution):
 
             input_df["Amount"] = input_df["Amount"].abs()
 
-            input_df["_new_Datetime"] = pd.to_datetime(input_df["Timestamp (UTC)"], utc=True)  # noqa: E501
-            input_df["_new_FromAccount"] = input_df["Transaction Kind"].map(from_account_finder)  # noqa: E501
-            input_df["_new_ToAccount"] = input_df["Transaction Kind"].map(to_account_finder)  # noqa: E501
-            input_df["_new_FromAsset"] = input_df.apply(from_asset_finder, axis=1)  # noqa: E501
-            input_df["_new_ToAsset"] = input_df.apply(to_asset_finder, axis=1)  # noqa: E501
-            input_df["_new_InAmount"] = input_df.apply(in_amount_finder, axis=1)  # noqa: E501
-            input_df["_new_OutAmount"] = input_df.apply(out_amount_finder, axis=1)  # noqa: E501
+            input_df["_new_Datetime"] = self._utc_datetime(input_df["Timestamp (UTC)"])  # noqa: E501
+            # Alternative for `crypto_deposit` and `crypto_withdrawal`:
+            # f'{row["ToAsset"]} Network'
+            input_df["_new_FromAccount"] = self._select(
+                index,
+                [is_exchange | is_reward | is_earn_program | trx_kind.isin([
+                    "crypto_withdrawal", "crypto_earn_interest_paid"]),
+                 is_purchase, trx_kind == "crypto_deposit"],
+                ["cryptodotcom", "Bank", "Wallet"],
+            )
+            input_df["_new_ToAccount"] = self._select(
+                index,
+                [is_purchase | is_exchange | is_reward | is_earn_program
+                 | trx_kind.isin([
+                     "crypto_earn_interest_paid", "crypto_deposit"]),
+                 trx_kind == "crypto_withdrawal"],
+                ["cryptodotcom", "Wallet"],
+            )
+            input_df["_new_FromAsset"] = self._select(
+                index,
+                [is_purchase, is_reward,
+                 is_exchange | is_earn_program | trx_kind.isin([
+                     "crypto_withdrawal", "crypto_earn_interest_paid",
+                     "crypto_deposit"])],
+                ["USD", "R3W", currency],
+            )
+            input_df["_new_ToAsset"] = self._select(
+                index, [no_to_currency], [currency], default=to_currency)
+            input_df["_new_InAmount"] = self._select(
+                index,
+                [is_purchase,
+                 is_reward | (trx_kind == "crypto_earn_interest_paid"),
+                 is_exchange | is_earn_program | trx_kind.isin([
+                     "crypto_withdrawal", "crypto_deposit"])],
+                [input_df["Native Amount"].abs(), .0, input_df["Amount"]],
+            )
+            input_df["_new_OutAmount"] = self._select(
+                index, [no_to_currency], [input_df["Amount"]],
+                default=input_df["To Amount"])
             input_df["_new_FeeAsset"] = "USD"
             input_df["_new_FeeAmount"] = .0
             input_df["_new_FeeValue"] = .0
             input_df["_new_TrxType"] = input_df["Transaction Kind"].map(trx_type_mapping)  # noqa: E501
-            input_df["_new_TrxSubType"] = input_df.apply(trx_sub_type_finder, axis=1)  # noqa: E501
+            input_df["_new_TrxSubType"] = self._select(
+                index,
+                [trx_kind == "crypto_earn_interest_paid", is_earn_program,
+                 trx_kind.isin(["crypto_withdrawal", "crypto_deposit"]),
+                 is_purchase, is_reward,
+                 is_exchange & currency.isin(self._USDs),
+                 is_exchange & to_currency.isin(self._USDs),
+                 is_exchange],
+                ["Stake", "Redundant", "Crypto", "Buy",
+                 "CryptoDotComRewards", "Buy", "Sell", "Pairwise"],
+            )
             input_df["_new_AssetType"] = "Crypto"
             # input_df["_new_USDAmount"] = input_df["Native Amount"].abs()
 
@@ -1,19 +1,10 @@
-import json
-import logging
 from enum import Enum
-from typing import Dict
+from typing import Any, List, Mapping
 
+import numpy as np
 import pandas as pd
-from importlib_resources import files
 
-from mymoney.utils.data_validation import DataFrameValidation
-
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
+from mymoney.utils.meta_data import ServiceMetaData, get_meta_data_registry
 
 
 class DataType(Enum):
@@ -38,7 +29,7 @@ class Service:
     _service_type = ServiceType.BASE
     _USDs = ["USD", "USDC", "USDT"]
 
-    def __init__(self, inst_meta_data: Dict) -> None:
+    def __init__(self, inst_meta_data: Mapping[str, ServiceMetaData]) -> None:
         md = inst_meta_data.get(self._service_type.value)
         if not md:
             raise Exception(
@@ -47,6 +38,184 @@ class Service:
 
         self._this_meta_data = md
 
+    @staticmethod
+    def _select(
+        index: pd.Index,
+        condlist: List[Any],
+        choicelist: List[Any],
+        default: Any = np.nan,
+    ) -> pd.Series:
+        """Vectorized version of an if/elif/else chain over the rows, like
+        np.select. The choices are kept as Python objects, so strings and
+        NaNs are not cast to a common dtype, and the dtype of the result is
+        inferred the same way `DataFrame.apply` does.
+
+        Args:
+            index (pd.Index):
+                The index of the result.
+            condlist (List[Any]):
+                The boolean masks of the conditions, in order.
+            choicelist (List[Any]):
+                The value (a scalar or an array) for each condition.
+            default (Any):
+                The value for the rows that match no condition.
+                Default is NaN.
+
+        Returns:
+            A Series with the value of the first matching condition
+            for each row.
+        """
+        values = np.select(
+            [np.asarray(cond, dtype=bool) for cond in condlist],
+            [np.asarray(choice, dtype=object) for choice in choicelist],
+            default=np.asarray(default, dtype=object),
+        )
+        return pd.Series(values, index=index, dtype=object).infer_objects()
+
+    @staticmethod
+    def _utc_datetime(ser: pd.Series) -> pd.Series:
+        """Returns `ser` as UTC datetimes. The columns already parsed with
+        the `timezone` of meta_data are only converted, not parsed again.
+
+        Args:
+            ser (pd.Series):
+                The input Series.
+
+        Returns:
+            A Series with `datetime64[ns, UTC]` dtype.
+        """
+        if isinstance(ser.dtype, pd.DatetimeTZDtype):
+            return ser.dt.tz_convert("UTC")
+        return pd.to_datetime(ser, utc=True)
+
+    @staticmethod
+    def _constant_column(index: pd.Index, value: Any) -> pd.Categorical:
+        """Returns a column with `value` in all the rows of `index`.
+        The column is a categorical with a single category, so it takes one
+        byte per row instead of a pointer to a Python string.
+
+        Args:
+            index (pd.Index):
+                The index of the DataFrame the column is for.
+            value (Any):
+                The value of the column.
+
+        Returns:
+            A Categorical with the length of `index`.
+        """
+        if pd.isna(value):
+            return pd.Categorical.from_codes(
+                np.full(len(index), -1, dtype=np.int8), categories=[])
+        return pd.Categorical.from_codes(
+            np.zeros(len(index), dtype=np.int8), categories=[value])
+
+    def _expense_columns(
+        self,
+        input_df: pd.DataFrame,
+        institution: str,
+        account_name: Any,
+        description: pd.Series,
+        amount: pd.Series,
+        date: pd.Series,
+        category: pd.Series = np.nan,
+        my_category: pd.Series = None,
+        strip_description: bool = True,
+    ) -> pd.DataFrame:
+        """Sets the `_new_` columns shared by the expense services.
+
+        Args:
+            input_df (pd.DataFrame):
+                The input DataFrame.
+            institution (str):
+                The name of the institution for `_new_Institution`.
+            account_name (Any):
+                The name of the account as a string, or a Series if it's
+                available in the data.
+            description (pd.Series):
+                The descriptions of the transactions.
+            amount (pd.Series):
+                The amounts of the transactions.
+            date (pd.Series):
+                The dates of the transactions.
+            category (pd.Series):
+                The categories of the institution, if available.
+                Default is NaN.
+            my_category (pd.Series):
+                The initial value of `_new_MyCategory`.
+                Default is `category`.
+            strip_description (bool):
+                Whether to convert `description` to strings and strip them.
+                Default is True.
+
+        Returns:
+            The same DataFrame with the `_new_` columns of expense services.
+        """
+        index = input_df.index
+        if strip_description:
+            description = description.astype(str).str.strip()
+        if not isinstance(account_name, pd.Series):
+            account_name = self._constant_column(index, account_name)
+
+        # Setting a Series as a column copies it in pandas 1.5, so the
+        # `_new_` columns never share data with the input columns even
+        # without an explicit copy.
+        input_df["_new_Description"] = description
+        input_df["_new_Amount"] = amount
+        input_df["_new_Date"] = date
+        input_df["_new_InstitutionCategory"] = category
+        input_df["_new_MyCategory"] = (
+            category if my_category is None else my_category)
+        input_df["_new_Institution"] = self._constant_column(
+            index, institution)
+        input_df["_new_AccountName"] = account_name
+        input_df["_new_Service"] = self._constant_column(
+            index, self._service_type.value)
+        input_df["_new_IsTransfer"] = self._is_transfer_finder(input_df)
+
+        return input_df
+
+    def _is_transfer_finder(self, df: pd.DataFrame) -> pd.Series:
+        """Label the transactions of `df` as `transfer`, `expense`, etc.
+        based on the `transfer_rules` available in meta_data for this
+        specific service.
+
+        Args:
+            df (pd.DataFrame):
+                The input DataFrame.
+
+        Returns:
+            A Series with the label of each transaction.
+        """
+        transfer_rules = self._this_meta_data.get("transfer_rules")
+        if not transfer_rules:
+            raise Exception("Transfer rules are not available.")
+
+        # Each column is only converted once to strings for all the regexes
+        str_cols = {}
+        condlist = []
+        for rule in transfer_rules.rules:
+            mask = np.ones(len(df), dtype=bool)
+            for cond in rule.conditions:
+                ser = df[cond.column]
+                if cond.regex is not None:
+                    if cond.column not in str_cols:
+                        str_cols[cond.column] = ser.astype(str)
+                    ser_mask = str_cols[cond.column].str.contains(
+                        cond.regex, regex=True)
+                elif cond.values is not None:
+                    ser_mask = ser.isin(cond.values)
+                else:
+                    ser_mask = ser.isna() == cond.isna
+                mask &= np.asarray(ser_mask, dtype=bool)
+            condlist.append(mask)
+
+        return self._select(
+            df.index,
+            condlist,
+            [rule.label for rule in transfer_rules.rules],
+            default=transfer_rules.default,
+        )
+
     def _data_validation(self, df: pd.DataFrame) -> pd.DataFrame:
         """Creates the `IsValid` column for the `df` based on the data
         available in meta_data for this specific service.
@@ -58,19 +227,13 @@ class Service:
         Returns:
             The same DataFrame with a new column `_new_IsValid`.
         """
-        val_data = self._this_meta_data.get("validation_data")
-        if not val_data:
+        validation_plan = self._this_meta_data.validation_plan
+        if validation_plan is None:
             raise Exception("Validation data is not available.")
 
-        schema = val_data.get("schema")
-        col_vals = val_data.get("column_values")
-
-        df_validate_instance = DataFrameValidation(df)
-        if schema:
-            df_validate_instance.has_schema(schema)
-        if col_vals:
-            df["_new_IsValid"] = df_validate_instance.has_vals(
-                col_vals_dict=col_vals, return_validation_col=True)
+        report = validation_plan.validate(df)
+        if validation_plan.value_rules:
+            df["_new_IsValid"] = report.is_valid
 
         return df
 
@@ -128,11 +291,14 @@ class Institution:
 
     _this_institution_name = "base"
     _USDs = ["USD", "USDC", "USDT"]
+    # Bump this in the subclass whenever its cleaning output changes,
+    # so the cached outputs of the institution are created again.
+    _cleaner_version = 1
 
     def __init__(self) -> None:
-        self._meta_data = json.loads(
-            files("mymoney").joinpath("meta_data.json").read_text())
-        self._this_meta_data = self._meta_data.get(self._this_institution_name)
+        self._meta_data = get_meta_data_registry()
+        self._this_meta_data = self._meta_data.institution(
+            self._this_institution_name)
 
     def service_executer(
         self,
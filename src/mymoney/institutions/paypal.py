@@ -1,23 +1,14 @@
-import re
-import logging
-
-import numpy as np
 import pandas as pd
 
 from mymoney.institutions import institution_base
-
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
+from mymoney.utils.common import money_to_float
 
 
 class PayPal(institution_base.Institution):
     """A class for PayPal institution's data cleaning functions."""
 
     _this_institution_name = "paypal"
+    _cleaner_version = 2
 
     def __init__(self) -> None:
         super().__init__()
@@ -40,43 +31,19 @@ class PayPal(institution_base.Institution):
                 The same DataFrame with new columns for cleaned data.
             """
 
-            def is_transfer_finder(row):
-                name_is_nan = pd.isna(row["Name"])
-                try:
-                    regex_flag_redundant = re.search(
-                        r"Authorization|Order", str(row["Type"])
-                    )
-                except Exception:
-                    return "consider"
-
-                if regex_flag_redundant:
-                    return "redundant"
-                elif name_is_nan:
-                    return "transfer"
-                elif not (name_is_nan or regex_flag_redundant):
-                    return "expense"
-                else:
-                    return "consider"
-
-            def description_finder(row):
-                if pd.isna(row["Name"]):
-                    out = str(row["Type"])
-                else:
-                    out = f"{str(row['Name'])}: {row['Type']}"
-
-                return out.strip()
-
-            def amount_finder(val):
-                return float(str(val).replace(",", ""))
-
-            input_df["_new_Description"] = input_df.apply(description_finder, axis=1)  # noqa: E501
-            input_df["_new_Amount"] = input_df["Amount"].map(amount_finder)
-            input_df["_new_Date"] = input_df["Date"].copy(deep=True)
-            input_df["_new_InstitutionCategory"] = np.nan
-            input_df["_new_MyCategory"] = np.nan
-            input_df["_new_Institution"] = "PayPal"
-            input_df["_new_AccountName"] = account_name
-            input_df["_new_Service"] = self._service_type.value
-            input_df["_new_IsTransfer"] = input_df.apply(is_transfer_finder, axis=1)  # noqa: E501
-
-            return input_df
+            row_type = input_df["Type"].astype(str)
+            description = self._select(
+                input_df.index,
+                [input_df["Name"].isna()],
+                [row_type],
+                default=input_df["Name"].astype(str) + ": " + row_type,
+            )
+
+            return self._expense_columns(
+                input_df,
+                institution="PayPal",
+                account_name=account_name,
+                description=description,
+                amount=money_to_float(input_df["Amount"]),
+                date=input_df["Date"],
+            )
@@ -0,0 +1,163 @@
+import importlib
+import functools
+from typing import Any, Dict, Iterator
+
+from mymoney.utils.meta_data import (
+    add_institution_meta_data,
+    added_meta_data,
+)
+
+
+class InstitutionRegistry:
+    """Process-wide registry of the supported institutions.
+
+    The institutions are registered by name with their Institution class,
+    or the import path of the class as ``"module:ClassName"``. The modules
+    are only imported when the class of an institution is needed for the
+    first time, so the institutions that are not used are never imported.
+    """
+
+    _builtin_institutions = {
+        "base": "mymoney.institutions.institution_base:Institution",
+        "amex": "mymoney.institutions.amex:AmEx",
+        "capitalone": "mymoney.institutions.capitalone:CapitalOne",
+        "cashapp": "mymoney.institutions.cashapp:CashApp",
+        "chase": "mymoney.institutions.chase:Chase",
+        "citi": "mymoney.institutions.citi:Citi",
+        "coinbase": "mymoney.institutions.coinbase:Coinbase",
+        "cryptodotcom": "mymoney.institutions.cryptodotcom:CryptoDotCom",
+        "discover": "mymoney.institutions.discover:Discover",
+        "paypal": "mymoney.institutions.paypal:PayPal",
+        "samsclub": "mymoney.institutions.samsclub:SamsClub",
+        "sofi": "mymoney.institutions.sofi:SoFi",
+        "uphold": "mymoney.institutions.uphold:Uphold",
+        "venmo": "mymoney.institutions.venmo:Venmo",
+        "wellsfargo": "mymoney.institutions.wellsfargo:WellsFargo",
+    }
+
+    def __init__(self) -> None:
+        self._institutions = dict(self._builtin_institutions)
+        # The institutions added with `register`
+        self._added = {}
+
+    def register(
+        self,
+        name: str,
+        inst_class: type | str,
+        meta_data: Dict[str, Any] = None,
+        replace: bool = False,
+    ):
+        """Register an institution.
+
+        Args:
+            name (str):
+                The name of the institution. It should be the same as the
+                `_this_institution_name` of its class.
+            inst_class (type | str):
+                The Institution subclass, or its import path as
+                ``"module:ClassName"`` to import it on first use.
+            meta_data (Dict[str, Any]):
+                The meta data of its services with the same structure as
+                `meta_data.json`. It's only needed if the institution is
+                not in `meta_data.json`. Default is None.
+            replace (bool):
+                Whether to replace an institution that is already
+                registered with the same name. Default is False.
+
+        Raises:
+            ValueError: If `name` is already registered and `replace`
+                is False.
+        """
+        if name in self._institutions and not replace:
+            raise ValueError(f"Institution `{name}` is already registered.")
+
+        if meta_data is not None:
+            add_institution_meta_data(name, meta_data)
+        self._institutions[name] = inst_class
+        self._added[name] = inst_class
+
+    def get(self, name: str) -> type:
+        """Returns the Institution class of `name`, and imports its module
+        if it's not imported yet.
+
+        Args:
+            name (str):
+                The name of the institution.
+
+        Raises:
+            ValueError: If the institution is not supported.
+        """
+        inst_class = self._institutions.get(name)
+        if inst_class is None:
+            raise ValueError(
+                f"Institution `{name}` is not supported."
+                "\nYou can file an issue and provide more information"
+                " to add the institution.")
+
+        if isinstance(inst_class, str):
+            module_name, class_name = inst_class.split(":")
+            inst_class = getattr(
+                importlib.import_module(module_name), class_name)
+            self._institutions[name] = inst_class
+
+        return inst_class
+
+    def added_institutions(self) -> Dict[str, type | str]:
+        """Returns the institutions added with `register` and their class
+        or import path."""
+        return dict(self._added)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._institutions
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the registered institutions."""
+        return iter(list(self._institutions))
+
+
+@functools.lru_cache(maxsize=None)
+def get_institution_registry() -> InstitutionRegistry:
+    """Create the InstitutionRegistry once per process.
+
+    Returns:
+        The InstitutionRegistry of this process.
+    """
+    return InstitutionRegistry()
+
+
+def register_institution(
+    name: str,
+    inst_class: type | str,
+    meta_data: Dict[str, Any] = None,
+    replace: bool = False,
+):
+    """Register an institution in the registry of this process, so it's
+    detected by DataReader and cleaned by InstData. Refer to
+    `InstitutionRegistry.register` for the arguments."""
+    get_institution_registry().register(
+        name, inst_class, meta_data=meta_data, replace=replace)
+
+
+def registered_institutions() -> Dict[str, Any]:
+    """Returns the institutions registered in this process, to register
+    them in another process with `restore_institutions`."""
+    return {
+        "institutions": get_institution_registry().added_institutions(),
+        "meta_data": added_meta_data(),
+    }
+
+
+def restore_institutions(registered: Dict[str, Any]):
+    """Register the institutions returned by `registered_institutions` of
+    another process in this process. It's used as the initializer of the
+    worker processes, since they only have the built-in institutions if
+    they are not forked.
+
+    Args:
+        registered (Dict[str, Any]):
+            The output of `registered_institutions`.
+    """
+    for name, services in registered["meta_data"].items():
+        add_institution_meta_data(name, services)
+    for name, inst_class in registered["institutions"].items():
+        get_institution_registry().register(name, inst_class, replace=True)
@@ -1,23 +1,14 @@
-import re
-import logging
-
 import numpy as np  # noqa: F401
 import pandas as pd
 
 from mymoney.institutions import institution_base
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
-
-
 class SamsClub(institution_base.Institution):
     """A class for SamsClub institution's data cleaning functions."""
 
     _this_institution_name = "samsclub"
+    _cleaner_version = 2
 
     def __init__(self) -> None:
         super().__init__()
@@ -40,27 +31,11 @@ class SamsClub(institution_base.Institution):
                 The same DataFrame with new columns for cleaned data.
             """
 
-            def is_transfer_finder(val):
-                try:
-                    regex_flag = re.search(
-                        r"AUTOMATIC PAYMENT - THANK YOU", val
-                    )
-                except Exception:
-                    return "consider"
-
-                if regex_flag:
-                    return "transfer"
-                else:
-                    return "expense"
-
-            input_df["_new_Description"] = input_df["Description"].map(lambda val: str(val).strip())  # noqa: E501
-            input_df["_new_Amount"] = input_df["Amount"].copy(deep=True)
-            input_df["_new_Date"] = input_df["Transaction Date"].copy(deep=True)  # noqa: E501
-            input_df["_new_InstitutionCategory"] = np.nan
-            input_df["_new_MyCategory"] = np.nan
-            input_df["_new_Institution"] = "SamsClub"
-            input_df["_new_AccountName"] = account_name
-            input_df["_new_Service"] = self._service_type.value
-            input_df["_new_IsTransfer"] = input_df["Description"].map(is_transfer_finder)  # noqa: E501
-
-            return input_df
+            return self._expense_columns(
+                input_df,
+                institution="SamsClub",
+                account_name=account_name,
+                description=input_df["Description"],
+                amount=input_df["Amount"],
+                date=input_df["Transaction Date"],
+            )
@@ -1,22 +1,14 @@
-import logging
-
 import numpy as np
 import pandas as pd
 
 from mymoney.institutions import institution_base
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
-
-
 class SoFi(institution_base.Institution):
     """A class for SoFi institution's data cleaning functions."""
 
     _this_institution_name = "sofi"
+    _cleaner_version = 2
 
     def __init__(self) -> None:
         super().__init__()
@@ -39,20 +31,14 @@ class SoFi(institution_base.Institution):
                 The same DataFrame with new columns for cleaned data.
             """
 
-            def is_transfer_finder(val):
-                if val in ["Withdrawal", "Deposit"]:
-                    return "transfer"
-                else:
-                    return "expense"
-
-            input_df["_new_Description"] = input_df["Description"].copy(deep=True)  # noqa: E501
-            input_df["_new_Amount"] = input_df["Amount"].copy(deep=True)  # noqa: E501
-            input_df["_new_Date"] = input_df["Date"].copy(deep=True)
-            input_df["_new_InstitutionCategory"] = input_df["Type"].copy(deep=True)  # noqa: E501
-            input_df["_new_MyCategory"] = np.nan
-            input_df["_new_Institution"] = "SoFi"
-            input_df["_new_AccountName"] = account_name
-            input_df["_new_Service"] = self._service_type.value
-            input_df["_new_IsTransfer"] = input_df["Type"].map(is_transfer_finder)  # noqa: E501
-
-            return input_df
+            return self._expense_columns(
+                input_df,
+                institution="SoFi",
+                account_name=account_name,
+                description=input_df["Description"],
+                amount=input_df["Amount"],
+                date=input_df["Date"],
+                category=input_df["Type"],
+                my_category=np.nan,
+                strip_description=False,
+            )
@@ -1,22 +1,14 @@
-import logging
-
-import numpy as np
 import pandas as pd
 
 from mymoney.institutions import institution_base
-
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
+from mymoney.utils.common import money_to_float
 
 
 class Venmo(institution_base.Institution):
     """A class for Venmo institution's data cleaning functions."""
 
     _this_institution_name = "venmo"
+    _cleaner_version = 2
 
     def __init__(self) -> None:
         super().__init__()
@@ -39,57 +31,37 @@ class Venmo(institution_base.Institution):
                 The same DataFrame with new columns for cleaned data.
             """
 
-            def is_transfer_finder(val):
-                transfer_list = ["Standard Transfer", "Credit Card Payment"]
-                expense_list = [
-                    "Payment", "Charge",
-                    "Merchant Transaction", "Credit Card Reward"
-                ]
-                if val in transfer_list:
-                    return "transfer"
-                elif val in expense_list:
-                    return "expense"
-                else:
-                    return "consider"
-
-            def amount_finder(row):
-                float_amount = float(
-                    str(row["Amount (total)"])
-                    .replace(" $", "").replace(",", ""))
-
-                if row["Type"] == "Credit Card Payment":
-                    return -float_amount
-                else:
-                    return float_amount
-
-            def description_finder(row):
-                row_type = row["Type"]
-                if row_type == "Standard Transfer":
-                    out = f"transfer to {row['Destination']}"
-                elif row_type == "Merchant Transaction":
-                    out = row["To"]
-                elif row_type == "Payment":
-                    out = f"{row['From']} -> {row['To']}: {row['Note']}"
-                elif row_type == "Charge":
-                    out = f"{row['To']} -> {row['From']}: {row['Note']}"
-                elif row_type in ["Credit Card Payment", "Credit Card Reward"]:
-                    out = row_type
-                else:
-                    out = (
-                        f"Consider: {row['Note']}:"
-                        f" {row['From']} -> {row['To']}. (Type: {row_type})"
-                    )
-
-                return out.strip()
-
-            input_df["_new_Description"] = input_df.apply(description_finder, axis=1)  # noqa: E501
-            input_df["_new_Amount"] = input_df.apply(amount_finder, axis=1)
-            input_df["_new_Date"] = input_df["Datetime"].copy(deep=True)
-            input_df["_new_InstitutionCategory"] = np.nan
-            input_df["_new_MyCategory"] = np.nan
-            input_df["_new_Institution"] = "Venmo"
-            input_df["_new_AccountName"] = account_name
-            input_df["_new_Service"] = self._service_type.value
-            input_df["_new_IsTransfer"] = input_df["Type"].map(is_transfer_finder)  # noqa: E501
+            row_type = input_df["Type"]
+            from_ = input_df["From"].astype(str)
+            to = input_df["To"].astype(str)
+            note = input_df["Note"].astype(str)
+
+            description = self._select(
+                input_df.index,
+                [row_type == "Standard Transfer",
+                 row_type == "Merchant Transaction",
+                 row_type == "Payment",
+                 row_type == "Charge",
+                 row_type.isin(["Credit Card Payment", "Credit Card Reward"])],
+                ["transfer to " + input_df["Destination"].astype(str),
+                 input_df["To"],
+                 from_ + " -> " + to + ": " + note,
+                 to + " -> " + from_ + ": " + note,
+                 row_type],
+                default=(
+                    "Consider: " + note + ": " + from_ + " -> " + to
+                    + ". (Type: " + row_type.astype(str) + ")"),
+            )
+            amount = money_to_float(input_df["Amount (total)"])
+            amount = amount.mask(row_type == "Credit Card Payment", -amount)
+
+            input_df = self._expense_columns(
+                input_df,
+                institution="Venmo",
+                account_name=account_name,
+                description=description,
+                amount=amount,
+                date=input_df["Datetime"],
+            )
 
             return input_df.dropna(subset=["_new_Date"])
@@ -3,19 +3,10 @@ from typing import Dict
 
 import numpy as np  # noqa: F401
 import pandas as pd
-import gspread
-from gspread_dataframe import set_with_dataframe
 
 from mymoney.utils.common import raise_or_log
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
-
-
 class SheetsOperations:
     """A class for using google sheets as a storage option.
 
@@ -58,6 +49,9 @@ class SheetsOperations:
             sheet_name (str):
                 The title of the spreadsheet.
         """
+        # gspread is only imported when the sheets are used
+        import gspread
+
         # Authentication
         if isinstance(creds, str):
             self._gc = gspread.service_account(filename=creds)
@@ -146,6 +140,8 @@ class SheetsOperations:
         if not self._is_sheets_structure_exists(
             sheet_name=sheet_name, logs=False
         ):
+            import gspread
+
             try:
                 self._the_sheet = self._gc.open(sheet_name)
             except gspread.exceptions.SpreadsheetNotFound:
@@ -205,6 +201,8 @@ class SheetsOperations:
         else:
             tmp_wsheet = self._the_sheet.worksheet(wsheet_name)
 
+        from gspread_dataframe import set_with_dataframe
+
         set_with_dataframe(tmp_wsheet, df)
         logging.info("Done!")
 
@@ -1,12 +1,28 @@
 from mymoney.utils.common import (
     raise_or_log,
     column_name_checker,
+    money_to_float,
+    concat_dataframes,
 )
 
-from mymoney.utils.data_validation import DataFrameValidation
+from mymoney.utils.data_validation import (
+    DataFrameValidation,
+    StreamingNStdValidator,
+)
+from mymoney.utils.meta_data import (
+    MetaDataRegistry,
+    ServiceMetaData,
+    get_meta_data_registry,
+)
 
 __all__ = [
     "raise_or_log",
     "column_name_checker",
+    "money_to_float",
+    "concat_dataframes",
     "DataFrameValidation",
+    "StreamingNStdValidator",
+    "MetaDataRegistry",
+    "ServiceMetaData",
+    "get_meta_data_registry",
 ]
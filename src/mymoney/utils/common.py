@@ -1,18 +1,14 @@
+import string
 import logging
-from typing import List
+from typing import Iterable, List
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 
 from mymoney.utils.exceptions import DifferentColumnNameException
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
-
-
 def raise_or_log(
     message: str,
     logs: bool = True,
@@ -79,3 +75,83 @@ def column_name_checker(
             "`mode` should be one of the following:"
             " ['equal', 'subset', 'superset']"
         )
+
+
+# Characters removed from the money values before parsing them
+_money_chars_table = str.maketrans("", "", "$," + string.whitespace)
+
+
+def money_to_float(ser: pd.Series) -> pd.Series:
+    """Parse the money values of `ser` like "$1,234.56", "-$12.00" or
+    "- $12.00" to floats. The dollar signs, thousands separators and
+    whitespaces are removed before parsing. NaNs stay NaN.
+
+    Args:
+        ser (pd.Series):
+            The Series of money values.
+
+    Returns:
+        A Series of floats.
+
+    Raises:
+        ValueError: if a value can't be parsed.
+    """
+    if pd.api.types.is_numeric_dtype(ser):
+        return ser.astype(float)
+
+    return ser.astype(str).str.translate(_money_chars_table).astype(float)
+
+
+def _object_categorical(ser: pd.Series) -> pd.Categorical:
+    """Returns `ser` as a Categorical with object categories, so it can be
+    combined with the categoricals of the other files whatever the type of
+    their values."""
+    cat = pd.Categorical(ser)
+    if cat.categories.dtype != object:
+        cat = pd.Categorical.from_codes(
+            cat.codes, categories=pd.Index(cat.categories, dtype=object))
+    return cat
+
+
+def concat_dataframes(dfs: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate `dfs` like pd.concat with `ignore_index=True`, but keep
+    the categorical columns categorical. The categories of each column are
+    the sorted union of its categories in all of `dfs`, whereas pd.concat
+    would fall back to object dtype if they are different.
+
+    Args:
+        dfs (Iterable[pd.DataFrame]):
+            The DataFrames to concatenate.
+
+    Returns:
+        The concatenated DataFrame.
+    """
+    dfs = list(dfs)
+    if not dfs:
+        return pd.DataFrame()
+
+    columns = list(dict.fromkeys(col for df in dfs for col in df.columns))
+    cat_columns = [
+        col for col in columns
+        if any(
+            isinstance(df.dtypes.get(col), pd.CategoricalDtype) for df in dfs)
+    ]
+
+    out_df = pd.concat(
+        [df.drop(columns=[col for col in cat_columns if col in df.columns])
+         for df in dfs],
+        ignore_index=True,
+    )
+    for col in cat_columns:
+        cats = [
+            _object_categorical(df[col]) if col in df.columns
+            else pd.Categorical(np.full(len(df), np.nan, dtype=object))
+            for df in dfs
+        ]
+        try:
+            out_df[col] = union_categoricals(cats, sort_categories=True)
+        except TypeError:
+            # The categories can't be sorted, e.g. strings and numbers
+            out_df[col] = union_categoricals(cats)
+
+    return out_df[columns]
@@ -1,5 +1,7 @@
-import logging
-from typing import Any, List, Tuple, Dict, Union
+import re
+import time
+import dataclasses
+from typing import Any, Callable, List, Mapping, Tuple, Dict, Union
 
 import numpy as np
 import pandas as pd
@@ -7,11 +9,51 @@ import pandas as pd
 from mymoney.utils.common import raise_or_log
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(name)s\t[%(asctime)s] %(levelname)s: %(message)s",
-    datefmt="%b/%d/%y %I:%M:%S %p",
-)
+# The dtype checker of each accepted dtype string
+_dtype_checkers = {
+    "object": pd.api.types.is_object_dtype,
+    "bool": pd.api.types.is_bool_dtype,
+    "string": pd.api.types.is_string_dtype,
+    "str": pd.api.types.is_string_dtype,
+    # number related
+    "numeric": pd.api.types.is_numeric_dtype,
+    "float": pd.api.types.is_float_dtype,
+    "complex": pd.api.types.is_complex_dtype,
+    "int": pd.api.types.is_integer_dtype,
+    "int64": pd.api.types.is_int64_dtype,
+    # signed or unsigned int
+    **dict.fromkeys(
+        ["signed_int", "signed-int", "signed int", "signedint", "sint"],
+        pd.api.types.is_signed_integer_dtype,
+    ),
+    **dict.fromkeys(
+        ["unsigned_int", "unsigned-int",
+         "unsigned int", "unsignedint", "uint"],
+        pd.api.types.is_unsigned_integer_dtype,
+    ),
+    # time related
+    "datetime": pd.api.types.is_datetime64_any_dtype,
+    "datetime64": pd.api.types.is_datetime64_dtype,
+    "datetime64_ns": pd.api.types.is_datetime64_ns_dtype,
+    "datetime64tz": pd.api.types.is_datetime64tz_dtype,
+    "timedelta64": pd.api.types.is_timedelta64_dtype,
+    "timedelta64_ns": pd.api.types.is_timedelta64_ns_dtype,
+}
+_n_std_modes = ["n_std", "n-std", "n std", "nstd"]
+
+
+@dataclasses.dataclass(frozen=True)
+class NumericCheck:
+    """The `values` of the 'numeric' mode, like ``{"decimals": 2,
+    "min": 0}``. The checks are done with arithmetic on the numbers, so
+    the values are never turned into strings."""
+    # The maximum number of decimal places
+    decimals: int = None
+    # The inclusive bounds of the values
+    min: float = None
+    max: float = None
+    # Whether NaN and infinite values are faulty
+    finite: bool = True
 
 
 @pd.api.extensions.register_series_accessor("validate")
@@ -59,51 +101,13 @@ class SeriesValidation:
         Returns:
             A boolean value
         """
-        signed_ints = [
-            "signed_int", "signed-int", "signed int", "signedint", "sint"
-        ]
-        unsigned_ints = [
-            "unsigned_int", "unsigned-int", "unsigned int",
-            "unsignedint", "uint"
-        ]
-        if dtype == "object":
-            result = pd.api.types.is_object_dtype(self._obj)
-        elif dtype == "bool":
-            result = pd.api.types.is_bool_dtype(self._obj)
-        elif dtype in ["string", "str"]:
-            result = pd.api.types.is_string_dtype(self._obj)
-        elif dtype == "numeric":
-            result = pd.api.types.is_numeric_dtype(self._obj)
-        elif dtype == "float":
-            result = pd.api.types.is_float_dtype(self._obj)
-        elif dtype == "complex":
-            result = pd.api.types.is_complex_dtype(self._obj)
-        elif dtype == "int":
-            result = pd.api.types.is_integer_dtype(self._obj)
-        elif dtype == "int64":
-            result = pd.api.types.is_int64_dtype(self._obj)
-        elif dtype in signed_ints:
-            result = pd.api.types.is_signed_integer_dtype(self._obj)
-        elif dtype in unsigned_ints:
-            result = pd.api.types.is_unsigned_integer_dtype(self._obj)
-        elif dtype == "datetime":
-            result = pd.api.types.is_datetime64_any_dtype(self._obj)
-        elif dtype == "datetime64":
-            result = pd.api.types.is_datetime64_dtype(self._obj)
-        elif dtype == "datetime64_ns":
-            result = pd.api.types.is_datetime64_ns_dtype(self._obj)
-        elif dtype == "datetime64tz":
-            result = pd.api.types.is_datetime64tz_dtype(self._obj)
-        elif dtype == "timedelta64":
-            result = pd.api.types.is_timedelta64_dtype(self._obj)
-        elif dtype == "timedelta64_ns":
-            result = pd.api.types.is_timedelta64_ns_dtype(self._obj)
-        else:
+        is_dtype = _dtype_checkers.get(dtype)
+        if is_dtype is None:
             raise ValueError(
                 f"This function doesn't support for `{dtype}` checking."
             )
 
-        return result
+        return is_dtype(self._obj)
 
     def _check_no_x(self, values: List):
         """Check whether the Series doesn't contain `values`.
@@ -118,32 +122,50 @@ class SeriesValidation:
             return self._find_faulty_indexes(~new_ser)
         return True
 
-    def _check_vals(
-        self, values, mode: str, na_action: str = None
-    ) -> Union[bool, Dict[str, List[int]]]:
-        """Check whether the Series contains `values`.
+    def _faulty_rows(
+        self, faulty: np.ndarray, index: pd.Index, return_mask: bool
+    ) -> Dict[str, Any]:
+        """Create the error dictionary for the rows that cause problem.
+
+        Args:
+            faulty (np.ndarray):
+                A boolean array that is True for the rows that cause problem.
+            index (pd.Index):
+                The index of the checked values.
+            return_mask (bool):
+                Whether to return the rows as a boolean mask of the whole
+                Series, or as a list of indexes.
+
+        Returns:
+            {"mask": a boolean Series} if `return_mask` is True,
+            {"idxs": a list of indexes} otherwise.
+        """
+        if not return_mask:
+            return {"idxs": list(index[faulty])}
+
+        mask = faulty
+        if len(faulty) != len(self._obj):
+            # The NaNs are left out by `na_action` and are not faulty
+            mask = np.zeros(len(self._obj), dtype=bool)
+            mask[self._obj.notnull().to_numpy()] = faulty
+        return {"mask": pd.Series(mask, index=self._obj.index)}
+
+    @staticmethod
+    def _compile_vals(values, mode: str) -> Tuple[str, Any]:
+        """Check `values` for `mode` and convert them to the form used by
+        `_eval_vals`, so they can be checked once and used many times.
 
         Args:
             values:
                 Values to check for in the Series.
             mode (str):
-                Accepted values: [
-                    'range' -> the Series are in the range of `values`,
-                    'regex' -> values of the Series have the `values`
-                        regex pattern,
-                    ('n_std' or 'n-std' or 'n std', 'nstd') -> values of
-                        the Series are within `values` standard deviation
-                        of the mean,
-                    'equal' -> values of the Series are exactly like `values`,
-                    'subset' -> `values` is subset of values in the Series,
-                    'superset' -> `values` is superset of values in the Series,
-                ]
-            na_action (str):
-                If 'ignore', it won't include NaNs in the process.
+                Refer to `_check_vals` for the accepted values.
+
+        Returns:
+            The normalized mode and the compiled values as a tuple. The
+            regex patterns are compiled and the values of 'equal',
+            'subset' and 'superset' modes are turned into a frozenset.
         """
-        to_check_ser = self._obj
-        if na_action == "ignore":
-            to_check_ser = self._obj[self._obj.notnull()]
         if mode == "range":
             # Type error checking
             if not len(values) == 2:
@@ -151,39 +173,19 @@ class SeriesValidation:
                     "For mode=range the `values` should be"
                     " a list or tuple with 2 elements."
                 )
-
-            new_ser = to_check_ser[
-                (to_check_ser < values[0]) | (to_check_ser > values[1])
-            ]
-            if not new_ser.empty:
-                return {"idxs": self._find_faulty_indexes(new_ser)}
-            return True
+            return mode, tuple(values)
         elif mode == "regex":
             # Regex compilable type error checking
             if not pd.api.types.is_re_compilable(values):
                 raise ValueError("`values` is not a regex compilable string.")
-
-            new_ser = to_check_ser.astype(str).str.contains(
-                values, na=False, regex=True
-            )
-            if not new_ser.all():
-                return {"idxs": self._find_faulty_indexes(new_ser)}
-            return True
-        elif mode in ["n_std", "n-std", "n std", "nstd"]:
+            return mode, re.compile(values)
+        elif mode in _n_std_modes:
             # Type error checking
-            if not pd.api.types.is_numeric_dtype(to_check_ser):
-                raise Exception("This series does not contain numeric values.")
             if not isinstance(values, (int, float)):
                 raise ValueError(
                     "`values` for mode 'n-std' should be int or float."
                 )
-
-            mean, std = to_check_ser.mean(), to_check_ser.std()
-            dist_from_mean_ser = np.abs(to_check_ser - mean)
-            outliers = dist_from_mean_ser[dist_from_mean_ser > values * std]
-            if not outliers.empty:
-                return {"idxs": self._find_faulty_indexes(outliers)}
-            return True
+            return "n_std", values
         elif mode in ["equal", "subset", "superset"]:
             # Type error checking
             if not isinstance(values, (list, set, np.ndarray)):
@@ -191,36 +193,157 @@ class SeriesValidation:
                     "`values` should be one of the following types:"
                     " 'list', 'set', 'np.ndarray'."
                 )
+            return mode, frozenset(values)
+        elif mode == "numeric":
+            # Type error checking
+            fields = {field.name for field in dataclasses.fields(NumericCheck)}
+            if not isinstance(values, Mapping) or not set(values) <= fields:
+                raise ValueError(
+                    "`values` for mode 'numeric' should be a dictionary with"
+                    f" some of the following keys: {sorted(fields)}."
+                )
+            return mode, NumericCheck(**values)
+        else:
+            raise Exception(
+                "mode should be one of the following:"
+                "\n['range', 'regex', ('n_std' or 'n-std' or 'n std'),"
+                " 'equal', 'subset', 'superset', 'numeric']"
+            )
+
+    @staticmethod
+    def _numeric_faulty(ser: pd.Series, check: NumericCheck) -> np.ndarray:
+        """Find the values of `ser` that don't pass the 'numeric' mode.
+
+        Args:
+            ser (pd.Series):
+                The values to check. The values that are not numbers are
+                faulty.
+            check (NumericCheck):
+                The compiled values of the 'numeric' mode.
 
-            ser_unique_vals_set = set(to_check_ser.unique())
-            vals_set = set(values)
-            if mode == "equal":
-                if vals_set != ser_unique_vals_set:
-                    ser_extra = ser_unique_vals_set - vals_set
-                    values_extra = vals_set - ser_unique_vals_set
+        Returns:
+            A boolean array that is True for the faulty values.
+        """
+        is_integer = pd.api.types.is_integer_dtype(ser)
+        if (
+            not pd.api.types.is_numeric_dtype(ser)
+            or pd.api.types.is_bool_dtype(ser)
+        ):
+            ser = pd.to_numeric(ser, errors="coerce")
+        arr = ser.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        is_finite = np.isfinite(arr)
+        faulty = ~is_finite if check.finite else np.zeros(len(arr), bool)
+        if check.decimals is not None and not is_integer:
+            # A number with at most `decimals` decimal places doesn't
+            # change by rounding, like the numbers read from the files
+            with np.errstate(invalid="ignore"):
+                faulty |= (np.round(arr, check.decimals) != arr) & is_finite
+        if check.min is not None:
+            faulty |= arr < check.min
+        if check.max is not None:
+            faulty |= arr > check.max
+        return faulty
+
+    def _eval_vals(
+        self,
+        values,
+        mode: str,
+        na_action: str = None,
+        return_mask: bool = False,
+    ) -> Union[bool, Dict[str, Any]]:
+        """Same as `_check_vals`, but with `values` and `mode` already
+        compiled by `_compile_vals`."""
+        to_check_ser = self._obj
+        if na_action == "ignore":
+            to_check_ser = self._obj[self._obj.notnull()]
+
+        match mode:
+            case "range":
+                faulty = (
+                    (to_check_ser < values[0]) | (to_check_ser > values[1])
+                ).to_numpy(bool)
+            case "regex":
+                faulty = ~to_check_ser.astype(str).str.contains(
+                    values, na=False, regex=True
+                ).to_numpy(bool)
+            case "n_std":
+                if not pd.api.types.is_numeric_dtype(to_check_ser):
+                    raise Exception(
+                        "This series does not contain numeric values.")
+                mean, std = to_check_ser.mean(), to_check_ser.std()
+                faulty = (
+                    np.abs(to_check_ser - mean) > values * std).to_numpy(bool)
+            case "equal":
+                ser_unique_vals_set = set(to_check_ser.unique())
+                if values != ser_unique_vals_set:
+                    ser_extra = ser_unique_vals_set - values
+                    values_extra = values - ser_unique_vals_set
                     return {
-                        "idxs": self._find_faulty_indexes(
-                            ~to_check_ser.isin(ser_extra)
-                        ),
+                        **self._faulty_rows(
+                            to_check_ser.isin(ser_extra).to_numpy(bool),
+                            to_check_ser.index, return_mask),
                         "extra_vals": list(values_extra)
                     }
                 return True
-            elif mode == "subset":
-                if not vals_set.issubset(ser_unique_vals_set):
-                    return {"extra_vals": list(vals_set - ser_unique_vals_set)}
+            case "subset":
+                ser_unique_vals_set = set(to_check_ser.unique())
+                if not values.issubset(ser_unique_vals_set):
+                    return {"extra_vals": list(values - ser_unique_vals_set)}
                 return True
-            elif mode == "superset":
-                if not vals_set.issuperset(ser_unique_vals_set):
-                    return {"idxs": self._find_faulty_indexes(
-                        to_check_ser.isin(values)
-                    )}
-                return True
-        else:
-            raise Exception(
-                "mode should be one of the following:"
-                "\n['range', 'regex', ('n_std' or 'n-std' or 'n std'),"
-                " 'equal', 'subset', 'superset']"
-            )
+            case "numeric":
+                faulty = self._numeric_faulty(to_check_ser, values)
+            case "superset":
+                # The unique values are cheaper to check than the rows
+                if values.issuperset(to_check_ser.unique()):
+                    return True
+                faulty = ~to_check_ser.isin(values).to_numpy(bool)
+
+        if faulty.any():
+            return self._faulty_rows(faulty, to_check_ser.index, return_mask)
+        return True
+
+    def _check_vals(
+        self,
+        values,
+        mode: str,
+        na_action: str = None,
+        return_mask: bool = False,
+    ) -> Union[bool, Dict[str, Any]]:
+        """Check whether the Series contains `values`.
+
+        Args:
+            values:
+                Values to check for in the Series.
+            mode (str):
+                Accepted values: [
+                    'range' -> the Series are in the range of `values`,
+                    'regex' -> values of the Series have the `values`
+                        regex pattern,
+                    ('n_std' or 'n-std' or 'n std', 'nstd') -> values of
+                        the Series are within `values` standard deviation
+                        of the mean,
+                    'equal' -> values of the Series are exactly like `values`,
+                    'subset' -> `values` is subset of values in the Series,
+                    'superset' -> `values` is superset of values in the Series,
+                    'numeric' -> values of the Series are numbers with
+                        at most `decimals` decimal places, between `min`
+                        and `max` and finite, e.g. {"decimals": 2},
+                ]
+            na_action (str):
+                If 'ignore', it won't include NaNs in the process.
+            return_mask (bool):
+                Whether to return the faulty rows as a boolean Series under
+                the "mask" key instead of a list of indexes under the "idxs"
+                key. The mask has the index of the whole Series and is True
+                for the faulty rows. Default is False.
+
+        Returns:
+            True if the Series passes the check, otherwise a dictionary
+            with the faulty rows and/or the extra values.
+        """
+        mode, values = self._compile_vals(values, mode)
+        return self._eval_vals(values, mode, na_action, return_mask)
 
     def has_dtype(
         self,
@@ -287,6 +410,7 @@ class SeriesValidation:
         na_action: str = None,
         logs: bool = True,
         raises: bool = False,
+        sample_size: int = 10,
     ):
         """Check whether the Series contains `values`.
 
@@ -304,6 +428,9 @@ class SeriesValidation:
                     'equal' -> values of the Series are exactly like `values`,
                     'subset' -> `values` is subset of values in the Series,
                     'superset' -> `values` is superset of values in the Series,
+                    'numeric' -> values of the Series are numbers with
+                        at most `decimals` decimal places, between `min`
+                        and `max` and finite, e.g. {"decimals": 2},
                 ]
             na_action (str):
                 If 'ignore', it won't include NaNs in the process.
@@ -311,47 +438,61 @@ class SeriesValidation:
                 Whether to log the results if something went wrong.
             raises (bool):
                 Whether to raise an error or not.
+            sample_size (int):
+                The maximum number of faulty indexes in the message.
+                Default is 10.
         """
-        error_dict = self._check_vals(values, mode, na_action)
+        error_dict = self._check_vals(
+            values, mode, na_action, return_mask=True)
         if not (error_dict is True):
+            rule_report = RuleReport(
+                column=self._obj.name,
+                rule=mode,
+                expected=values,
+                passed=False,
+                extra_vals=error_dict.get("extra_vals"),
+            )
+            if "mask" in error_dict:
+                faulty_pos = np.flatnonzero(error_dict["mask"].to_numpy())
+                rule_report.n_faulty = len(faulty_pos)
+                rule_report.faulty_sample = list(
+                    self._obj.index[faulty_pos[:sample_size]])
+
             msg = ""
             if mode == "range":
                 msg = (
                     "Some of the values of this series are not in the range"
                     " specified in `values`."
-                    f"\nThe indexes: {error_dict['idxs']}"
                 )
             elif mode == "regex":
                 msg = (
                     "Some of the values of this series doesn't match with"
-                    " the regex `{values}`."
-                    f"\nThe indexes: {error_dict['idxs']}"
+                    f" the regex `{values}`."
                 )
             elif mode in ["n_std", "n-std", "n std", "nstd"]:
                 msg = (
                     "Some of the values of this series are not within"
                     f" `{values}` of standard deviations."
-                    f"\nThe indexes: {error_dict['idxs']}"
                 )
             elif mode == "equal":
-                msg = (
-                    "The `values` is not equal to the values in the Series."
-                    f"\nExtra values in `values`: {error_dict['extra_vals']}"
-                    "\nIndex of extra values in the series:"
-                    f" {error_dict['idxs']}"
-                )
+                msg = "The `values` is not equal to the values in the Series."
             elif mode == "subset":
                 msg = (
                     "The `values` is not subset of the values in"
-                    f" the Series.\nExtra values: {error_dict['extra_vals']}"
+                    " the Series."
                 )
             elif mode == "superset":
                 msg = (
                     "The `values` is not superset of the values in"
-                    f" the Series.\nThe indexes: {error_dict['idxs']}"
+                    " the Series."
+                )
+            elif mode == "numeric":
+                msg = (
+                    "Some of the values of this series are not numbers"
+                    f" with `{values}`."
                 )
 
-            raise_or_log(msg, logs, raises)
+            raise_or_log(msg + rule_report.details(), logs, raises)
 
 
 class DataFrameValidation:
@@ -415,15 +556,8 @@ class DataFrameValidation:
             raises (bool):
                 Whether to raise an error or not.
         """
-        for col, dtype in schema.items():
-            if col not in self._obj.columns:
-                continue
-            if not self._obj[col].validate._check_dtype(dtype):
-                msg = (
-                    f"\n{col} has the wrong dtype."
-                    f"\nShould be ({dtype}), is ({self._obj[col].dtype})"
-                )
-                raise_or_log(msg, logs, raises, Exception)
+        compile_validation_plan({"schema": schema}).validate(
+            self._obj, logs, raises)
 
     def has_dtypes(
         self,
@@ -469,24 +603,439 @@ class DataFrameValidation:
             raises (bool):
                 Whether to raise an error or not.
         """
-        faulty_idxs = []
-        for col, val_args in col_vals_dict.items():
-            if col not in self._obj.columns:
-                continue
-            vals_error = self._obj[col].validate._check_vals(**val_args)
-            if not (vals_error is True):
-                faulty_idxs.extend(vals_error["idxs"])
-                msg = (
-                    f"Column `{col}` has the wrong value."
-                    f"\nShould be ({val_args['values']})"
-                    f"\nErrors: {vals_error}\n"
-                )
-                raise_or_log(msg, logs, raises, Exception)
+        report = compile_validation_plan(
+            {"column_values": col_vals_dict}).validate(self._obj, logs, raises)
 
         if return_validation_col:
-            faulty_idxs_unique = list(set(faulty_idxs))
-            # Create a Series based on `faulty_idxs_unique`
-            return pd.Series({
-                idx: False if idx in faulty_idxs_unique else True
-                for idx in self._obj.index
+            return report.is_valid
+
+    def validate(
+        self,
+        validation_data: Dict[str, Any],
+        logs: bool = True,
+        raises: bool = False,
+        sample_size: int = 10,
+    ) -> "ValidationReport":
+        """Check the schema and the column values of the DataFrame, and
+        report the results of each rule.
+
+        Args:
+            validation_data (Dict[str, Any]):
+                A dictionary with the optional "schema" and "column_values"
+                keys. Refer to `has_schema` and `has_vals` for their values.
+            logs (bool):
+                Whether to log a summary of the failed rules.
+            raises (bool):
+                Whether to raise an error or not.
+            sample_size (int):
+                The maximum number of faulty indexes kept for each rule.
+                Default is 10.
+
+        Returns:
+            A ValidationReport object.
+        """
+        return compile_validation_plan(validation_data).validate(
+            self._obj, logs, raises, sample_size)
+
+
+@dataclasses.dataclass
+class RuleReport:
+    """The result of a rule of a ValidationPlan."""
+    column: str
+    # "dtype" for the schema, otherwise the mode of the value rule
+    rule: str
+    # The dtype or the values that the column should have
+    expected: Any
+    passed: bool = True
+    # The number of the faulty rows, and the first of their indexes
+    n_faulty: int = 0
+    faulty_sample: List = dataclasses.field(default_factory=list)
+    # The values of the rule that are missing in the column
+    extra_vals: List = None
+    # The dtype of the column, only for the schema
+    dtype: str = None
+    # The time it took to check the rule in seconds
+    elapsed: float = 0.0
+
+    def summary(self) -> str:
+        """Returns a short message about the failure of the rule."""
+        if self.rule == "dtype":
+            return (
+                f"\n{self.column} has the wrong dtype."
+                f"\nShould be ({self.expected}), is ({self.dtype})"
+            )
+
+        return (
+            f"Column `{self.column}` has the wrong value."
+            f"\nShould be ({self.expected})"
+        ) + self.details()
+
+    def details(self) -> str:
+        """Returns the number of the faulty rows with the first of their
+        indexes, and the missing values of the rule."""
+        msg = ""
+        if self.n_faulty:
+            msg += (
+                f"\nFaulty rows: {self.n_faulty},"
+                f" first indexes: {self.faulty_sample}"
+            )
+        if self.extra_vals:
+            msg += f"\nMissing values: {self.extra_vals}"
+        return msg
+
+
+@dataclasses.dataclass
+class ValidationReport:
+    """The results of validating a DataFrame with a ValidationPlan."""
+    rules: List[RuleReport]
+    # False for the rows that don't pass the value rules
+    is_valid: pd.Series
+
+    @property
+    def passed(self) -> bool:
+        """Whether all the rules are passed."""
+        return all(rule.passed for rule in self.rules)
+
+    @property
+    def failed(self) -> List[RuleReport]:
+        """The rules that are not passed."""
+        return [rule for rule in self.rules if not rule.passed]
+
+    @property
+    def n_invalid(self) -> int:
+        """The number of the rows that don't pass the value rules."""
+        return int((~self.is_valid.to_numpy()).sum())
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the results of the rules as a DataFrame with a row
+        for each rule."""
+        return pd.DataFrame(
+            [dataclasses.asdict(rule) for rule in self.rules],
+            columns=[field.name for field in dataclasses.fields(RuleReport)],
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class ValueRule:
+    """A rule of `column_values` with its values checked and compiled
+    by `SeriesValidation._compile_vals`."""
+    column: str
+    mode: str
+    # The values as they are given, for the messages
+    values: Any
+    compiled_values: Any
+    na_action: str = None
+
+
+@dataclasses.dataclass(frozen=True)
+class ValidationPlan:
+    """The `validation_data` of a service compiled once, so validating
+    a DataFrame only runs the checks themselves."""
+    # (column, dtype, dtype checker) tuples
+    schema: Tuple[Tuple[str, str, Callable[[Any], bool]], ...]
+    value_rules: Tuple[ValueRule, ...]
+
+    def validate(
+        self,
+        df: pd.DataFrame,
+        logs: bool = True,
+        raises: bool = False,
+        sample_size: int = 10,
+    ) -> ValidationReport:
+        """Check the schema and the column values of `df` in one pass over
+        its columns. Only a summary of each failed rule is logged.
+
+        Args:
+            df (pd.DataFrame):
+                The DataFrame to validate.
+            logs (bool):
+                Whether to log a summary of the failed rules.
+            raises (bool):
+                Whether to raise an error or not.
+            sample_size (int):
+                The maximum number of faulty indexes kept for each rule.
+                Default is 10.
+
+        Returns:
+            A ValidationReport object.
+        """
+        rule_reports = []
+        for col, dtype, is_dtype in self.schema:
+            if col not in df.columns:
+                continue
+            start = time.perf_counter()
+            ser = df[col]
+            rule_report = RuleReport(
+                column=col,
+                rule="dtype",
+                expected=dtype,
+                passed=bool(is_dtype(ser)),
+                dtype=str(ser.dtype),
+            )
+            rule_report.elapsed = time.perf_counter() - start
+            rule_reports.append(rule_report)
+            if not rule_report.passed:
+                raise_or_log(rule_report.summary(), logs, raises, Exception)
+
+        is_valid = np.ones(len(df), dtype=bool)
+        for rule in self.value_rules:
+            if rule.column not in df.columns:
+                continue
+            start = time.perf_counter()
+            vals_error = df[rule.column].validate._eval_vals(
+                rule.compiled_values, rule.mode, rule.na_action,
+                return_mask=True)
+
+            rule_report = RuleReport(
+                column=rule.column, rule=rule.mode, expected=rule.values)
+            if vals_error is not True:
+                rule_report.passed = False
+                rule_report.extra_vals = vals_error.get("extra_vals")
+                if "mask" in vals_error:
+                    mask = vals_error["mask"].to_numpy()
+                    is_valid &= ~mask
+                    faulty_pos = np.flatnonzero(mask)
+                    rule_report.n_faulty = len(faulty_pos)
+                    rule_report.faulty_sample = list(
+                        df.index[faulty_pos[:sample_size]])
+            rule_report.elapsed = time.perf_counter() - start
+            rule_reports.append(rule_report)
+            if not rule_report.passed:
+                raise_or_log(rule_report.summary(), logs, raises, Exception)
+
+        return ValidationReport(
+            rules=rule_reports, is_valid=pd.Series(is_valid, index=df.index))
+
+
+def compile_validation_plan(
+    validation_data: Mapping[str, Any]
+) -> ValidationPlan:
+    """Compile the `validation_data` of a service in `meta_data.json`.
+
+    Args:
+        validation_data (Mapping[str, Any]):
+            A mapping with the optional `schema` and `column_values` keys.
+            Refer to `has_schema` and `has_vals` methods of
+            `DataFrameValidation` for their structure.
+
+    Returns:
+        A ValidationPlan object.
+    """
+    schema = []
+    for col, dtype in (validation_data.get("schema") or {}).items():
+        is_dtype = _dtype_checkers.get(dtype)
+        if is_dtype is None:
+            raise ValueError(
+                f"This function doesn't support for `{dtype}` checking."
+            )
+        schema.append((col, dtype, is_dtype))
+
+    value_rules = []
+    for col, val_args in (validation_data.get("column_values") or {}).items():
+        mode, compiled_values = SeriesValidation._compile_vals(
+            val_args["values"], val_args["mode"])
+        value_rules.append(ValueRule(
+            column=col,
+            mode=mode,
+            values=val_args["values"],
+            compiled_values=compiled_values,
+            na_action=val_args.get("na_action"),
+        ))
+
+    return ValidationPlan(schema=tuple(schema), value_rules=tuple(value_rules))
+
+
+class StreamingNStdValidator:
+    """The 'n_std' check for data that arrives in chunks or is appended
+    over time.
+
+    The count, mean and sum of squared differences from the mean of each
+    column are kept as running moments, and the moments of each new chunk
+    are merged into them with the parallel form of Welford's algorithm.
+    So the history is never kept in memory, and the validators of
+    different workers can be merged. The moments can be kept for each
+    group of rows, e.g. for each account or category.
+
+    Each chunk is checked against the moments of all the data seen so far
+    including the chunk itself, so validating the whole data in a single
+    chunk is the same as the 'n_std' mode of `SeriesValidation`.
+    """
+
+    def __init__(
+        self,
+        n_std: float,
+        columns: List[str],
+        group_by: str | List[str] = None,
+    ):
+        """Constructor of StreamingNStdValidator class.
+
+        Args:
+            n_std (float):
+                The number of standard deviations from the mean that the
+                values should be within.
+            columns (List[str]):
+                The numeric columns to check.
+            group_by (str | List[str]):
+                The column(s) to keep the moments for each of their
+                groups, e.g. ["Institution", "AccountName"]. If None, the
+                moments are kept for the whole column. Default is None.
+        """
+        SeriesValidation._compile_vals(n_std, "n_std")
+        self.n_std = n_std
+        self.columns = list(columns)
+        if isinstance(group_by, str):
+            group_by = [group_by]
+        self.group_by = group_by
+        # The moments of each column with a row for each group,
+        # None until the first update
+        self._moments = dict.fromkeys(self.columns)
+
+    def _group_keys(self, df: pd.DataFrame) -> List[Any]:
+        """Returns the keys to group the rows of `df` by."""
+        if self.group_by is None:
+            return [np.zeros(len(df), dtype=np.int8)]
+        return [df[col].astype(object) for col in self.group_by]
+
+    @classmethod
+    def _merge_moments(
+        cls, left: pd.DataFrame, right: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Merge the moments of two parts of the data for each group."""
+        if left is None or right is None:
+            return right if left is None else left
+
+        left, right = left.align(right, join="outer", fill_value=0.0)
+        count = left["count"] + right["count"]
+        delta = right["mean"] - left["mean"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = (right["count"] / count).fillna(0.0)
+        return pd.DataFrame({
+            "count": count,
+            "mean": left["mean"] + delta * ratio,
+            "m2": left["m2"] + right["m2"]
+            + delta ** 2 * left["count"] * ratio,
+        })
+
+    def update(self, df: pd.DataFrame):
+        """Add the values of `df` to the running moments. The NaNs are
+        left out.
+
+        Args:
+            df (pd.DataFrame):
+                A chunk of the data.
+        """
+        keys = self._group_keys(df)
+        for col in self.columns:
+            values = pd.to_numeric(df[col], errors="coerce")
+            stats = values.groupby(keys, sort=False).agg(
+                ["count", "mean", "var"])
+            chunk_moments = pd.DataFrame({
+                "count": stats["count"].astype(float),
+                "mean": stats["mean"].fillna(0.0),
+                "m2": stats["var"].fillna(0.0) * (stats["count"] - 1).clip(0),
             })
+            self._moments[col] = self._merge_moments(
+                self._moments[col], chunk_moments)
+
+    def merge(self, other: "StreamingNStdValidator"):
+        """Merge the running moments of `other`, e.g. the validator of
+        another worker, into this validator.
+
+        Args:
+            other (StreamingNStdValidator):
+                A validator with the same columns and groups.
+        """
+        if (other.columns, other.group_by) != (self.columns, self.group_by):
+            raise ValueError(
+                "The validators should have the same columns and groups.")
+        for col in self.columns:
+            self._moments[col] = self._merge_moments(
+                self._moments[col], other._moments[col])
+
+    def moments(self, column: str) -> pd.DataFrame:
+        """Returns the count, mean and sample standard deviation of
+        `column` for each group, like `pd.Series.std` with ddof=1."""
+        moments = self._moments[column]
+        if moments is None:
+            moments = pd.DataFrame(
+                columns=["count", "mean", "m2"], dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            std = np.sqrt(moments["m2"] / (moments["count"] - 1))
+        return pd.DataFrame({
+            "count": moments["count"],
+            "mean": moments["mean"],
+            "std": std.where(moments["count"] > 1),
+        })
+
+    def _row_moments(
+        self, df: pd.DataFrame, column: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the mean and the standard deviation of the group of
+        each row of `df`."""
+        moments = self.moments(column)
+        keys = self._group_keys(df)
+        if len(keys) == 1:
+            rows = pd.Index(keys[0])
+        else:
+            rows = pd.MultiIndex.from_arrays(keys)
+        row_moments = moments.reindex(rows)
+        return row_moments["mean"].to_numpy(), row_moments["std"].to_numpy()
+
+    def validate(
+        self,
+        df: pd.DataFrame,
+        update: bool = True,
+        logs: bool = True,
+        raises: bool = False,
+        sample_size: int = 10,
+    ) -> ValidationReport:
+        """Check the values of `df` against the running moments.
+
+        Args:
+            df (pd.DataFrame):
+                A chunk of the data.
+            update (bool):
+                Whether to add `df` to the running moments before checking
+                it. If False, `df` is only checked against the moments of
+                the data seen so far. Default is True.
+            logs (bool):
+                Whether to log a summary of the failed columns.
+            raises (bool):
+                Whether to raise an error or not.
+            sample_size (int):
+                The maximum number of faulty indexes kept for each column.
+                Default is 10.
+
+        Returns:
+            A ValidationReport object with a RuleReport for each column.
+        """
+        if update:
+            self.update(df)
+
+        rule_reports = []
+        is_valid = np.ones(len(df), dtype=bool)
+        for col in self.columns:
+            start = time.perf_counter()
+            values = pd.to_numeric(df[col], errors="coerce").to_numpy(
+                dtype=np.float64, na_value=np.nan)
+            mean, std = self._row_moments(df, col)
+            with np.errstate(invalid="ignore"):
+                faulty = np.abs(values - mean) > self.n_std * std
+            is_valid &= ~faulty
+
+            faulty_pos = np.flatnonzero(faulty)
+            rule_report = RuleReport(
+                column=col,
+                rule="n_std",
+                expected=self.n_std,
+                passed=not len(faulty_pos),
+                n_faulty=len(faulty_pos),
+                faulty_sample=list(df.index[faulty_pos[:sample_size]]),
+            )
+            rule_report.elapsed = time.perf_counter() - start
+            rule_reports.append(rule_report)
+            if not rule_report.passed:
+                raise_or_log(rule_report.summary(), logs, raises, Exception)
+
+        return ValidationReport(
+            rules=rule_reports, is_valid=pd.Series(is_valid, index=df.index))
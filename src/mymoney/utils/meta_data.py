@@ -0,0 +1,457 @@
+import re
+import copy
+import json
+import hashlib
+import itertools
+import functools
+import dataclasses
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
+
+import pandas as pd
+from importlib_resources import files
+
+from mymoney.utils.data_validation import (
+    ValidationPlan,
+    compile_validation_plan,
+)
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively convert the dicts of `obj` to read-only mappings and
+    the lists to tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({
+            key: _freeze(val) for key, val in obj.items()
+        })
+    if isinstance(obj, list):
+        return tuple(_freeze(val) for val in obj)
+    return obj
+
+
+def _thaw(obj: Any) -> Any:
+    """Reverse of `_freeze`. Returns a deep copy of `obj` with dicts and
+    lists that can be passed to pandas."""
+    if isinstance(obj, Mapping):
+        return {key: _thaw(val) for key, val in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(val) for val in obj]
+    return copy.copy(obj)
+
+
+def _to_datetime(ser: pd.Series, date_format: str) -> pd.Series:
+    """Parse `ser` with `date_format`. Falls back to the format inference of
+    pandas if `ser` doesn't match `date_format`, and returns `ser` as it is
+    if it can't be parsed at all, like pd.read_csv does."""
+    try:
+        return pd.to_datetime(ser, format=date_format)
+    except (ValueError, TypeError):
+        pass
+    try:
+        return pd.to_datetime(ser)
+    except (ValueError, TypeError):
+        return ser
+
+
+def _compile_column_values(
+    column_values: Mapping[str, Any]
+) -> Mapping[str, Any]:
+    """Returns `column_values` with the `values` of the rules with `regex`
+    mode compiled."""
+    compiled = {}
+    for col, val_args in column_values.items():
+        if val_args.get("mode") == "regex":
+            val_args = dict(val_args, values=re.compile(val_args["values"]))
+        compiled[col] = MappingProxyType(dict(val_args))
+    return MappingProxyType(compiled)
+
+
+@dataclasses.dataclass(frozen=True)
+class TransferCondition:
+    """A condition on a column of the cleaned DataFrame. Exactly one of
+    `regex`, `values` or `isna` is set."""
+    column: str
+    # The compiled pattern to search for in the string of the values
+    regex: re.Pattern = None
+    # The values to look up
+    values: frozenset = None
+    # Whether the value is NaN
+    isna: bool = None
+
+
+@dataclasses.dataclass(frozen=True)
+class TransferRule:
+    """A rule of `transfer_rules`. The rows matching all the `conditions`
+    get the `label`."""
+    label: str
+    conditions: Tuple[TransferCondition, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class TransferRules:
+    """The compiled `transfer_rules` of a service. The first matching rule
+    gives the label of a row, and the rows matching no rule get the
+    `default` label."""
+    rules: Tuple[TransferRule, ...]
+    default: str
+
+
+def _compile_transfer_condition(
+    condition: Mapping[str, Any]
+) -> TransferCondition:
+    """Compile a condition of `transfer_rules` to a TransferCondition."""
+    kinds = [key for key in ("regex", "values", "isna") if key in condition]
+    if len(kinds) != 1:
+        raise ValueError(
+            "A condition of `transfer_rules` should have exactly one of"
+            f" 'regex', 'values' or 'isna', but it has {kinds}.")
+
+    match kinds[0]:
+        case "regex": kwargs = {"regex": re.compile(condition["regex"])}
+        case "values": kwargs = {"values": frozenset(condition["values"])}
+        case "isna": kwargs = {"isna": bool(condition["isna"])}
+
+    return TransferCondition(column=condition["column"], **kwargs)
+
+
+def _compile_transfer_rules(
+    transfer_rules: Mapping[str, Any]
+) -> TransferRules:
+    """Compile the `transfer_rules` of a service in `meta_data.json`.
+
+    Each rule is either a value map like ``{"column": "Type", "map":
+    {"Payment": "transfer"}}``, or a condition with a label like
+    ``{"column": "_new_Description", "regex": "PAYPAL", "label":
+    "transfer"}``. A condition can be a `regex` to search for, a list of
+    `values` or `isna`, and more conditions can be added with `and`.
+
+    Args:
+        transfer_rules (Mapping[str, Any]):
+            The `transfer_rules` with `rules` and `default` keys.
+
+    Returns:
+        A TransferRules object.
+    """
+    rules = []
+    for rule in transfer_rules["rules"]:
+        if "map" in rule:
+            labels = {}
+            for val, label in rule["map"].items():
+                labels.setdefault(label, []).append(val)
+            rules.extend(
+                TransferRule(
+                    label=label,
+                    conditions=(_compile_transfer_condition(
+                        {"column": rule["column"], "values": vals}),),
+                )
+                for label, vals in labels.items()
+            )
+            continue
+
+        condition = {
+            key: val for key, val in rule.items()
+            if key not in ("label", "and")
+        }
+        rules.append(TransferRule(
+            label=rule["label"],
+            conditions=tuple(
+                _compile_transfer_condition(cond)
+                for cond in [condition, *rule.get("and", [])]
+            ),
+        ))
+
+    return TransferRules(
+        rules=tuple(rules), default=transfer_rules["default"])
+
+
+@dataclasses.dataclass(frozen=True)
+class ServiceMetaData:
+    """Read-only meta data of a service of an institution."""
+    _keys = ("columns", "read_args", "validation_data", "transfer_rules")
+
+    institution: str
+    service: str
+    columns: Tuple[str, ...]
+    column_set: frozenset
+    read_args: Mapping[str, Any]
+    validation_data: Mapping[str, Any]
+    transfer_rules: TransferRules = None
+    # `validation_data` compiled once, None if it's not available
+    validation_plan: ValidationPlan = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-like access to the keys of the service in `meta_data.json`.
+
+        Args:
+            key (str):
+                One of 'columns', 'read_args', 'validation_data'
+                or 'transfer_rules'.
+            default (Any):
+                The value to return if `key` is not available.
+        """
+        if key in self._keys:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def read_kwargs(self, dtype: bool = True) -> Dict[str, Any]:
+        """Returns a copy of `read_args` that can be passed to pd.read_csv.
+
+        The date columns with a `date_format` are left out of `parse_dates`,
+        since they are parsed by `parse_dates` method after reading, and
+        `usecols` is turned into a callable so the files missing some of
+        those columns can still be read.
+
+        Args:
+            dtype (bool):
+                Whether to include the `dtype` of `read_args` or let pandas
+                infer the dtypes. Default is True.
+
+        Returns:
+            The keyword arguments for pd.read_csv.
+        """
+        kwargs = _thaw(self.read_args)
+        date_format = kwargs.pop("date_format", None) or {}
+        kwargs.pop("timezone", None)
+        if kwargs.get("parse_dates") and date_format:
+            kwargs["parse_dates"] = [
+                col for col in kwargs["parse_dates"] if col not in date_format
+            ]
+        if kwargs.get("usecols") is not None:
+            kwargs["usecols"] = frozenset(kwargs["usecols"]).__contains__
+        if not dtype:
+            kwargs.pop("dtype", None)
+        return kwargs
+
+    def parse_dates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Parse the date columns of `df` read with `read_kwargs` using the
+        `date_format` of `read_args`, and convert them to its `timezone`.
+        If a column doesn't match its format, its format is inferred.
+
+        Args:
+            df (pd.DataFrame):
+                The DataFrame read with `read_kwargs`.
+
+        Returns:
+            The same DataFrame with the date columns parsed.
+        """
+        date_format = self.read_args.get("date_format") or {}
+        timezone = self.read_args.get("timezone")
+        for col in self.read_args.get("parse_dates") or ():
+            if col not in df.columns:
+                continue
+
+            ser = df[col]
+            if col in date_format:
+                ser = _to_datetime(ser, date_format[col])
+            if timezone and pd.api.types.is_datetime64_any_dtype(ser):
+                if ser.dt.tz is None:
+                    ser = ser.dt.tz_localize(timezone)
+                else:
+                    ser = ser.dt.tz_convert(timezone)
+            df[col] = ser
+
+        return df
+
+
+class MetaDataRegistry:
+    """Process-wide registry of the data in `meta_data.json`.
+
+    It's created once per process by `get_meta_data_registry`, and the
+    services are kept as read-only `ServiceMetaData` objects with the regex
+    patterns of `validation_data` already compiled.
+    """
+
+    # Arguments of `read_args` that change where the header is located
+    # and how it is turned into column names.
+    _header_read_args = ("header", "names", "index_col")
+
+    def __init__(self, meta_data: Dict[str, Any], meta_data_hash: str):
+        """Constructor of MetaDataRegistry class.
+
+        Args:
+            meta_data (Dict[str, Any]):
+                The content of `meta_data.json`.
+            meta_data_hash (str):
+                The hash of `meta_data.json`.
+        """
+        self.hash = meta_data_hash
+        self._institutions = {}
+        for institution, services in meta_data.items():
+            self._institutions[institution] = MappingProxyType({
+                service: self._create_service(institution, service, md)
+                for service, md in services.items()
+            })
+
+        self.column_index = self._build_column_index()
+
+    def __reduce__(self):
+        # Unpickle as the registry of the other process. The institutions
+        # added in this process are added to the other one by the caller,
+        # e.g. with the initializer of the process pool.
+        return (get_meta_data_registry, ())
+
+    @staticmethod
+    def _create_service(
+        institution: str, service: str, md: Dict[str, Any]
+    ) -> ServiceMetaData:
+        """Create the ServiceMetaData of a service from its raw meta data."""
+        validation_data = dict(md.get("validation_data") or {})
+        if validation_data.get("column_values"):
+            validation_data["column_values"] = _compile_column_values(
+                validation_data["column_values"])
+
+        return ServiceMetaData(
+            institution=institution,
+            service=service,
+            columns=tuple(md["columns"]),
+            column_set=frozenset(md["columns"]),
+            read_args=_freeze(md["read_args"]),
+            validation_data=_freeze(validation_data),
+            validation_plan=(
+                compile_validation_plan(validation_data)
+                if validation_data else None
+            ),
+            transfer_rules=(
+                _compile_transfer_rules(md["transfer_rules"])
+                if md.get("transfer_rules") else None
+            ),
+        )
+
+    def with_institutions(
+        self, institutions: Mapping[str, Dict[str, Any]]
+    ) -> "MetaDataRegistry":
+        """Derive a new registry with the meta data of `institutions` added
+        to the ones of this registry, e.g. the in-house institutions that
+        are not in `meta_data.json`. This registry is left unchanged.
+
+        Args:
+            institutions (Mapping[str, Dict[str, Any]]):
+                The meta data of the services of each institution with the
+                same structure as `meta_data.json`.
+
+        Returns:
+            The new MetaDataRegistry with its own column index and hash.
+        """
+        registry = object.__new__(type(self))
+        registry._institutions = dict(self._institutions)
+        for institution, services in institutions.items():
+            registry._institutions[institution] = MappingProxyType({
+                service: self._create_service(institution, service, md)
+                for service, md in services.items()
+            })
+        registry.column_index = registry._build_column_index()
+
+        hasher = hashlib.sha256(self.hash.encode())
+        hasher.update(json.dumps(institutions, sort_keys=True).encode())
+        registry.hash = hasher.hexdigest()
+        return registry
+
+    def _build_column_index(
+        self
+    ) -> Mapping[Tuple, List[Tuple[int, ServiceMetaData]]]:
+        """Build the index used to detect the institution of a CSV file.
+
+        The services are grouped by the read arguments that define their
+        header (`_header_read_args`), so each group only needs one header
+        sniff to check all of its services.
+
+        Returns:
+            A mapping of a header signature (a tuple of
+            (read argument, value) pairs) to a tuple of
+            (priority, ServiceMetaData) tuples.
+        """
+        column_index = {}
+        priority = itertools.count()
+        for service_md in self:
+            signature = tuple(
+                (arg, service_md.read_args[arg])
+                for arg in self._header_read_args
+                if arg in service_md.read_args
+            )
+            column_index.setdefault(signature, []).append(
+                (next(priority), service_md))
+
+        return MappingProxyType({
+            signature: tuple(services)
+            for signature, services in column_index.items()
+        })
+
+    def __iter__(self) -> Iterator[ServiceMetaData]:
+        """Iterate over all the services in the order of `meta_data.json`."""
+        for services in self._institutions.values():
+            yield from services.values()
+
+    def __contains__(self, institution: str) -> bool:
+        return institution in self._institutions
+
+    def __getitem__(self, institution: str) -> Mapping[str, ServiceMetaData]:
+        return self._institutions[institution]
+
+    def institution(self, name: str) -> Mapping[str, ServiceMetaData]:
+        """Returns the services of the institution `name`, or None if the
+        institution is not available."""
+        return self._institutions.get(name)
+
+    def service(self, institution: str, service: str) -> ServiceMetaData:
+        """Returns the ServiceMetaData of `service` of `institution`."""
+        return self._institutions[institution][service]
+
+
+# The meta data of the institutions added with `add_institution_meta_data`,
+# layered on top of `meta_data.json` by `get_meta_data_registry`
+_added_meta_data: Dict[str, Dict[str, Any]] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_meta_data_json() -> MetaDataRegistry:
+    """Load and index `meta_data.json` once per process."""
+    raw = files("mymoney").joinpath("meta_data.json").read_bytes()
+    return MetaDataRegistry(
+        json.loads(raw), hashlib.sha256(raw).hexdigest())
+
+
+@functools.lru_cache(maxsize=None)
+def get_meta_data_registry() -> MetaDataRegistry:
+    """Returns the MetaDataRegistry of this process: the one of
+    `meta_data.json`, or a registry derived from it with the institutions
+    added by `add_institution_meta_data`.
+
+    Returns:
+        The MetaDataRegistry of this process.
+    """
+    registry = _load_meta_data_json()
+    if _added_meta_data:
+        registry = registry.with_institutions(_added_meta_data)
+    return registry
+
+
+def added_meta_data() -> Dict[str, Dict[str, Any]]:
+    """Returns a copy of the meta data added by `add_institution_meta_data`,
+    e.g. to add it to the registries of other processes."""
+    return copy.deepcopy(_added_meta_data)
+
+
+def add_institution_meta_data(institution: str, services: Dict[str, Any]):
+    """Add the meta data of an institution that is not in `meta_data.json`.
+
+    The registry of `meta_data.json` is not changed. The next call of
+    `get_meta_data_registry` derives a new registry with the added
+    institutions, and the objects created before, e.g. a DataReader, keep
+    using the previous one.
+
+    Args:
+        institution (str):
+            The name of the institution.
+        services (Dict[str, Any]):
+            The meta data of its services with the same structure as the
+            institutions in `meta_data.json`.
+    """
+    # Compile it first so an invalid meta data is not added
+    _load_meta_data_json().with_institutions({institution: services})
+    _added_meta_data[institution] = copy.deepcopy(services)
+    get_meta_data_registry.cache_clear()
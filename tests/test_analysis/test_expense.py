@@ -0,0 +1,101 @@
+import time
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from mymoney.analysis.expense import ExpenseAnalysis
+
+
+def _expense_df(n_accounts: int, n_rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    accounts = rng.integers(0, n_accounts, n_rows)
+    return pd.DataFrame({
+        "Description": rng.choice(["COFFEE", "RENT", "GAS"], n_rows),
+        "Amount": rng.normal(size=n_rows).round(2),
+        "Date": pd.Timestamp("2023-01-01", tz="UTC") + pd.to_timedelta(
+            rng.permutation(n_rows), unit="h"),
+        "Institution": pd.Categorical(
+            [f"Bank{acc % 7}" for acc in accounts]),
+        "AccountName": [f"acc{acc:05d}" for acc in accounts],
+        "InstitutionCategory": np.nan,
+        "MyCategory": rng.choice(["Food", "Income"], n_rows),
+        "IsTransfer": "expense",
+        "IsValid": True,
+        "Service": pd.Categorical(rng.choice(["credit", "debit"], n_rows)),
+        "Notes": np.nan,
+    })
+
+
+def test_get_last_date_df():
+    df = _expense_df(n_accounts=3, n_rows=30)
+    expense_analysis = ExpenseAnalysis(df)
+
+    last_date_df = expense_analysis.get_last_date_df(sort_by="date")
+
+    expected = []
+    for (inst, acc, service), grp in df.groupby(
+        ["Institution", "AccountName", "Service"], observed=True
+    ):
+        expected.append((inst, acc, service, grp["Date"].max().date()))
+    expected = pd.DataFrame(expected, columns=[
+        "Institution", "AccountName", "Service", "LastDate"])
+    pd.testing.assert_frame_equal(
+        last_date_df,
+        expected.sort_values(by="LastDate", ignore_index=True),
+    )
+    assert isinstance(last_date_df.loc[0, "LastDate"], datetime.date)
+
+
+def test_get_last_n_transactions_df():
+    df = _expense_df(n_accounts=4, n_rows=40)
+    expense_analysis = ExpenseAnalysis(df)
+
+    last_n_df = expense_analysis.get_last_n_transactions_df(n=3)
+
+    expected = pd.concat([
+        grp.sort_values(by="Date").tail(3)
+        for _, grp in df.groupby(
+            ["Institution", "AccountName", "Service"], observed=True)
+    ], ignore_index=True)
+    pd.testing.assert_frame_equal(
+        last_n_df,
+        expected[["Institution", "AccountName", "Date", "Amount", "Description"]],  # noqa: E501
+    )
+
+
+def test_many_accounts():
+    df = _expense_df(n_accounts=3000, n_rows=30000)
+    expense_analysis = ExpenseAnalysis(df)
+
+    # A generous limit, the per account loops took seconds here
+    start = time.perf_counter()
+    last_date_df = expense_analysis.get_last_date_df()
+    last_n_df = expense_analysis.get_last_n_transactions_df(n=5)
+    assert time.perf_counter() - start < 2
+
+    sizes = df.groupby(
+        ["Institution", "AccountName", "Service"], observed=True).size()
+    assert len(last_date_df) == len(sizes)
+    assert len(last_n_df) == sizes.clip(upper=5).sum()
+
+
+def test_column_sum_grouper():
+    df = _expense_df(n_accounts=5, n_rows=200)
+    # A category that only has transactions far from the others
+    df.loc[0, ["MyCategory", "Date"]] = [
+        "Travel", pd.Timestamp("2024-06-01", tz="UTC")]
+    expense_analysis = ExpenseAnalysis(df)
+
+    for column in ["MyCategory", "Institution", "AccountName"]:
+        for freq in ["W", "M"]:
+            grouper = pd.Grouper(freq=freq, key="Date")
+            expected = pd.DataFrame({
+                val: df[df[column] == val].groupby(grouper)["Amount"].sum()
+                for val in df[column].unique()
+            }).fillna(.0)
+
+            pd.testing.assert_frame_equal(
+                expense_analysis._column_sum_grouper(column, freq),
+                expected,
+            )
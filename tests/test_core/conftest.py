@@ -0,0 +1,67 @@
+import pytest
+
+
+@pytest.fixture
+def chase_credit_csv(tmp_path):
+    path = tmp_path / "chase_credit.csv"
+    path.write_text(
+        "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        "01/05/2023,01/06/2023,WHOLE FOODS,Groceries,Sale,-12.34,\n"
+        "01/07/2023,01/08/2023,Payment Thank You,,Payment,100.00,\n"
+        "01/09/2023,01/10/2023,  SHELL OIL  ,Gas,Sale,-40.50,\n"
+    )
+    return str(path)
+
+
+@pytest.fixture
+def coinbase_csv(tmp_path):
+    path = tmp_path / "coinbase.csv"
+    path.write_text(
+        "You can use this transaction report to inform your taxes.\n"
+        "Transactions\n"
+        "Timestamp,Transaction Type,Asset,Quantity Transacted,"
+        "Spot Price Currency,Spot Price at Transaction,Subtotal,"
+        "Total (inclusive of fees and/or spread),Fees and/or Spread,Notes\n"
+        "2023-01-05T12:34:56Z,Buy,BTC,0.01,USD,20000.00,200.00,"
+        "201.99,1.99,Bought 0.01 BTC for $200.00 USD\n"
+        "2023-01-06T12:34:56Z,Convert,BTC,0.005,USD,21000.00,105.00,"
+        "105.00,0.00,Converted 0.005 BTC to 105.00 USDC\n"
+    )
+    return str(path)
+
+
+@pytest.fixture
+def wellsfargo_csv(tmp_path):
+    path = tmp_path / "wellsfargo.csv"
+    path.write_text(
+        '"01/05/2023","-12.34","*","","WHOLE FOODS"\n'
+        '"01/06/2023","100.00","*","","AUTOMATIC PAYMENT - THANK YOU"\n'
+        '"01/07/2023","-40.50","*","","SHELL OIL"\n'
+    )
+    return str(path)
+
+
+@pytest.fixture
+def unknown_csv(tmp_path):
+    path = tmp_path / "unknown.csv"
+    path.write_text("a,b\n1,2\n")
+    return str(path)
+
+
+@pytest.fixture
+def statements_folder(tmp_path, chase_credit_csv, wellsfargo_csv):
+    account_dir = tmp_path / "MyCard"
+    account_dir.mkdir()
+    (account_dir / "statement.csv").write_text(
+        open(chase_credit_csv).read())
+    # A Coinbase file with a broken `Notes` value fails in the cleaning step
+    (tmp_path / "broken_coinbase.csv").write_text(
+        "Coinbase report\nTransactions\n"
+        "Timestamp,Transaction Type,Asset,Quantity Transacted,"
+        "Spot Price Currency,Spot Price at Transaction,Subtotal,"
+        "Total (inclusive of fees and/or spread),Fees and/or Spread,Notes\n"
+        "2023-01-05T12:34:56Z,Receive,BTC,0.01,USD,20000.00,200.00,"
+        "200.00,0.00,Received\n"
+    )
+    (tmp_path / "notes.txt").write_text("not a csv")
+    return str(tmp_path)
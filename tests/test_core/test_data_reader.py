@@ -0,0 +1,159 @@
+import os
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from mymoney.core.data_reader import DataReader
+from mymoney.core.manifest import IngestManifest
+from mymoney.institutions.chase import Chase
+from mymoney.utils.common import concat_dataframes
+
+
+def test_read_csv_file_detects_institution(chase_credit_csv, coinbase_csv):
+    reader = DataReader()
+
+    chase = reader.read_csv_file(chase_credit_csv)
+    assert (chase.institution_name, chase.service_name) == ("chase", "credit")
+    assert chase.account_name == "chase_credit"
+    assert list(chase.output_df["IsTransfer"]) == [
+        "expense", "transfer", "expense"]
+
+    coinbase = reader.read_csv_file(coinbase_csv, account_name="crypto")
+    assert (coinbase.institution_name, coinbase.service_name) == (
+        "coinbase", "exchange")
+    assert coinbase.account_name == "crypto"
+
+
+def test_read_csv_file_wellsfargo(wellsfargo_csv):
+    wf = DataReader().read_csv_file(wellsfargo_csv)
+    assert (wf.institution_name, wf.service_name) == ("wellsfargo", "credit")
+    assert len(wf.output_df) == 3
+
+
+def test_read_csv_file_unknown(unknown_csv):
+    assert DataReader().read_csv_file(unknown_csv) is None
+    with pytest.raises(ValueError):
+        DataReader().read_csv_file(unknown_csv.replace(".csv", ".txt"))
+
+
+def test_sniff_candidates_reads_header_only(chase_credit_csv):
+    reader = DataReader()
+    assert reader._sniff_candidates(chase_credit_csv) == [("chase", "credit")]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_read_csv_folder(statements_folder, workers):
+    reader = DataReader()
+    inst_data_list = reader.read_csv_folder(statements_folder, workers=workers)
+
+    assert [
+        (inst.institution_name, inst.account_name) for inst in inst_data_list
+    ] == [
+        ("chase", "chase_credit"),
+        ("wellsfargo", "wellsfargo"),
+        ("chase", "MyCard"),
+    ]
+    assert list(reader.failed_files) == [
+        os.path.join(statements_folder, "broken_coinbase.csv")]
+
+
+def test_read_csv_folder_manifest(tmp_path, statements_folder):
+    manifest_path = str(tmp_path / "manifest.json")
+    reader = DataReader()
+
+    first = reader.read_csv_folder(
+        statements_folder, manifest_path=manifest_path)
+    assert len(first) == 3
+    assert reader.read_csv_folder(
+        statements_folder, manifest_path=manifest_path) == []
+
+    # Only the modified file is read again
+    modified_path = os.path.join(statements_folder, "MyCard", "statement.csv")
+    with open(modified_path, "a") as f:
+        f.write("01/11/2023,01/12/2023,STARBUCKS,Dining,Sale,-5.25,\n")
+    delta = reader.read_csv_folder(
+        statements_folder, manifest_path=manifest_path)
+    assert [inst.source for inst in delta] == [modified_path]
+
+    manifest = IngestManifest(manifest_path)
+    assert manifest.files[os.path.join("MyCard", "statement.csv")][
+        "n_rows"] == 4
+
+
+def test_read_csv_file_lazy(monkeypatch, chase_credit_csv):
+    calls = []
+    service_executer = Chase.service_executer
+
+    def counting_service_executer(self, *args, **kwargs):
+        calls.append(kwargs["service_name"])
+        return service_executer(self, *args, **kwargs)
+
+    monkeypatch.setattr(Chase, "service_executer", counting_service_executer)
+    lazy = DataReader(lazy=True).read_csv_file(chase_credit_csv)
+
+    assert (lazy.institution_name, lazy.service_name) == ("chase", "credit")
+    assert lazy.out_type == "expense"
+    assert not lazy.is_output_created
+    assert "is_output_created: False" in str(lazy)
+    assert "output_df" not in repr(lazy)
+    assert "output_df" not in repr([lazy])
+    assert calls == []
+
+    pd.testing.assert_frame_equal(
+        lazy.output_df, DataReader().read_csv_file(chase_credit_csv).output_df)
+    assert lazy.is_output_created
+    assert lazy.sanity_df is not None
+    assert "output_df=" in repr(lazy)
+    assert calls == ["credit", "credit"]
+
+
+def test_read_csv_file_output_memory(chase_credit_csv):
+    inst = DataReader().read_csv_file(chase_credit_csv)
+    # The output columns are not copied from `sanity_df`
+    assert np.shares_memory(
+        inst.output_df["Amount"].values, inst.sanity_df["_new_Amount"].values)
+
+    released = DataReader(release=True).read_csv_file(chase_credit_csv)
+    assert released.table is None and released.sanity_df is None
+    pd.testing.assert_frame_equal(released.output_df, inst.output_df)
+
+    lazy = DataReader(lazy=True).read_csv_file(chase_credit_csv)
+    lazy.release_inputs()
+    assert lazy.is_output_created
+    assert lazy.table is None and lazy.sanity_df is None
+
+
+def test_read_csv_file_chunks(chase_credit_csv, wellsfargo_csv):
+    reader = DataReader()
+
+    chunks = list(reader.read_csv_file_chunks(chase_credit_csv, chunksize=2))
+    assert [len(inst.output_df) for inst in chunks] == [2, 1]
+    pd.testing.assert_frame_equal(
+        concat_dataframes([inst.output_df for inst in chunks]),
+        reader.read_csv_file(chase_credit_csv).output_df,
+    )
+
+    wf_chunks = list(reader.read_csv_file_chunks(wellsfargo_csv, chunksize=2))
+    assert {inst.service_name for inst in wf_chunks} == {"credit"}
+    assert sum(len(inst.output_df) for inst in wf_chunks) == 3
+
+
+def test_read_csv_file_wellsfargo_single_parse(
+    monkeypatch, wellsfargo_csv, unknown_csv
+):
+    reader = DataReader()
+    calls = []
+    read_csv = pd.read_csv
+
+    def counting_read_csv(filepath_or_buffer, *args, **kwargs):
+        if filepath_or_buffer == wellsfargo_csv:
+            calls.append(kwargs)
+        return read_csv(filepath_or_buffer, *args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", counting_read_csv)
+    wf = reader.read_csv_file(wellsfargo_csv)
+    assert (wf.institution_name, wf.service_name) == ("wellsfargo", "credit")
+    assert len(calls) == 1
+
+    assert not reader._sniff_wellsfargo(unknown_csv)
@@ -0,0 +1,39 @@
+import sys
+import json
+import subprocess
+
+from mymoney.institutions import _lazy_classes
+
+# Optional or heavy modules that `import mymoney` shouldn't load: the Google
+# Sheets clients, and the pandas parts for styling, plotting and other IO.
+deferred_modules = [
+    "gspread",
+    "gspread_dataframe",
+    "mymoney.storage_integrations",
+    "pandas.io.formats.style",
+    "pandas.plotting._matplotlib",
+    "matplotlib",
+    "jinja2",
+    "scipy",
+    "pyarrow",
+    "openpyxl",
+    "sqlalchemy",
+    *sorted(set(_lazy_classes.values())),
+]
+
+_import_code = """
+import sys, json
+import mymoney
+print(json.dumps(list(sys.modules)))
+"""
+
+
+def test_import_defers_heavy_modules():
+    proc = subprocess.run(
+        [sys.executable, "-c", _import_code],
+        check=True, capture_output=True, text=True,
+    )
+    modules = set(json.loads(proc.stdout.splitlines()[-1]))
+
+    loaded = [name for name in deferred_modules if name in modules]
+    assert loaded == [], f"{loaded} are imported by `import mymoney`"
@@ -0,0 +1,35 @@
+import pandas as pd
+
+from mymoney.core.data_reader import DataReader
+from mymoney.core.my_data import MyData
+
+
+def test_load_inst_data(chase_credit_csv, wellsfargo_csv, coinbase_csv):
+    reader = DataReader()
+    inst_data_list = [
+        reader.read_csv_file(chase_credit_csv),
+        reader.read_csv_file(wellsfargo_csv),
+        reader.read_csv_file(coinbase_csv),
+    ]
+
+    my_data = MyData()
+    my_data.load_inst_data(inst_data_list)
+
+    assert len(my_data.expense_df) == 6
+    assert len(my_data.trade_df) == 2
+    assert "Notes" in my_data.expense_df.columns
+    for col in ["Institution", "AccountName", "Service", "IsTransfer"]:
+        assert isinstance(
+            my_data.expense_df[col].dtype, pd.CategoricalDtype), col
+    assert list(my_data.expense_df["Institution"].cat.categories) == [
+        "Chase", "Wells Fargo"]
+    assert isinstance(my_data.trade_df["TrxType"].dtype, pd.CategoricalDtype)
+
+    # Only the observed accounts are in the groupbys
+    accounts = my_data.expense_analysis.get_accounts_df(multi_index=True)
+    assert list(accounts.index) == [
+        ("Chase", "chase_credit", "credit"),
+        ("Wells Fargo", "wellsfargo", "credit"),
+    ]
+    overall = my_data.expense_analysis.institution_overall_spend()
+    assert len(overall) == 2
@@ -0,0 +1,51 @@
+import os
+
+import pandas as pd
+
+from mymoney.core.data_reader import DataReader
+from mymoney.core.parse_cache import ParseCache
+from mymoney.institutions.chase import Chase
+
+
+def test_parse_cache_hit(tmp_path, chase_credit_csv):
+    cache = ParseCache(str(tmp_path / "cache"))
+    reader = DataReader(cache=cache)
+
+    first = reader.read_csv_file(chase_credit_csv)
+    assert len(cache) == 1
+
+    second = reader.read_csv_file(chase_credit_csv)
+    assert second.table is None
+    assert (second.institution_name, second.service_name) == (
+        "chase", "credit")
+    pd.testing.assert_frame_equal(first.output_df, second.output_df)
+
+    # The account name is a part of the key
+    reader.read_csv_file(chase_credit_csv, account_name="other")
+    assert len(cache) == 2
+
+
+def test_parse_cache_cleaner_version(
+    tmp_path, monkeypatch, chase_credit_csv
+):
+    cache = ParseCache(str(tmp_path / "cache"))
+    reader = DataReader(cache=cache)
+    reader.read_csv_file(chase_credit_csv)
+
+    monkeypatch.setattr(Chase, "_cleaner_version", Chase._cleaner_version + 1)
+    assert reader.read_csv_file(chase_credit_csv).table is not None
+
+
+def test_parse_cache_eviction(tmp_path, chase_credit_csv, coinbase_csv):
+    cache = ParseCache(str(tmp_path / "cache"), max_entries=1)
+    reader = DataReader(cache=cache)
+
+    reader.read_csv_file(chase_credit_csv)
+    reader.read_csv_file(coinbase_csv)
+    assert len(cache) == 1
+
+    coinbase_key = cache.key(open(coinbase_csv, "rb").read(), "coinbase")
+    assert os.path.exists(cache._entry_path(coinbase_key))
+
+    cache.clear()
+    assert len(cache) == 0
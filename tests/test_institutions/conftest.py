@@ -0,0 +1,28 @@
+import pytest
+import pandas as pd
+
+
+@pytest.fixture
+def assert_same_new_columns():
+    """Returns a function that checks the `_new_` columns of two cleaned
+    DataFrames are the same, including the places of None and NaN values.
+    The categorical columns of `result` are compared by their values."""
+    def _assert_same_new_columns(result, expected):
+        new_columns = [col for col in expected if col.startswith("_new_")]
+        assert [
+            col for col in result if col.startswith("_new_")
+        ] == new_columns
+        result = result[new_columns].copy()
+        for col in new_columns:
+            if (isinstance(result[col].dtype, pd.CategoricalDtype)
+                    and not isinstance(
+                        expected[col].dtype, pd.CategoricalDtype)):
+                result[col] = result[col].astype(expected[col].dtype)
+        pd.testing.assert_frame_equal(result, expected[new_columns])
+        for col in new_columns:
+            assert (
+                result[col].map(type).tolist()
+                == expected[col].map(type).tolist()
+            ), col
+
+    return _assert_same_new_columns
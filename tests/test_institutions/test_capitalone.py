@@ -0,0 +1,114 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from mymoney.institutions.capitalone import CapitalOne
+
+
+def row_wise_credit_cleaning(input_df, account_name):
+    """The row-wise cleaning of CapitalOne credit before it was
+    vectorized."""
+    def amount_finder(row):
+        return (
+            row["Credit"] if np.isnan(row["Debit"]) else -row["Debit"]
+        )
+
+    def is_transfer_finder(row):
+        try:
+            regex_flag_paypal = re.search(
+                r"PAYPAL",
+                str(row["_new_Description"])
+            )
+            regex_flag_payment = re.search(
+                r"CAPITAL ONE \w* PYMT",
+                str(row["_new_Description"])
+            )
+        except Exception:
+            return "consider"
+
+        if (regex_flag_payment or regex_flag_paypal):
+            return "transfer"
+        elif (not regex_flag_payment and not regex_flag_paypal):
+            return "expense"
+        else:
+            return "consider"
+
+    input_df["_new_Description"] = input_df["Description"].map(lambda val: str(val).strip())  # noqa: E501
+    input_df["_new_Amount"] = input_df.apply(amount_finder, axis=1)
+    input_df["_new_Date"] = input_df["Transaction Date"].copy(deep=True)  # noqa: E501
+    input_df["_new_InstitutionCategory"] = input_df["Category"].copy(deep=True)  # noqa: E501
+    input_df["_new_MyCategory"] = input_df["Category"].copy(deep=True)
+    input_df["_new_Institution"] = "Capital One"
+    input_df["_new_AccountName"] = input_df["Card No."].copy(deep=True)  # noqa: E501
+    input_df["_new_Service"] = "credit"
+    input_df["_new_IsTransfer"] = input_df.apply(is_transfer_finder, axis=1)  # noqa: E501
+
+    return input_df
+
+
+def row_wise_debit_amount(input_df):
+    """The row-wise amount of CapitalOne debit before it was vectorized."""
+    def amount_finder(row):
+        trx_type = row["Transaction Type"]
+        amount = row["Transaction Amount"]
+        if trx_type == "Debit":
+            return -abs(amount)
+        elif trx_type == "Credit":
+            return abs(amount)
+
+    return input_df.apply(amount_finder, axis=1)
+
+
+def generate_credit_df(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    debit = rng.choice([12.5, 0.99, 1500.0, np.nan], n_rows)
+
+    return pd.DataFrame({
+        "Transaction Date": pd.date_range(
+            "2023-01-01", periods=n_rows, freq="min", tz="UTC"),
+        "Posted Date": pd.date_range(
+            "2023-01-02", periods=n_rows, freq="min", tz="UTC"),
+        "Card No.": rng.choice([1234, 5678], n_rows),
+        "Description": rng.choice(np.array([
+            " GROCERY ", "CAPITAL ONE AUTOPAY PYMT", "PAYPAL *SHOP",
+            "CREDIT-CASH BACK REWARD", np.nan,
+        ], dtype=object), n_rows),
+        "Category": rng.choice(np.array(
+            ["Dining", "Payment/Credit", np.nan], dtype=object), n_rows),
+        "Debit": debit,
+        "Credit": np.where(
+            np.isnan(debit), rng.choice([25.0, 3.1, np.nan], n_rows),
+            np.nan),
+    })
+
+
+def test_credit_csv_cleaning_matches_row_wise(assert_same_new_columns):
+    credit_df = generate_credit_df(2000)
+    expected = row_wise_credit_cleaning(credit_df.copy(), "MyCard")
+    service = CapitalOne.CreditService(CapitalOne()._this_meta_data)
+
+    result = service._csv_cleaning(credit_df, "MyCard")
+
+    assert_same_new_columns(result, expected)
+
+
+def test_debit_csv_cleaning_amount_matches_row_wise():
+    rng = np.random.default_rng(0)
+    debit_df = pd.DataFrame({
+        "Account Number": 1234,
+        "Transaction Date": pd.date_range(
+            "2023-01-01", periods=2000, freq="min", tz="UTC"),
+        "Transaction Amount": rng.choice([-12.5, 40.0, 0.0, np.nan], 2000),
+        "Transaction Type": pd.Categorical(
+            rng.choice(["Debit", "Credit", "Hold"], 2000)),
+        "Transaction Description": "Zelle",
+        "Balance": 100.0,
+    })
+    expected = row_wise_debit_amount(debit_df).astype(float)
+    service = CapitalOne.DebitService(CapitalOne()._this_meta_data)
+
+    result = service._csv_cleaning(debit_df, "MyChecking")
+
+    pd.testing.assert_series_equal(
+        result["_new_Amount"], expected, check_names=False)
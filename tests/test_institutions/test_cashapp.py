@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+from mymoney.institutions.cashapp import CashApp
+
+
+def row_wise_csv_cleaning(input_df, account_name):
+    """The row-wise cleaning of CashApp before it was vectorized."""
+    def is_transfer_finder(row):
+        row_status = row["Status"]
+        if row_status == "PAYMENT REVERSED":
+            return "redundant"
+        elif row_status == "TRANSFER SENT":
+            return "transfer"
+        elif row_status in ["PAYMENT SENT", "PAYMENT DEPOSITED"]:
+            return "expense"
+        else:
+            return "consider"
+
+    def amount_finder(val):
+        return float(
+            str(val).replace(",", "").replace("$", "")
+        )
+
+    def description_finder(row):
+        row_type = row["Transaction Type"]
+        row_sender_receiver = row["Name of sender/receiver"]
+        row_notes = row["Notes"]
+        notes = "" if pd.isna(row_notes) else f" ({row_notes})"
+
+        if row_type == "Sent P2P":
+            out = f"Me -> {row_sender_receiver}{notes}"
+        elif row_type == "Received P2P":
+            out = f"From {row_sender_receiver} -> Me{notes}"
+        elif row_type == "Cash out":
+            out = "Cash out"
+        else:
+            out = "Consider"
+
+        return out.strip()
+
+    input_df["_new_Description"] = input_df.apply(description_finder, axis=1)  # noqa: E501
+    input_df["_new_Amount"] = input_df["Amount"].map(amount_finder)
+    input_df["_new_Date"] = input_df["Date"].copy(deep=True)
+    input_df["_new_InstitutionCategory"] = np.nan
+    input_df["_new_MyCategory"] = np.nan
+    input_df["_new_Institution"] = "CashApp"
+    input_df["_new_AccountName"] = account_name
+    input_df["_new_Service"] = "3rdparty"
+    input_df["_new_IsTransfer"] = input_df.apply(is_transfer_finder, axis=1)  # noqa: E501
+
+    return input_df
+
+
+def generate_cashapp_df(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+
+    def choice(values):
+        return rng.choice(np.array(values, dtype=object), n_rows)
+
+    return pd.DataFrame({
+        "Date": pd.date_range(
+            "2023-01-01", periods=n_rows, freq="min", tz="UTC"),
+        "Transaction Type": choice([
+            "Sent P2P", "Received P2P", "Cash out", "Other"]),
+        "Currency": "USD",
+        "Amount": choice(["-$42.38", "$1,234.56", "-$0.10", np.nan]),
+        "Status": choice([
+            "PAYMENT SENT", "PAYMENT DEPOSITED", "TRANSFER SENT",
+            "PAYMENT REVERSED", "OTHER",
+        ]),
+        "Notes": choice(["rent", "pizza ", np.nan]),
+        "Name of sender/receiver": choice(["Friend", np.nan]),
+    })
+
+
+def test_csv_cleaning_matches_row_wise(assert_same_new_columns):
+    cashapp_df = generate_cashapp_df(2000)
+    expected = row_wise_csv_cleaning(cashapp_df.copy(), "CashApp")
+    service = CashApp.ThirdPartyService(CashApp()._this_meta_data)
+
+    # As read by DataReader with the dtypes of meta_data
+    categorical_columns = ["Transaction Type", "Currency", "Status"]
+    cashapp_df[categorical_columns] = (
+        cashapp_df[categorical_columns].astype("category"))
+    result = service._csv_cleaning(cashapp_df, "CashApp")
+
+    assert_same_new_columns(result, expected)
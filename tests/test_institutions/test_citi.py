@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+
+from mymoney.institutions.citi import Citi
+
+
+def test_csv_cleaning_amount():
+    df = pd.DataFrame({
+        "Status": ["Cleared"] * 4,
+        "Date": pd.to_datetime(["2023-01-01"] * 4),
+        "Description": [
+            "GROCERY", "AUTOPAY 000", "Thankyou Points Redeemed", "REFUND"],
+        "Debit": [12.5, 100.0, 5.0, np.nan],
+        "Credit": [np.nan, -100.0, -5.0, -3.0],
+    })
+
+    service = Citi.CreditService(Citi()._this_meta_data)
+    result = service._csv_cleaning(df, "MyCard")
+
+    assert result["_new_Amount"].tolist() == [-12.5, 100.0, 5.0, 3.0]
+    assert result["_new_IsTransfer"].tolist() == [
+        "expense", "transfer", "expense", "expense"]
@@ -0,0 +1,249 @@
+import re
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from mymoney.institutions.coinbase import Coinbase
+
+
+USDS = ["USD", "USDC", "USDT"]
+
+
+def row_wise_csv_cleaning(input_df):
+    """The row-wise cleaning of Coinbase before it was vectorized."""
+    def from_account_finder(row):
+        trx_type = row["Transaction Type"]
+        if trx_type in [
+            "Inflation Reward", "Staking Income",
+            "Convert", "Send", "Sell", "Withdrawal",
+        ]:
+            return "coinbase"
+        elif trx_type == "Buy":
+            # Can be coinbase itself
+            # TODO: Need revision and compare to `expense` df
+            return "Bank"
+        elif trx_type == "Learning Reward":
+            return "Coinbase Reward"
+        elif trx_type == "Receive":
+            if (
+                row["NotesHelper"][-2] == "Coinbase"
+                and row["NotesHelper"][-1] in ["Earn", "Rewards"]
+            ):
+                return "Coinbase Reward"
+            elif row["NotesHelper"][-1] == "from":
+                return "coinbase"
+
+            # Alternative: f'{row["ToAsset"]} Network'
+            return "Wallet"
+        else:
+            return np.nan
+
+    def to_account_finder(row):
+        trx_type = row["Transaction Type"]
+        if trx_type == "Send":
+            try:
+                re_pattern = r"to\s(.*)$"
+                groups = re.search(re_pattern, row["Notes"]).groups()
+                if not groups[0]:
+                    return f"{row['Asset']} Network"
+                return groups[0]
+            except Exception:
+                return np.nan
+        elif trx_type == "Withdrawal":
+            return "Bank"
+
+        return "coinbase"
+
+    def from_asset_finder(row):
+        trx_type = row["Transaction Type"]
+        if trx_type == "Learning Reward":
+            return "R3W"
+        elif trx_type == "Buy":
+            return "USD"
+        elif trx_type in [
+            "Inflation Reward", "Staking Income",
+            "Convert", "Send", "Sell", "Withdrawal",
+        ]:
+            return row["Asset"]
+        elif trx_type == "Receive":
+            if (
+                row["NotesHelper"][-2] == "Coinbase"
+                and row["NotesHelper"][-1] in ["Earn", "Rewards"]
+            ):
+                return "R3W"
+            elif row["NotesHelper"][-1] == "from":
+                return row["Asset"]
+        else:
+            return np.nan
+
+    def to_asset_finder(row):
+        trx_type = row["Transaction Type"]
+        if trx_type in [
+            "Learning Reward", "Buy", "Send", "Withdrawal",
+            "Inflation Reward", "Staking Income", "Receive",
+        ]:
+            return row["Asset"]
+        elif trx_type in ["Convert", "Sell"]:
+            return row["NotesHelper"][-1]
+        else:
+            return np.nan
+
+    def in_amount_finder(row):
+        trx_type = row["Transaction Type"]
+        if trx_type in [
+            "Learning Reward", "Inflation Reward",
+            "Staking Income", "Receive",
+        ]:
+            return .0
+        elif trx_type == "Buy":
+            return float(row["Subtotal"])
+        elif trx_type in [
+            "Convert", "Send", "Sell", "Withdrawal",
+        ]:
+            return row["Quantity Transacted"]
+        else:
+            return np.nan
+
+    def out_amount_finder(row):
+        trx_type = row["Transaction Type"]
+        if trx_type in [
+            "Learning Reward", "Buy", "Send", "Withdrawal",
+            "Inflation Reward", "Staking Income", "Receive"
+        ]:
+            return float(row["Quantity Transacted"])
+        elif trx_type in ["Convert", "Sell"]:
+            price = str(row["NotesHelper"][-2]).replace("$", "")
+            return float(price)
+        else:
+            return np.nan
+
+    def trx_type_finder(row):
+        trx_type = row["Transaction Type"]
+        if trx_type == "Learning Reward":
+            return "Reward"
+        elif trx_type in ["Buy", "Send", "Withdrawal"]:
+            # TODO: `Buy` could be `Trade` depend on
+            # where the source is
+            return "Transfer"
+        elif trx_type in ["Convert", "Sell"]:
+            return "Trade"
+        elif trx_type in ["Inflation Reward", "Staking Income"]:
+            return "HODL"
+        elif trx_type == "Receive":
+            if (
+                row["NotesHelper"][-2] == "Coinbase"
+                and row["NotesHelper"][-1] in ["Earn", "Rewards"]
+            ):
+                return "Reward"
+            elif row["NotesHelper"][-1] == "from":
+                return "HODL"
+        else:
+            return np.nan
+
+    def trx_sub_type_finder(row):
+        trx_type = row["Transaction Type"]
+        if trx_type == "Learning Reward":
+            return "Coinbase Reward"
+        elif trx_type in ["Inflation Reward", "Staking Income"]:
+            return "Stake"
+        elif trx_type == "Receive":
+            if (
+                row["NotesHelper"][-2] == "Coinbase"
+                and row["NotesHelper"][-1] in ["Earn", "Rewards"]
+            ):
+                return "Coinbase Reward"
+            elif row["NotesHelper"][-1] == "from":
+                return "Stake"
+        elif trx_type in ["Send", "Withdrawal"]:
+            return "Withdraw"
+        elif trx_type == "Buy":
+            return "Buy"
+        elif trx_type in ["Sell", "Convert"]:
+            if row["_new_FromAsset"] in USDS:
+                return "Buy"
+            elif row["_new_ToAsset"] in USDS:
+                return "Sell"
+            else:
+                return "Pairwise"
+        else:
+            return np.nan
+
+    input_df["NotesHelper"] = input_df["Notes"].str.split()
+
+    input_df["_new_Datetime"] = pd.to_datetime(input_df["Timestamp"], utc=True)  # noqa: E501
+    input_df["_new_FromAccount"] = input_df.apply(from_account_finder, axis=1)  # noqa: E501
+    input_df["_new_ToAccount"] = input_df.apply(to_account_finder, axis=1)  # noqa: E501
+    input_df["_new_FromAsset"] = input_df.apply(from_asset_finder, axis=1)  # noqa: E501
+    input_df["_new_ToAsset"] = input_df.apply(to_asset_finder, axis=1)  # noqa: E501
+    input_df["_new_InAmount"] = input_df.apply(in_amount_finder, axis=1)  # noqa: E501
+    input_df["_new_OutAmount"] = input_df.apply(out_amount_finder, axis=1)  # noqa: E501
+    input_df["_new_FeeAsset"] = "USD"
+    input_df["_new_FeeAmount"] = input_df["Fees and/or Spread"].copy(deep=True)  # noqa: E501
+    input_df["_new_FeeValue"] = input_df["Fees and/or Spread"].copy(deep=True)  # noqa: E501
+    input_df["_new_TrxType"] = input_df.apply(trx_type_finder, axis=1)
+    input_df["_new_TrxSubType"] = input_df.apply(trx_sub_type_finder, axis=1)  # noqa: E501
+    input_df["_new_AssetType"] = "Crypto"
+
+    return input_df
+
+
+@pytest.fixture
+def coinbase_df():
+    rows = [
+        ("Buy", "BTC", "Bought 0.01 BTC for $200.00 USD"),
+        ("Sell", "BTC", "Sold 0.01 BTC for $210.00 USD"),
+        ("Convert", "ETH", "Converted 0.5 ETH to 12.3 BTC"),
+        ("Convert", "USDC", "Converted 100 USDC to $100.00 USDT"),
+        ("Send", "ETH", "Sent 0.5 ETH to 0xabc"),
+        ("Send", "ETH", "Sent 0.5 ETH to "),
+        ("Send", "ETH", "Sent 0.5 ETH"),
+        ("Send", "ETH", np.nan),
+        ("Withdrawal", "USD", "Withdrew $50.00 USD"),
+        ("Receive", "BTC", "Received 0.1 BTC from Coinbase Earn"),
+        ("Receive", "BTC", "Received 0.1 BTC from Coinbase  Rewards "),
+        ("Receive", "ETH", "Received 0.1 ETH from"),
+        ("Receive", "ETH", "Received 0.1 ETH from an external account"),
+        ("Learning Reward", "GRT", "Received 1 GRT from Coinbase Earn"),
+        ("Staking Income", "ATOM", "Received 0.1 ATOM"),
+        ("Inflation Reward", "XTZ", np.nan),
+        ("Rewards Income", "ETH", "Something new"),
+    ]
+    n_rows = len(rows)
+    df = pd.DataFrame({
+        "Timestamp": pd.date_range("2023-01-01", periods=n_rows, tz="UTC"),
+        "Transaction Type": [row[0] for row in rows],
+        "Asset": [row[1] for row in rows],
+        "Quantity Transacted": np.linspace(0.1, 2, n_rows),
+        "Spot Price Currency": "USD",
+        "Spot Price at Transaction": np.linspace(10, 200, n_rows),
+        "Subtotal": np.linspace(5, 100, n_rows),
+        "Total (inclusive of fees and/or spread)": np.linspace(6, 101, n_rows),
+        "Fees and/or Spread": np.linspace(0, 1, n_rows),
+        "Notes": [row[2] for row in rows],
+    })
+    return df
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_csv_cleaning_matches_row_wise(
+    coinbase_df, categorical, assert_same_new_columns
+):
+    if categorical:
+        coinbase_df["Transaction Type"] = (
+            coinbase_df["Transaction Type"].astype("category"))
+    expected = row_wise_csv_cleaning(coinbase_df.copy())
+    service = Coinbase.ExchangeService(Coinbase()._this_meta_data)
+    result = service._csv_cleaning(coinbase_df.copy(), "Coinbase")
+
+    assert_same_new_columns(result, expected)
+
+
+@pytest.mark.parametrize("notes", ["Received", np.nan])
+def test_csv_cleaning_short_notes(coinbase_df, notes):
+    coinbase_df.loc[9, "Notes"] = notes
+    with pytest.raises((IndexError, TypeError)):
+        row_wise_csv_cleaning(coinbase_df.copy())
+    service = Coinbase.ExchangeService(Coinbase()._this_meta_data)
+    with pytest.raises(ValueError, match=re.escape("The indexes: [9]")):
+        service._csv_cleaning(coinbase_df, "Coinbase")
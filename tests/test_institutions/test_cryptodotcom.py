@@ -0,0 +1,188 @@
+import numpy as np
+import pandas as pd
+
+from mymoney.institutions.cryptodotcom import CryptoDotCom
+
+
+USDS = ["USD", "USDC", "USDT"]
+
+
+def row_wise_csv_cleaning(input_df):
+    """The row-wise cleaning of Crypto.com before it was vectorized."""
+    def from_account_finder(val):
+        if val in [
+            "crypto_exchange",
+            "crypto_withdrawal",
+            "crypto_earn_interest_paid",
+            "crypto_earn_program_withdrawn",
+            "crypto_earn_program_created",
+            "rewards_platform_deposit_credited",
+        ]:
+            return "cryptodotcom"
+        elif val == "crypto_purchase":
+            return "Bank"
+        elif val == "crypto_deposit":
+            # Alternative: f'{row["ToAsset"]} Network'
+            return "Wallet"
+        else:
+            return np.nan
+
+    def to_account_finder(val):
+        if val in [
+            "crypto_earn_interest_paid",
+            "crypto_purchase",
+            "crypto_deposit",
+            "crypto_exchange",
+            "rewards_platform_deposit_credited",
+            "crypto_earn_program_withdrawn",
+            "crypto_earn_program_created",
+        ]:
+            return "cryptodotcom"
+        elif val == "crypto_withdrawal":
+            # Alternative: f'{row["ToAsset"]} Network'
+            return "Wallet"
+        else:
+            return np.nan
+
+    def from_asset_finder(row):
+        trx_kind = row["Transaction Kind"]
+        if trx_kind == "crypto_purchase":
+            return "USD"
+        elif trx_kind == "rewards_platform_deposit_credited":
+            return "R3W"
+        elif trx_kind in [
+            "crypto_exchange",
+            "crypto_withdrawal",
+            "crypto_earn_interest_paid",
+            "crypto_earn_program_withdrawn",
+            "crypto_earn_program_created",
+            "crypto_deposit",
+        ]:
+            return row["Currency"]
+        else:
+            return np.nan
+
+    def to_asset_finder(row):
+        if pd.isna(row["To Currency"]):
+            return row["Currency"]
+        else:
+            return row["To Currency"]
+
+    def in_amount_finder(row):
+        trx_kind = row["Transaction Kind"]
+        if trx_kind == "crypto_purchase":
+            return abs(row["Native Amount"])
+        elif trx_kind in [
+            "rewards_platform_deposit_credited",
+            "crypto_earn_interest_paid",
+        ]:
+            return .0
+        elif trx_kind in [
+            "crypto_exchange",
+            "crypto_withdrawal",
+            "crypto_deposit",
+            "crypto_earn_program_withdrawn",
+            "crypto_earn_program_created",
+        ]:
+            return row["Amount"]
+        else:
+            return np.nan
+
+    def out_amount_finder(row):
+        if pd.isna(row["To Currency"]):
+            return row["Amount"]
+        else:
+            return row["To Amount"]
+
+    def trx_sub_type_finder(row):
+        trx_kind = row["Transaction Kind"]
+        if trx_kind == "crypto_earn_interest_paid":
+            return "Stake"
+        elif trx_kind in [
+            "crypto_earn_program_withdrawn",
+            "crypto_earn_program_created",
+        ]:
+            return "Redundant"
+        elif trx_kind in ["crypto_withdrawal", "crypto_deposit"]:
+            return "Crypto"
+        elif trx_kind == "crypto_purchase":
+            return "Buy"
+        elif trx_kind == "rewards_platform_deposit_credited":
+            return "CryptoDotComRewards"
+        elif trx_kind == "crypto_exchange":
+            if row["Currency"] in USDS:
+                return "Buy"
+            elif row["To Currency"] in USDS:
+                return "Sell"
+            else:
+                return "Pairwise"
+        else:
+            return np.nan
+
+    trx_type_mapping = {
+        "crypto_earn_interest_paid": "HODL",
+        "crypto_purchase": "Transfer",
+        "crypto_withdrawal": "Transfer",
+        "crypto_deposit": "Transfer",
+        "crypto_exchange": "Trade",
+        "rewards_platform_deposit_credited": "Reward",
+        "crypto_earn_program_withdrawn": "HODL",
+        "crypto_earn_program_created": "HODL",
+    }
+
+    input_df["Amount"] = input_df["Amount"].abs()
+
+    input_df["_new_Datetime"] = pd.to_datetime(input_df["Timestamp (UTC)"], utc=True)  # noqa: E501
+    input_df["_new_FromAccount"] = input_df["Transaction Kind"].map(from_account_finder)  # noqa: E501
+    input_df["_new_ToAccount"] = input_df["Transaction Kind"].map(to_account_finder)  # noqa: E501
+    input_df["_new_FromAsset"] = input_df.apply(from_asset_finder, axis=1)  # noqa: E501
+    input_df["_new_ToAsset"] = input_df.apply(to_asset_finder, axis=1)  # noqa: E501
+    input_df["_new_InAmount"] = input_df.apply(in_amount_finder, axis=1)  # noqa: E501
+    input_df["_new_OutAmount"] = input_df.apply(out_amount_finder, axis=1)  # noqa: E501
+    input_df["_new_FeeAsset"] = "USD"
+    input_df["_new_FeeAmount"] = .0
+    input_df["_new_FeeValue"] = .0
+    input_df["_new_TrxType"] = input_df["Transaction Kind"].map(trx_type_mapping)  # noqa: E501
+    input_df["_new_TrxSubType"] = input_df.apply(trx_sub_type_finder, axis=1)  # noqa: E501
+    input_df["_new_AssetType"] = "Crypto"
+    # input_df["_new_USDAmount"] = input_df["Native Amount"].abs()
+
+    return input_df
+
+
+def generate_cryptodotcom_df(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    currencies = ["USD", "USDC", "BTC", "CRO"]
+
+    def choice(values):
+        return rng.choice(np.array(values, dtype=object), n_rows)
+
+    return pd.DataFrame({
+        "Timestamp (UTC)": pd.date_range(
+            "2023-01-01", periods=n_rows, freq="min"),
+        "Transaction Description": "desc",
+        "Currency": choice(currencies),
+        "Amount": rng.uniform(-100, 100, n_rows),
+        "To Currency": choice(currencies + [np.nan, np.nan]),
+        "To Amount": rng.uniform(0, 100, n_rows),
+        "Native Currency": "USD",
+        "Native Amount": rng.uniform(-100, 100, n_rows),
+        "Native Amount (in USD)": rng.uniform(0, 100, n_rows),
+        "Transaction Kind": choice([
+            "crypto_earn_program_withdrawn", "crypto_earn_interest_paid",
+            "crypto_earn_program_created", "crypto_exchange",
+            "crypto_deposit", "crypto_withdrawal",
+            "rewards_platform_deposit_credited", "crypto_purchase",
+            "viban_purchase",
+        ]),
+        "Transaction Hash": np.nan,
+    })
+
+
+def test_csv_cleaning_matches_row_wise(assert_same_new_columns):
+    cryptodotcom_df = generate_cryptodotcom_df(2000)
+    expected = row_wise_csv_cleaning(cryptodotcom_df.copy())
+    service = CryptoDotCom.ExchangeService(CryptoDotCom()._this_meta_data)
+    result = service._csv_cleaning(cryptodotcom_df, "CryptoDotCom")
+
+    assert_same_new_columns(result, expected)
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+from mymoney.institutions.chase import Chase
+from mymoney.institutions.sofi import SoFi
+from mymoney.utils.meta_data import get_meta_data_registry
+
+
+def test_expense_columns():
+    service = Chase.DebitService(get_meta_data_registry().institution("chase"))  # noqa: E501
+    df = pd.DataFrame({
+        "Description": [" ACCT XFER ", np.nan, "Coffee"],
+        "Amount": [-10.0, 5.0, -2.5],
+        "Type": ["ACCT_XFER", "ACH_CREDIT", "DEBIT_CARD"],
+    }, index=[3, 4, 5])
+
+    result = service._expense_columns(
+        df,
+        institution="Chase",
+        account_name="MyChecking",
+        description=df["Description"],
+        amount=df["Amount"],
+        date=df["Amount"],
+    )
+
+    assert result is df
+    assert result["_new_Description"].tolist() == [
+        "ACCT XFER", "nan", "Coffee"]
+    assert result["_new_InstitutionCategory"].isna().all()
+    for col, val in [
+        ("_new_Institution", "Chase"),
+        ("_new_AccountName", "MyChecking"),
+        ("_new_Service", "debit"),
+    ]:
+        assert result[col].dtype == pd.CategoricalDtype([val])
+        assert (result[col] == val).all()
+    assert result["_new_IsTransfer"].tolist() == [
+        "transfer", "expense", "expense"]
+
+
+def test_expense_columns_with_series():
+    service = SoFi.DebitService(get_meta_data_registry().institution("sofi"))
+    df = pd.DataFrame({
+        "Description": [" Rent "],
+        "Type": ["Withdrawal"],
+        "Account": ["1234"],
+    })
+
+    result = service._expense_columns(
+        df,
+        institution="SoFi",
+        account_name=df["Account"],
+        description=df["Description"],
+        amount=df["Account"],
+        date=df["Account"],
+        category=df["Type"],
+        my_category=np.nan,
+        strip_description=False,
+    )
+
+    assert result["_new_Description"].tolist() == [" Rent "]
+    assert result["_new_AccountName"].dtype == object
+    assert result["_new_InstitutionCategory"].tolist() == ["Withdrawal"]
+    assert result["_new_MyCategory"].isna().all()
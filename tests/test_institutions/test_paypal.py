@@ -0,0 +1,80 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from mymoney.institutions.paypal import PayPal
+
+
+def row_wise_csv_cleaning(input_df, account_name):
+    """The row-wise cleaning of PayPal before it was vectorized."""
+    def is_transfer_finder(row):
+        name_is_nan = pd.isna(row["Name"])
+        try:
+            regex_flag_redundant = re.search(
+                r"Authorization|Order", str(row["Type"])
+            )
+        except Exception:
+            return "consider"
+
+        if regex_flag_redundant:
+            return "redundant"
+        elif name_is_nan:
+            return "transfer"
+        elif not (name_is_nan or regex_flag_redundant):
+            return "expense"
+        else:
+            return "consider"
+
+    def description_finder(row):
+        if pd.isna(row["Name"]):
+            out = str(row["Type"])
+        else:
+            out = f"{str(row['Name'])}: {row['Type']}"
+
+        return out.strip()
+
+    def amount_finder(val):
+        return float(str(val).replace(",", ""))
+
+    input_df["_new_Description"] = input_df.apply(description_finder, axis=1)  # noqa: E501
+    input_df["_new_Amount"] = input_df["Amount"].map(amount_finder)
+    input_df["_new_Date"] = input_df["Date"].copy(deep=True)
+    input_df["_new_InstitutionCategory"] = np.nan
+    input_df["_new_MyCategory"] = np.nan
+    input_df["_new_Institution"] = "PayPal"
+    input_df["_new_AccountName"] = account_name
+    input_df["_new_Service"] = "3rdparty"
+    input_df["_new_IsTransfer"] = input_df.apply(is_transfer_finder, axis=1)  # noqa: E501
+
+    return input_df
+
+
+def generate_paypal_df(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+
+    def choice(values):
+        return rng.choice(np.array(values, dtype=object), n_rows)
+
+    return pd.DataFrame({
+        "Date": pd.date_range(
+            "2023-01-01", periods=n_rows, freq="min", tz="UTC"),
+        "Name": choice(["Shop", " Friend", np.nan]),
+        "Type": choice([
+            "Express Checkout Payment", "General Authorization", "Order",
+            "Bank Deposit to PP Account ", np.nan,
+        ]),
+        "Status": "Completed",
+        "Currency": "USD",
+        "Amount": choice(["-195.86", "-1,408.31", "12.00", "1,000,000.01"]),
+    })
+
+
+def test_csv_cleaning_matches_row_wise(assert_same_new_columns):
+    paypal_df = generate_paypal_df(2000)
+    expected = row_wise_csv_cleaning(paypal_df.copy(), "PayPal")
+    service = PayPal.ThirdPartyService(PayPal()._this_meta_data)
+
+    result = service._csv_cleaning(paypal_df, "PayPal")
+
+    assert_same_new_columns(result, expected)
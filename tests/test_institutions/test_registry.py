@@ -0,0 +1,141 @@
+import sys
+import subprocess
+from multiprocessing import get_context
+
+import pytest
+import pandas as pd
+
+from mymoney.core.data_reader import DataReader
+from mymoney.institutions import institution_base
+from mymoney.institutions.registry import (
+    get_institution_registry,
+    register_institution,
+)
+from mymoney.utils import meta_data
+from mymoney.utils.meta_data import get_meta_data_registry
+
+
+class MyBank(institution_base.Institution):
+    """An in-house institution for the tests."""
+
+    _this_institution_name = "mybank"
+
+    class CreditService(institution_base.Institution.CreditService):
+
+        def _csv_cleaning(self, input_df, account_name):
+            return self._expense_columns(
+                input_df,
+                institution="MyBank",
+                account_name=account_name,
+                description=input_df["Memo"],
+                amount=input_df["Value"],
+                date=input_df["Day"],
+            )
+
+
+mybank_meta_data = {
+    "credit": {
+        "columns": ["Day", "Memo", "Value"],
+        "read_args": {"header": 0, "parse_dates": ["Day"], "names": None},
+        "validation_data": {"schema": {"Value": "float"}},
+        "transfer_rules": {
+            "rules": [
+                {"column": "_new_Description", "regex": "PAYMENT",
+                 "label": "transfer"},
+            ],
+            "default": "expense",
+        },
+    },
+}
+
+
+@pytest.fixture
+def registries(monkeypatch):
+    """Restore the process-wide registries after the test."""
+    institutions = get_institution_registry()
+    monkeypatch.setattr(
+        institutions, "_institutions", dict(institutions._institutions))
+    monkeypatch.setattr(institutions, "_added", dict(institutions._added))
+    monkeypatch.setattr(
+        meta_data, "_added_meta_data", dict(meta_data._added_meta_data))
+    get_meta_data_registry.cache_clear()
+    yield institutions
+    get_meta_data_registry.cache_clear()
+
+
+@pytest.fixture
+def mybank_folder(tmp_path):
+    for i in range(2):
+        (tmp_path / f"statement_{i}.csv").write_text(
+            "Day,Memo,Value\n"
+            "2023-01-05, COFFEE ,-3.5\n"
+            "2023-01-06,PAYMENT,100.0\n"
+        )
+    return str(tmp_path)
+
+
+def test_institutions_are_imported_lazily():
+    code = (
+        "import sys, mymoney.core\n"
+        "assert 'mymoney.institutions.amex' not in sys.modules\n"
+        "from mymoney.institutions.registry import get_institution_registry\n"
+        "get_institution_registry().get('amex')\n"
+        "assert 'mymoney.institutions.amex' in sys.modules\n"
+        "assert 'mymoney.institutions.chase' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_registry_get(registries):
+    from mymoney.institutions.chase import Chase
+
+    assert registries.get("chase") is Chase
+    assert "chase" in registries
+    with pytest.raises(ValueError):
+        registries.get("mybank")
+    with pytest.raises(ValueError):
+        register_institution("chase", "mymoney.institutions.chase:Chase")
+
+
+def test_register_institution(registries, tmp_path):
+    path = tmp_path / "statement.csv"
+    path.write_text(
+        "Day,Memo,Value\n"
+        "2023-01-05, COFFEE ,-3.5\n"
+        "2023-01-06,PAYMENT,100.0\n"
+    )
+    register_institution("mybank", MyBank, meta_data=mybank_meta_data)
+
+    inst = DataReader().read_csv_file(str(path))
+
+    assert (inst.institution_name, inst.service_name) == ("mybank", "credit")
+    assert inst.output_df["Description"].tolist() == ["COFFEE", "PAYMENT"]
+    assert inst.output_df["IsTransfer"].tolist() == ["expense", "transfer"]
+    assert isinstance(inst.output_df["Date"].dtype, pd.DatetimeTZDtype)
+
+
+def test_register_institution_keeps_base_registry(registries):
+    base = get_meta_data_registry()
+    register_institution("mybank", MyBank, meta_data=mybank_meta_data)
+    registry = get_meta_data_registry()
+
+    assert "mybank" not in base
+    assert "mybank" in registry
+    assert registry.hash != base.hash
+    assert sum(
+        len(services) for services in registry.column_index.values()
+    ) == sum(len(services) for services in base.column_index.values()) + 1
+
+
+def test_register_institution_spawn_workers(registries, mybank_folder):
+    register_institution("mybank", MyBank, meta_data=mybank_meta_data)
+    reader = DataReader()
+
+    inst_data_list = reader.read_csv_folder(
+        mybank_folder, workers=2, mp_context=get_context("spawn"))
+
+    assert reader.failed_files == {}
+    assert [inst.institution_name for inst in inst_data_list] == [
+        "mybank", "mybank"]
+    assert inst_data_list[0].output_df["IsTransfer"].tolist() == [
+        "expense", "transfer"]
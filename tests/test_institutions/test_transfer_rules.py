@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mymoney.institutions.amex import AmEx
+from mymoney.institutions.capitalone import CapitalOne
+from mymoney.institutions.cashapp import CashApp
+from mymoney.institutions.chase import Chase
+from mymoney.institutions.citi import Citi
+from mymoney.institutions.discover import Discover
+from mymoney.institutions.paypal import PayPal
+from mymoney.institutions.samsclub import SamsClub
+from mymoney.institutions.sofi import SoFi
+from mymoney.institutions.venmo import Venmo
+from mymoney.institutions.wellsfargo import WellsFargo
+from mymoney.utils.meta_data import get_meta_data_registry
+
+
+@pytest.mark.parametrize(
+    "inst_class, service_class, data, expected",
+    [
+        (
+            AmEx, "CreditService",
+            {"_new_Description": [
+                "PAYPAL *STORE", "AUTOPAY PAYMENT - THANK YOU",
+                "GROCERY", "nan"]},
+            ["transfer", "transfer", "expense", "expense"],
+        ),
+        (
+            CapitalOne, "CreditService",
+            {"_new_Description": [
+                "CAPITAL ONE MOBILE PYMT", "PAYPAL", "CAPITAL ONE"]},
+            ["transfer", "transfer", "expense"],
+        ),
+        (
+            CapitalOne, "DebitService",
+            {"_new_Description": [
+                "SOFI CREDIT CARD PAYMT", "CAPITAL ONE ONLINE PMT",
+                "360 Checking", "Coffee"]},
+            ["transfer", "transfer", "transfer", "expense"],
+        ),
+        (
+            CashApp, "ThirdPartyService",
+            {"Status": [
+                "PAYMENT REVERSED", "TRANSFER SENT", "PAYMENT SENT",
+                "PAYMENT DEPOSITED", np.nan]},
+            ["redundant", "transfer", "expense", "expense", "consider"],
+        ),
+        (
+            Chase, "CreditService",
+            {"Type": ["Sale", "Return", "Payment", "Fee", np.nan]},
+            ["expense", "expense", "transfer", "consider", "consider"],
+        ),
+        (
+            Chase, "DebitService",
+            {"Type": ["ACCT_XFER", "DEBIT_CARD"]},
+            ["transfer", "expense"],
+        ),
+        (
+            Citi, "CreditService",
+            {
+                "_new_Description": [
+                    "AUTOPAY 000", "ONLINE PAYMENT, THANK YOU", "GAS"],
+                "Credit": [-10.0, np.nan, np.nan],
+            },
+            ["transfer", "consider", "expense"],
+        ),
+        (
+            Discover, "CreditService",
+            {"_new_Description": [
+                "INTERNET PAYMENT - THANK YOU",
+                "INTERNET PAYMENT - THANK YOU 2", "DIRECTPAY FULL BALANCE"]},
+            ["transfer", "expense", "transfer"],
+        ),
+        (
+            PayPal, "ThirdPartyService",
+            {
+                "Type": ["General Authorization", "Bank Deposit", "Payment"],
+                "Name": ["Store", np.nan, "Store"],
+            },
+            ["redundant", "transfer", "expense"],
+        ),
+        (
+            SamsClub, "CreditService",
+            {"Description": [
+                "AUTOMATIC PAYMENT - THANK YOU", "SAMS CLUB", np.nan]},
+            ["transfer", "expense", "consider"],
+        ),
+        (
+            SoFi, "DebitService",
+            {"Type": ["Withdrawal", "Deposit", "Debit Card"]},
+            ["transfer", "transfer", "expense"],
+        ),
+        (
+            Venmo, "ThirdPartyService",
+            {"Type": ["Standard Transfer", "Charge", "Unknown"]},
+            ["transfer", "expense", "consider"],
+        ),
+        (
+            WellsFargo, "CreditService",
+            {"_new_Description": [
+                "AUTOMATIC PAYMENT - THANK YOU", "ONLINE TRANSFER REF"]},
+            ["transfer", "expense"],
+        ),
+        (
+            WellsFargo, "DebitService",
+            {"_new_Description": [
+                "ONLINE TRANSFER REF #123", "PAYPAL TRANSFER", "PAYROLL"]},
+            ["transfer", "transfer", "expense"],
+        ),
+    ],
+)
+def test_is_transfer_finder(inst_class, service_class, data, expected):
+    service = getattr(inst_class, service_class)(
+        get_meta_data_registry().institution(
+            inst_class._this_institution_name))
+    df = pd.DataFrame(data, index=range(10, 10 + len(expected)))
+
+    result = service._is_transfer_finder(df)
+
+    pd.testing.assert_series_equal(
+        result, pd.Series(expected, index=df.index, dtype=object))
+
+
+def test_is_transfer_finder_categorical_column():
+    service = Chase.CreditService(get_meta_data_registry().institution("chase"))  # noqa: E501
+    df = pd.DataFrame({
+        "Type": pd.Series(["Payment", "Sale", np.nan], dtype="category")})
+
+    assert service._is_transfer_finder(df).tolist() == [
+        "transfer", "expense", "consider"]
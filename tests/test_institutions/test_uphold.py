@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+
+from mymoney.institutions.uphold import Uphold
+
+
+USDS = ["USD", "USDC", "USDT"]
+
+
+def row_wise_csv_cleaning(input_df):
+    """The row-wise cleaning of Uphold before it was vectorized."""
+    def from_account_finder(row):
+        origin, row_type = row["Origin"], row["Type"]
+
+        if origin == "uphold":
+            if row_type == "in":
+                return "Brave"
+            elif row_type in ["out", "transfer"]:
+                return "Uphold"
+            else:
+                return np.nan
+        elif origin == "bank":
+            return "Bank"
+        else:
+            return np.nan
+
+    def to_account_finder(val):
+        if val == "uphold":
+            return "Uphold"
+        elif val == "ethereum":
+            # Alternative: f'{row["ToAsset"]} Network'
+            return "Wallet"
+        elif val == "bank":
+            return "Bank"
+        else:
+            return np.nan
+
+    def from_asset_finder(row):
+        if row["_new_FromAccount"] == "Brave":
+            return "R3W"
+        else:
+            return row["Origin Currency"]
+
+    def in_amount_finder(row):
+        if row["_new_FromAsset"] == "R3W":
+            return .0
+        return float(row["Origin Amount"])
+
+    def fee_value_finder(val):
+        if pd.isna(val):
+            return .0
+        else:
+            return np.nan
+
+    def trx_type_finder(row):
+        row_type = row["Type"]
+        if row_type == "transfer":
+            return "Trade"
+        elif row_type == "out":
+            return "Transfer"
+        elif row_type == "in":
+            from_acc = row["_new_FromAccount"]
+            if from_acc == "Brave":
+                return "Reward"
+            elif from_acc == "Bank":
+                return "Transfer"
+            else:
+                return np.nan
+        else:
+            return np.nan
+
+    def trx_sub_type_finder(row):
+        trx_type = row["_new_TrxType"]
+        from_asset = row["_new_FromAsset"]
+        to_asset = row["_new_ToAsset"]
+        from_acc = row["_new_FromAccount"]
+        to_acc = row["_new_ToAccount"]
+
+        if trx_type == "Trade":
+            if from_asset in USDS:
+                return "Buy"
+            elif to_asset in USDS:
+                return "Sell"
+            else:
+                return "Pairwise"
+        elif trx_type == "Transfer":
+            if from_acc == "Bank":
+                if to_asset in USDS:
+                    return "Deposit"
+                else:
+                    return "Buy"
+            elif to_acc == "Bank":
+                if from_asset in USDS:
+                    return "Withdrawal"
+                else:
+                    return "Sell"
+            elif to_acc == "Wallet":
+                return "Crypto"
+            else:
+                return np.nan
+        elif trx_type == "Reward":
+            return "Brave"
+        elif trx_type == "HODL":
+            return "HODL"
+        else:
+            return np.nan
+
+    def usd_amount_finder(row):
+        from_asset = row["_new_FromAsset"]
+        to_asset = row["_new_ToAsset"]
+        in_amount = row["_new_InAmount"]
+        out_amount = row["_new_OutAmount"]
+
+        if from_asset in USDS and to_asset in USDS:
+            return max(in_amount, out_amount)
+        elif from_asset in USDS:
+            return in_amount
+        elif to_asset in USDS:
+            return out_amount
+        else:
+            return np.nan
+
+    input_df["_new_Datetime"] = pd.to_datetime(input_df["Date"], utc=True)  # noqa: E501
+    input_df["_new_FromAccount"] = input_df.apply(from_account_finder, axis=1)  # noqa: E501
+    input_df["_new_ToAccount"] = input_df["Destination"].map(to_account_finder)  # noqa: E501
+    input_df["_new_FromAsset"] = input_df.apply(from_asset_finder, axis=1)  # noqa: E501
+    input_df["_new_ToAsset"] = input_df["Destination Currency"]
+    input_df["_new_InAmount"] = input_df.apply(in_amount_finder, axis=1)  # noqa: E501
+    input_df["_new_OutAmount"] = input_df["Destination Amount"]
+    input_df["_new_FeeAsset"] = input_df["Fee Currency"].fillna("USD")
+    input_df["_new_FeeAmount"] = input_df["Fee Amount"].fillna(.0)
+    input_df["_new_FeeValue"] = input_df["Fee Amount"].map(fee_value_finder)  # noqa: E501
+    input_df["_new_TrxType"] = input_df.apply(trx_type_finder, axis=1)
+    input_df["_new_TrxSubType"] = input_df.apply(trx_sub_type_finder, axis=1)  # noqa: E501
+    input_df["_new_AssetType"] = "Crypto"
+    # input_df["_new_USDAmount"] = input_df.apply(usd_amount_finder, axis=1)  # noqa: E501
+
+    return input_df
+
+
+def generate_uphold_df(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    currencies = ["USD", "USDC", "BAT", "ETH", np.nan]
+
+    def choice(values):
+        return rng.choice(np.array(values, dtype=object), n_rows)
+
+    return pd.DataFrame({
+        "Date": pd.date_range(
+            "2023-01-01", periods=n_rows, freq="min", tz="UTC"),
+        "Destination": choice(["uphold", "ethereum", "bank", "other"]),
+        "Destination Amount": rng.uniform(0, 100, n_rows),
+        "Destination Currency": choice(currencies),
+        "Fee Amount": np.where(
+            rng.random(n_rows) < .5, np.nan, rng.uniform(0, 1, n_rows)),
+        "Fee Currency": choice(["USD", "BAT", np.nan]),
+        "Id": "id",
+        "Origin": choice(["uphold", "bank", "other"]),
+        "Origin Amount": rng.uniform(0, 100, n_rows),
+        "Origin Currency": choice(currencies),
+        "Status": "completed",
+        "Type": choice(["in", "out", "transfer", "other"]),
+    })
+
+
+def test_csv_cleaning_matches_row_wise(assert_same_new_columns):
+    uphold_df = generate_uphold_df(2000)
+    expected = row_wise_csv_cleaning(uphold_df.copy())
+    service = Uphold.ExchangeService(Uphold()._this_meta_data)
+
+    # As read by DataReader with the dtypes of meta_data
+    uphold_df[["Origin", "Status", "Type"]] = (
+        uphold_df[["Origin", "Status", "Type"]].astype("category"))
+    result = service._csv_cleaning(uphold_df, "Uphold")
+
+    assert_same_new_columns(result, expected)
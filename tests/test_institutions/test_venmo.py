@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+from mymoney.institutions.venmo import Venmo
+
+
+def row_wise_csv_cleaning(input_df, account_name):
+    """The row-wise cleaning of Venmo before it was vectorized."""
+    def is_transfer_finder(val):
+        transfer_list = ["Standard Transfer", "Credit Card Payment"]
+        expense_list = [
+            "Payment", "Charge",
+            "Merchant Transaction", "Credit Card Reward"
+        ]
+        if val in transfer_list:
+            return "transfer"
+        elif val in expense_list:
+            return "expense"
+        else:
+            return "consider"
+
+    def amount_finder(row):
+        float_amount = float(
+            str(row["Amount (total)"])
+            .replace(" $", "").replace(",", ""))
+
+        if row["Type"] == "Credit Card Payment":
+            return -float_amount
+        else:
+            return float_amount
+
+    def description_finder(row):
+        row_type = row["Type"]
+        if row_type == "Standard Transfer":
+            out = f"transfer to {row['Destination']}"
+        elif row_type == "Merchant Transaction":
+            out = row["To"]
+        elif row_type == "Payment":
+            out = f"{row['From']} -> {row['To']}: {row['Note']}"
+        elif row_type == "Charge":
+            out = f"{row['To']} -> {row['From']}: {row['Note']}"
+        elif row_type in ["Credit Card Payment", "Credit Card Reward"]:
+            out = row_type
+        else:
+            out = (
+                f"Consider: {row['Note']}:"
+                f" {row['From']} -> {row['To']}. (Type: {row_type})"
+            )
+
+        return out.strip()
+
+    input_df["_new_Description"] = input_df.apply(description_finder, axis=1)  # noqa: E501
+    input_df["_new_Amount"] = input_df.apply(amount_finder, axis=1)
+    input_df["_new_Date"] = input_df["Datetime"].copy(deep=True)
+    input_df["_new_InstitutionCategory"] = np.nan
+    input_df["_new_MyCategory"] = np.nan
+    input_df["_new_Institution"] = "Venmo"
+    input_df["_new_AccountName"] = account_name
+    input_df["_new_Service"] = "3rdparty"
+    input_df["_new_IsTransfer"] = input_df["Type"].map(is_transfer_finder)  # noqa: E501
+
+    return input_df.dropna(subset=["_new_Date"])
+
+
+def generate_venmo_df(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+
+    def choice(values):
+        return rng.choice(np.array(values, dtype=object), n_rows)
+
+    return pd.DataFrame({
+        "Datetime": pd.date_range(
+            "2023-01-01", periods=n_rows, freq="min", tz="UTC"),
+        "Type": choice([
+            "Payment", "Charge", "Merchant Transaction", "Standard Transfer",
+            "Credit Card Payment", "Credit Card Reward", "Other", np.nan,
+        ]),
+        "Status": "Complete",
+        "Note": choice(["pizza", " rent ", np.nan]),
+        "From": choice(["Me", "Friend"]),
+        "To": choice(["Me", "Shop", "Friend "]),
+        "Amount (total)": choice([
+            "- $12.00", "+ $1,234.56", "+ $0.50", "- $1,000.00", np.nan]),
+        "Destination": choice(["Bank", np.nan]),
+    })
+
+
+def test_csv_cleaning_matches_row_wise(assert_same_new_columns):
+    venmo_df = generate_venmo_df(2000)
+    expected = row_wise_csv_cleaning(venmo_df.copy(), "Venmo")
+    service = Venmo.ThirdPartyService(Venmo()._this_meta_data)
+
+    result = service._csv_cleaning(venmo_df, "Venmo")
+
+    assert_same_new_columns(result, expected)
@@ -1,7 +1,11 @@
 import pytest
+import numpy as np
+import pandas as pd
 
 from mymoney.utils.common import column_name_checker
 from mymoney.utils.common import raise_or_log
+from mymoney.utils.common import money_to_float
+from mymoney.utils.common import concat_dataframes
 from mymoney.utils.exceptions import DifferentColumnNameException
 
 
@@ -54,3 +58,38 @@ def test_raise_or_log_with_OSError():
             message=msg, logs=False, raises=True, exception_type=OSError
         )
     assert "OSError message!" in str(exception_info.value)
+
+
+def test_money_to_float():
+    ser = pd.Series(["$1,234.56", "-$12.00", "- $12.00", "+ $0.50", np.nan])
+    pd.testing.assert_series_equal(
+        money_to_float(ser),
+        pd.Series([1234.56, -12., -12., .5, np.nan]),
+    )
+    pd.testing.assert_series_equal(
+        money_to_float(pd.Series([1, 2])), pd.Series([1., 2.]))
+    with pytest.raises(ValueError):
+        money_to_float(pd.Series(["12 USD"]))
+
+
+def test_concat_dataframes():
+    df1 = pd.DataFrame({
+        "Institution": pd.Categorical(["Chase", "Chase"]),
+        "Amount": [1.0, 2.0],
+    })
+    df2 = pd.DataFrame({
+        "Amount": [3.0],
+        "Institution": pd.Categorical(["AmEx"]),
+        "AccountName": pd.Categorical([1234]),
+    })
+
+    result = concat_dataframes([df1, df2])
+
+    assert list(result.columns) == ["Institution", "Amount", "AccountName"]
+    assert list(result.index) == [0, 1, 2]
+    assert result["Institution"].dtype == pd.CategoricalDtype(
+        ["AmEx", "Chase"])
+    assert result["Institution"].tolist() == ["Chase", "Chase", "AmEx"]
+    assert result["AccountName"].cat.categories.tolist() == [1234]
+    assert result["AccountName"].isna().tolist() == [True, True, False]
+    assert concat_dataframes([]).empty
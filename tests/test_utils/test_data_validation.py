@@ -1,7 +1,11 @@
 import pytest
+import numpy as np
+import pandas as pd
 
 from mymoney.utils.data_validation import SeriesValidation  # noqa: F401
 from mymoney.utils.data_validation import DataFrameValidation
+from mymoney.utils.data_validation import compile_validation_plan
+from mymoney.utils.data_validation import StreamingNStdValidator
 
 
 # SeriesValidation related tests
@@ -114,6 +118,22 @@ def test_has_vals_superset(series_bool, series_string, series_int):
             [i for i in range(5, 10)], "superset", raises=True)
 
 
+def test_check_vals_return_mask(series_int, series_string):
+    mask = series_int.validate._check_vals(
+        [i for i in range(5, 10)], "superset", return_mask=True)["mask"]
+    assert mask.index.equals(series_int.index)
+    assert list(series_int.index[mask]) == [0, 1, 7, 8, 9]
+
+    # The NaNs left out by `na_action` are not faulty
+    ser = pd.Series(["a1", np.nan, "b", "a2", np.nan])
+    mask = ser.validate._check_vals(
+        r"^a", "regex", na_action="ignore", return_mask=True)["mask"]
+    assert mask.tolist() == [False, False, True, False, False]
+
+    assert series_string.validate._check_vals(
+        r"a*", "regex", return_mask=True) is True
+
+
 # DataFrameValidation related tests
 def test_is_shape(dataframe_creator):
     df_val = DataFrameValidation(dataframe_creator)
@@ -171,3 +191,148 @@ def test_has_schema(dataframe_with_different_types):
     }
     with pytest.raises(Exception):
         df_val.has_schema(schema_map_false, raises=True)
+
+
+def test_has_vals_validation_column():
+    df = pd.DataFrame({
+        "Amount": [1.5, -2.0, 300.0, np.nan],
+        "Type": ["Sale", "Payment", "Sale", "Fee"],
+    }, index=[10, 11, 11, 12])
+    df_val = DataFrameValidation(df)
+
+    is_valid = df_val.has_vals({
+        "Amount": {"values": (-100, 100), "mode": "range"},
+        "Type": {"values": ["Sale", "Payment"], "mode": "superset"},
+    }, logs=False)
+
+    assert is_valid.index.equals(df.index)
+    assert is_valid.tolist() == [True, True, False, False]
+
+
+def test_compile_validation_plan():
+    plan = compile_validation_plan({
+        "schema": {"Amount": "float", "Type": "int"},
+        "column_values": {
+            "Amount": {"values": r"^-?\d+[.]\d{1,2}$", "mode": "regex"},
+            "Type": {"values": ["Sale", "Payment"], "mode": "superset"},
+            "Notes": {"values": (0, 1), "mode": "range"},
+        },
+    })
+    df = pd.DataFrame({
+        "Amount": [1.5, -2.25, 3.125],
+        "Type": ["Sale", "Fee", "Payment"],
+    })
+
+    report = plan.validate(df, logs=False)
+    assert report.is_valid.tolist() == [True, False, False]
+    with pytest.raises(Exception):
+        plan.validate(df, raises=True)
+
+    # The values are checked once when the plan is compiled
+    with pytest.raises(ValueError):
+        compile_validation_plan({"schema": {"Amount": "decimal"}})
+    with pytest.raises(ValueError):
+        compile_validation_plan({
+            "column_values": {"Type": {"values": "Sale", "mode": "equal"}}})
+
+
+def test_validation_report():
+    df = pd.DataFrame({
+        "Amount": np.arange(100) + .5,
+        "Type": ["Sale", "Fee"] * 50,
+    }, index=np.arange(100) * 2)
+    df_val = DataFrameValidation(df)
+
+    report = df_val.validate({
+        "schema": {"Amount": "int", "Type": "object"},
+        "column_values": {
+            "Amount": {"values": (0, 10), "mode": "range"},
+            "Type": {"values": ["Sale", "Fee", "Refund"], "mode": "equal"},
+        },
+    }, logs=False, sample_size=3)
+
+    assert not report.passed
+    assert [(r.column, r.rule) for r in report.failed] == [
+        ("Amount", "dtype"), ("Amount", "range"), ("Type", "equal")]
+    amount_range = report.failed[1]
+    assert amount_range.n_faulty == 90
+    assert amount_range.faulty_sample == [20, 22, 24]
+    assert report.failed[2].extra_vals == ["Refund"]
+    assert report.n_invalid == 90
+    assert "first indexes: [20, 22, 24]" in amount_range.summary()
+
+    frame = report.to_frame()
+    assert frame["n_faulty"].tolist() == [0, 0, 90, 0]
+    assert (frame["elapsed"] >= 0).all()
+
+
+def test_has_vals_numeric():
+    ser = pd.Series([1.5, -2.25, 3.125, np.nan, np.inf, 0.1 + 0.2, 7.0])
+    assert ser.validate._check_vals(
+        {"decimals": 2}, "numeric").get("idxs") == [2, 3, 4, 5]
+    assert ser.validate._check_vals(
+        {"decimals": 2, "min": 0, "finite": False}, "numeric",
+        na_action="ignore").get("idxs") == [1, 2, 5]
+
+    # Same as the regex on the strings of the numbers
+    assert ser.validate._check_vals(
+        r"^-?\d+[.]\d{1,2}$", "regex").get("idxs") == [2, 3, 4, 5]
+
+    # Integer cents and numeric strings
+    assert pd.Series([150, 225]).validate._check_vals(
+        {"decimals": 0, "max": 200}, "numeric").get("idxs") == [1]
+    assert pd.Series(["1.50", "1.505", "abc"]).validate._check_vals(
+        {"decimals": 2}, "numeric").get("idxs") == [1, 2]
+
+    with pytest.raises(ValueError):
+        ser.validate._check_vals({"digits": 2}, "numeric")
+    with pytest.raises(Exception):
+        ser.validate.has_vals({"decimals": 2}, "numeric", raises=True)
+
+
+def test_streaming_n_std_validator():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "Amount": rng.standard_t(3, 3000) * 50,
+        "AccountName": rng.choice(["a", "b", "c"], 3000),
+    })
+    df.loc[[5, 50], "Amount"] = np.nan
+
+    # A single chunk is the same as the `n_std` mode
+    validator = StreamingNStdValidator(3, ["Amount"])
+    report = validator.validate(df, logs=False)
+    mask = df["Amount"].validate._check_vals(
+        3, "n_std", return_mask=True)["mask"]
+    assert report.is_valid.tolist() == (~mask).tolist()
+    assert report.n_invalid > 0
+
+    # The moments of the chunks are the moments of the whole data
+    validator = StreamingNStdValidator(3, ["Amount"], group_by="AccountName")
+    other = StreamingNStdValidator(3, ["Amount"], group_by="AccountName")
+    for i, chunk in enumerate(np.array_split(df, 5)):
+        (validator if i % 2 else other).update(chunk)
+    validator.merge(other)
+
+    expected = df.groupby("AccountName")["Amount"].agg(
+        ["count", "mean", "std"])
+    np.testing.assert_allclose(
+        validator.moments("Amount").sort_index().to_numpy(),
+        expected.to_numpy(),
+    )
+
+    report = validator.validate(df, update=False, logs=False)
+    grouped = df.groupby("AccountName")["Amount"]
+    is_outlier = (
+        (df["Amount"] - grouped.transform("mean")).abs()
+        > 3 * grouped.transform("std"))
+    assert report.is_valid.tolist() == (~is_outlier).tolist()
+
+
+def test_has_vals_message_is_capped():
+    ser = pd.Series(np.arange(100_000))
+    with pytest.raises(Exception) as err:
+        ser.validate.has_vals((0, 10), "range", raises=True, sample_size=3)
+
+    assert str(err.value) == (
+        "Some of the values of this series are not in the range specified"
+        " in `values`.\nFaulty rows: 99989, first indexes: [11, 12, 13]")
@@ -0,0 +1,116 @@
+import re
+import pickle
+
+import pytest
+import pandas as pd
+
+from mymoney.utils.data_validation import NumericCheck
+from mymoney.utils.meta_data import (
+    _compile_transfer_rules, get_meta_data_registry)
+
+
+def test_registry_is_loaded_once():
+    registry = get_meta_data_registry()
+    assert get_meta_data_registry() is registry
+    assert pickle.loads(pickle.dumps(registry)) is registry
+
+
+def test_registry_is_read_only():
+    chase_credit = get_meta_data_registry().service("chase", "credit")
+    with pytest.raises(TypeError):
+        chase_credit.read_args["header"] = 1
+    with pytest.raises(TypeError):
+        chase_credit.validation_data["schema"]["Amount"] = "int"
+
+    # `read_kwargs` returns a new copy each time
+    read_kwargs = chase_credit.read_kwargs()
+    read_kwargs["dtype"]["Amount"] = "object"
+    assert chase_credit.read_kwargs()["dtype"] == {"Amount": "float64"}
+
+
+def test_registry_compiles_regex():
+    column_values = get_meta_data_registry().service(
+        "capitalone", "credit").validation_data["column_values"]
+    assert isinstance(column_values["Card No."]["values"], re.Pattern)
+    column_values = get_meta_data_registry().service(
+        "chase", "credit").validation_data["column_values"]
+    assert column_values["Type"]["values"] == [
+        "Sale", "Payment", "Adjustment", "Return"]
+
+
+def test_registry_compiles_validation_plan():
+    plan = get_meta_data_registry().service(
+        "chase", "credit").validation_plan
+    rules = {rule.column: rule for rule in plan.value_rules}
+    assert rules["Amount"].compiled_values == NumericCheck(decimals=2)
+    assert rules["Type"].compiled_values == frozenset(
+        ["Sale", "Payment", "Adjustment", "Return"])
+    assert [col for col, _, _ in plan.schema] == [
+        "Transaction Date", "Post Date", "Amount"]
+
+    plan = get_meta_data_registry().service("citi", "credit").validation_plan
+    rules = {rule.column: rule for rule in plan.value_rules}
+    assert rules["Debit"].compiled_values == NumericCheck(decimals=2, min=0)
+    assert rules["Credit"].compiled_values == NumericCheck(decimals=2, max=0)
+
+
+def test_registry_column_index():
+    registry = get_meta_data_registry()
+    indexed = [
+        service_md
+        for services in registry.column_index.values()
+        for _, service_md in services
+    ]
+    assert sorted(indexed, key=lambda md: (md.institution, md.service)) == \
+        sorted(registry, key=lambda md: (md.institution, md.service))
+
+
+def test_service_read_kwargs_and_parse_dates():
+    chase_credit = get_meta_data_registry().service("chase", "credit")
+    read_kwargs = chase_credit.read_kwargs()
+    # The dates with a `date_format` are parsed after reading
+    assert read_kwargs["parse_dates"] == []
+    assert "date_format" not in read_kwargs
+    assert "timezone" not in read_kwargs
+    assert "dtype" not in chase_credit.read_kwargs(dtype=False)
+
+    df = chase_credit.parse_dates(pd.DataFrame({
+        "Transaction Date": ["01/05/2023", "01/07/2023"],
+        # Doesn't match the format, so it's inferred
+        "Post Date": ["2023-01-06", "2023-01-08"],
+    }))
+    expected = pd.Series(
+        pd.to_datetime(["2023-01-05", "2023-01-07"], utc=True),
+        name="Transaction Date")
+    pd.testing.assert_series_equal(df["Transaction Date"], expected)
+    assert str(df["Post Date"].dt.tz) == "UTC"
+
+    amex_credit = get_meta_data_registry().service("amex", "credit")
+    usecols = amex_credit.read_kwargs()["usecols"]
+    assert usecols("Amount") and not usecols("Address")
+
+
+def test_compile_transfer_rules():
+    rules = _compile_transfer_rules({
+        "rules": [
+            {"column": "Type", "map": {"A": "transfer", "B": "transfer"}},
+            {"column": "Desc", "regex": "PAY", "and": [
+                {"column": "Credit", "isna": True}], "label": "consider"},
+        ],
+        "default": "expense",
+    })
+
+    assert rules.default == "expense"
+    assert [rule.label for rule in rules.rules] == ["transfer", "consider"]
+    assert rules.rules[0].conditions[0].values == frozenset(["A", "B"])
+    assert rules.rules[1].conditions[0].regex == re.compile("PAY")
+    assert rules.rules[1].conditions[1].isna is True
+
+    with pytest.raises(ValueError):
+        _compile_transfer_rules({
+            "rules": [{"column": "Desc", "regex": "PAY", "isna": True,
+                       "label": "transfer"}],
+            "default": "expense",
+        })
+    assert get_meta_data_registry().service("chase", "debit").get(
+        "transfer_rules").default == "expense"